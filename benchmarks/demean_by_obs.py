@@ -0,0 +1,71 @@
+"""
+Benchmark the observation-parallel demeaning kernels.
+
+Compares the column-parallel and the observation-parallel kernels for a
+single column and a grid of numbers of observations and groups. The
+observation-parallel kernels are used by `_demean_array()` only above
+`_BY_OBS_MIN_OBS` observations and below `_BY_OBS_MAX_GROUPS_PER_OBS` groups
+per observation, which should be where they are faster. Run as
+
+    NUMBA_NUM_THREADS=8 python benchmarks/demean_by_obs.py
+"""
+
+import argparse
+import time
+
+import numba as nb
+import numpy as np
+
+from pyfixest.estimation.demean_ import _DEMEANERS, _DEMEANERS_BY_OBS
+
+
+def simulate(n_obs: int, n_groups: int, seed: int):
+    "Simulate one column and two fixed effects with `n_groups` and 100 groups."
+    rng = np.random.default_rng(seed)
+    flist = np.asfortranarray(
+        np.column_stack(
+            [rng.integers(0, n_groups, n_obs), rng.integers(0, 100, n_obs)]
+        ).astype(np.uint32)
+    )
+    x = rng.normal(size=(n_obs, 1))
+    return x, flist, np.ones(n_obs)
+
+
+def main():
+    "Run the benchmark."
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_obs", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument(
+        "--groups_per_obs", type=float, nargs="+", default=[0.001, 0.01, 0.1, 0.5]
+    )
+    parser.add_argument("--demeaner", default="map")
+    parser.add_argument("--seed", type=int, default=8)
+    args = parser.parse_args()
+
+    demean_func = _DEMEANERS[args.demeaner]
+    demean_func_by_obs = _DEMEANERS_BY_OBS[args.demeaner]
+
+    # compile both kernels
+    x, flist, weights = simulate(1_000, 10, args.seed)
+    demean_func(x, flist, weights)
+    demean_func_by_obs(x, flist, weights)
+
+    print(f"threads: {nb.get_num_threads()}")
+    print("n_obs       groups/obs  by column  by obs")
+    for n_obs in args.n_obs:
+        for groups_per_obs in args.groups_per_obs:
+            x, flist, weights = simulate(
+                n_obs, max(1, int(groups_per_obs * n_obs)), args.seed
+            )
+            timings = []
+            for func in [demean_func, demean_func_by_obs]:
+                tic = time.perf_counter()
+                func(x, flist, weights)
+                timings.append(time.perf_counter() - tic)
+            print(
+                f"{n_obs:<11_} {groups_per_obs:<11} {timings[0]:>9.2f}  {timings[1]:>6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark demeaning with observations sorted by fixed effect groups.
+
+Compares `_demean_array()` with and without `sort_by_group` for a
+high-dimensional "worker" fixed effect and a "firm" fixed effect. Run as
+
+    python benchmarks/demean_sort.py --n_obs 10000000 --n_workers 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from pyfixest.estimation.demean_ import _demean_array
+
+
+def simulate(n_obs: int, n_workers: int, n_firms: int, n_features: int, seed: int):
+    "Simulate a worker-firm panel where workers move between nearby firms."
+    rng = np.random.default_rng(seed)
+    worker = rng.integers(0, n_workers, n_obs)
+    firm = (worker // (n_workers // n_firms) + rng.integers(0, n_firms // 4, n_obs)) % (
+        n_firms
+    )
+    flist = np.asfortranarray(np.column_stack([worker, firm]).astype(np.uint32))
+    x = rng.normal(size=(n_obs, n_features))
+    return x, flist, np.ones(n_obs)
+
+
+def main():
+    "Run the benchmark."
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_obs", type=int, default=1_000_000)
+    parser.add_argument("--n_workers", type=int, default=100_000)
+    parser.add_argument("--n_firms", type=int, default=1_000)
+    parser.add_argument("--n_features", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=8)
+    args = parser.parse_args()
+
+    x, flist, weights = simulate(
+        args.n_obs, args.n_workers, args.n_firms, args.n_features, args.seed
+    )
+
+    # compile all code paths
+    for demeaner in ["map", "irons_tuck"]:
+        for sort_by_group in [False, True]:
+            _demean_array(
+                x[:1000],
+                np.asfortranarray(flist[:1000]),
+                weights[:1000],
+                demeaner=demeaner,
+                sort_by_group=sort_by_group,
+            )
+
+    print("demeaner    sort_by_group  seconds  sweeps")
+    for demeaner in ["map", "irons_tuck"]:
+        for sort_by_group in [False, True]:
+            tic = time.perf_counter()
+            _, n_iter = _demean_array(
+                x, flist, weights, demeaner=demeaner, sort_by_group=sort_by_group
+            )
+            toc = time.perf_counter()
+            print(
+                f"{demeaner:<11} {sort_by_group!s:<14} {toc - tic:>7.2f}  {n_iter.tolist()}"
+            )
+
+
+if __name__ == "__main__":
+    main()
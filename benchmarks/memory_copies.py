@@ -0,0 +1,73 @@
+"""
+Benchmark the peak memory of estimating several models on a wide data set.
+
+Fits multiple models with `csw0()` and a sample split on a data set with many
+columns that are not referenced by the models, and reports the peak memory
+allocated during estimation relative to the size of the input data. Run as
+
+    python benchmarks/memory_copies.py --n_obs 1000000 --n_extra 100
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import pyfixest as pf
+
+
+def simulate(n_obs: int, n_extra: int, seed: int) -> pd.DataFrame:
+    "Simulate a data set with `n_extra` columns that are not used by the models."
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame(
+        {
+            "Y": rng.normal(size=n_obs),
+            "X1": rng.normal(size=n_obs),
+            "X2": rng.normal(size=n_obs),
+            "f1": rng.integers(0, 1_000, n_obs),
+            "f2": rng.integers(0, 100, n_obs),
+            "f3": rng.integers(0, 10, n_obs),
+            "split": rng.integers(0, 2, n_obs),
+        }
+    )
+    extra = pd.DataFrame(
+        rng.normal(size=(n_obs, n_extra)), columns=[f"Z{i}" for i in range(n_extra)]
+    )
+    return pd.concat([data, extra], axis=1)
+
+
+def main():
+    "Run the benchmark."
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_obs", type=int, default=200_000)
+    parser.add_argument("--n_extra", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=8)
+    args = parser.parse_args()
+
+    data = simulate(args.n_obs, args.n_extra, args.seed)
+    data_mb = data.memory_usage(deep=True).sum() / 1e6
+    fml = "Y ~ X1 + X2 | csw0(f1, f2^f3)"
+
+    # compile all code paths
+    pf.feols(fml, data.iloc[:20_000], split="split")
+
+    print(f"input data: {data_mb:.0f} MB")
+    print("store_data  lean   models  peak MB  peak / data  seconds")
+    for store_data, lean in [(True, False), (False, False), (True, True)]:
+        tracemalloc.start()
+        tic = time.perf_counter()
+        fit = pf.feols(fml, data, split="split", store_data=store_data, lean=lean)
+        toc = time.perf_counter() - tic
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{store_data!s:10}  {lean!s:5}  {len(fit.all_fitted_models):6}  "
+            f"{peak / 1e6:7.0f}  {peak / 1e6 / data_mb:11.2f}  {toc:7.2f}"
+        )
+        del fit
+
+
+if __name__ == "__main__":
+    main()
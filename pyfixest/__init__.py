@@ -11,7 +11,9 @@ from pyfixest.did import did2s, event_study, lpdid, panelview
 # Import frequently used functions and classes
 from pyfixest.estimation import (
     bonferroni,
+    feglm,
     feols,
+    feols_stream,
     fepois,
     rwolf,
 )
@@ -24,7 +26,9 @@ from pyfixest.utils import (
 
 __all__ = [
     "feols",
+    "feols_stream",
     "fepois",
+    "feglm",
     "Stargazer",
     "etable",
     "dtable",
@@ -1,15 +1,30 @@
 import functools
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from importlib import import_module
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+from pyfixest.estimation.demean_cache_ import DemeanCache
+from pyfixest.estimation.feglm_ import Feglm
 from pyfixest.estimation.feiv_ import Feiv
 from pyfixest.estimation.feols_ import Feols, _check_vcov_input, _deparse_vcov_input
 from pyfixest.estimation.feols_compressed_ import FeolsCompressed
 from pyfixest.estimation.fepois_ import Fepois
-from pyfixest.estimation.FormulaParser import FixestFormulaParser
-from pyfixest.utils.dev_utils import DataFrameType, _polars_to_pandas
+from pyfixest.estimation.fixef_index_ import FixedEffectsIndex
+from pyfixest.estimation.FormulaParser import FixestFormula, FixestFormulaParser
+from pyfixest.estimation.model_matrix_fixest_ import _fixef_interactions
+from pyfixest.utils.dev_utils import (
+    DataInputType,
+    _get_column_names,
+    _get_model_columns,
+    _numba_threads_are_safe,
+    _to_pandas,
+)
 
 
 class FixestMulti:
@@ -17,7 +32,7 @@ class FixestMulti:
 
     def __init__(
         self,
-        data: DataFrameType,
+        data: DataInputType,
         copy_data: bool,
         store_data: bool,
         lean: bool,
@@ -29,14 +44,23 @@ class FixestMulti:
         split: Optional[str],
         fsplit: Optional[str],
         separation_check: Optional[list[str]] = None,
+        demeaner: str = "map",
+        fixef_sort: bool = False,
+        fixef_index: Optional[FixedEffectsIndex] = None,
+        dtype: str = "float64",
+        n_jobs: int = 1,
+        executor: str = "threads",
+        demean_cache: Optional[DemeanCache] = None,
     ) -> None:
         """
         Initialize a class for multiple fixed effect estimations.
 
         Parameters
         ----------
-        data : panda.DataFrame
-            The input DataFrame for the object.
+        data : DataInputType
+            The input DataFrame for the object. polars DataFrames and LazyFrames
+            and pyarrow Tables are converted to pandas in `_prepare_estimation()`,
+            restricted to the columns referenced by the models.
         copy_data : bool
             Whether to copy the data or not.
         store_data : bool
@@ -61,6 +85,30 @@ class FixestMulti:
         separation_check: list[str], optional
             Only used in "fepois". Methods to identify and drop separated observations.
             Either "fe" or "ir". Executes both by default.
+        demeaner: str
+            The demeaning algorithm. Either "map" (alternating projections) or
+            "irons_tuck" (accelerated alternating projections). Defaults to "map".
+        fixef_sort: bool
+            Whether to sort the observations by the groups of the fixed effect
+            with the most levels before demeaning. Defaults to False.
+        fixef_index: FixedEffectsIndex, optional
+            A precomputed index of the fixed effects of `data`, shared by all
+            models. Defaults to None.
+        dtype: str
+            The floating point type of the model matrices, either "float64"
+            (the default) or "float32". Only used by "feols".
+        n_jobs: int
+            The number of workers used to estimate independent groups of models
+            (different fixed effects or sample splits) in parallel. 1 (the
+            default) estimates all models serially, -1 uses all CPUs.
+        executor: str
+            The pool used if `n_jobs != 1`. Either "threads" (the default) or
+            "processes".
+        demean_cache: DemeanCache, optional
+            A cache of demeaned variables shared by all models, and possibly
+            across calls. Not used if the models are estimated in worker
+            processes. If None (the default), the models of each group of
+            "feols" models share a new, unbounded cache.
 
         Returns
         -------
@@ -75,6 +123,13 @@ class FixestMulti:
         self._reps = reps if use_compression else None
         self._seed = seed if use_compression else None
         self._separation_check = separation_check
+        self._demeaner = demeaner
+        self._fixef_sort = fixef_sort
+        self._fixef_index = fixef_index
+        self._dtype = dtype
+        self._n_jobs = n_jobs
+        self._executor = executor
+        self._demean_cache = demean_cache
 
         self._run_split = split is not None or fsplit is not None
         self._run_full = not (split and not fsplit)
@@ -88,15 +143,9 @@ class FixestMulti:
         else:
             self._splitvar = None
 
-        data = _polars_to_pandas(data)
-
-        if self._copy_data:
-            self._data = data.copy()
-        else:
-            self._data = data
-        # reindex: else, potential errors when pd.DataFrame.dropna()
-        # -> drops indices, but formulaic model_matrix starts from 0:N...
-        self._data.reset_index(drop=True, inplace=True)
+        # the data is copied or converted in _prepare_estimation(), once the
+        # columns used by the models are known
+        self._data_input = data
         self.all_fitted_models: dict[str, Union[Feols, Fepois, Feiv]] = {}
 
         # set functions inherited from other modules
@@ -133,7 +182,7 @@ class FixestMulti:
         Parameters
         ----------
         estimation : str
-            Type of estimation. Either "feols" or "fepois".
+            Type of estimation. Either "feols", "fepois" or "feglm".
         fml : str
             A three-sided formula string using fixest formula syntax.
             Supported syntax includes: see `feols()` or `fepois()`.
@@ -184,6 +233,66 @@ class FixestMulti:
         self._ssc_dict = ssc
         self._drop_singletons = _drop_singletons(fixef_rm)
 
+        self._data = self._prepare_data(self._data_input, fml, weights, vcov)
+
+    def _prepare_data(
+        self,
+        data: DataInputType,
+        fml: str,
+        weights: Optional[str],
+        vcov: Union[None, str, dict[str, str]],
+    ) -> pd.DataFrame:
+        """
+        Create the data frame that is shared by all models.
+
+        All models read from this frame, and none of them modifies or copies it.
+        If the models do not keep the data after estimation (`store_data=False`
+        or `lean=True`) or if the data is not a pandas DataFrame, the frame is
+        restricted to the columns referenced by the models before it is copied
+        or converted. Otherwise, all columns are kept, as post-estimation
+        methods such as `vcov()` or `wildboottest()` may use any of them.
+
+        Parameters
+        ----------
+        data : DataInputType
+            The input data.
+        fml : str
+            The model formula.
+        weights : Optional[str]
+            The name of the weights column.
+        vcov : Union[None, str, dict[str, str]]
+            The vcov argument.
+
+        Returns
+        -------
+        pd.DataFrame
+            The data with a default index 0, ..., N - 1.
+        """
+        if isinstance(data, pd.DataFrame) and self._store_data and not self._lean:
+            _data = data.copy() if self._copy_data else data
+        else:
+            columns = _get_model_columns(
+                _get_column_names(data),
+                fml=fml,
+                weights=weights,
+                vcov=vcov,
+                splitvar=self._splitvar,
+            )
+            # new frame, owned by pyfixest
+            _data = _to_pandas(data, columns)
+        # reindex: else, potential errors when pd.DataFrame.dropna()
+        # -> drops indices, but formulaic model_matrix starts from 0:N...
+        _data.reset_index(drop=True, inplace=True)
+
+        # interacted fixed effects are added once, and not by every model
+        interactions = {
+            x for fval in self.FixestFormulaDict for x in fval.split("+") if "^" in x
+        }
+        if interactions:
+            _, _data = _fixef_interactions("+".join(sorted(interactions)), _data)
+
+        return _data
+
     def _estimate_all_models(
         self,
         vcov: Union[str, dict[str, str], None],
@@ -192,6 +301,7 @@ class FixestMulti:
         iwls_maxiter: int = 25,
         iwls_tol: float = 1e-08,
         separation_check: Optional[list[str]] = None,
+        family: Optional[str] = None,
     ) -> None:
         """
         Estimate multiple regression models.
@@ -215,8 +325,10 @@ class FixestMulti:
             The tolerance level for the IWLS algorithm. Default is 1e-8.
             Only relevant for non-linear estimation strategies.
         separation_check: list[str], optional
-            Only used in "fepois". Methods to identify and drop separated observations.
-            Either "fe" or "ir". Executes both by default.
+            Only used in "fepois" and "feglm". Methods to identify and drop
+            separated observations. Either "fe" or "ir". Executes both by default.
+        family: str, optional
+            Only used in "feglm". The family of the generalized linear model.
 
         Returns
         -------
@@ -225,166 +337,140 @@ class FixestMulti:
         _is_iv = self._is_iv
         _data = self._data
         _method = self._method
-        _drop_singletons = self._drop_singletons
-        _ssc_dict = self._ssc_dict
-        _drop_intercept = self._drop_intercept
-        _weights = self._weights
-        _fixef_tol = self._fixef_tol
-        _weights_type = self._weights_type
-        _lean = self._lean
-        _store_data = self._store_data
-        _copy_data = self._copy_data
         _run_split = self._run_split
         _run_full = self._run_full
         _splitvar = self._splitvar
+        _fixef_index = self._fixef_index
+        _n_jobs = self._n_jobs
 
         FixestFormulaDict = self.FixestFormulaDict
         _fixef_keys = list(FixestFormulaDict.keys())
 
+        model_kwargs: dict[str, Any] = {
+            "ssc_dict": self._ssc_dict,
+            "drop_singletons": self._drop_singletons,
+            "drop_intercept": self._drop_intercept,
+            "weights": self._weights,
+            "weights_type": self._weights_type,
+            "solver": solver,
+            "collin_tol": collin_tol,
+            "fixef_tol": self._fixef_tol,
+            "store_data": self._store_data,
+            "copy_data": self._copy_data,
+            "lean": self._lean,
+            "sample_split_var": _splitvar,
+            "demean_cache": self._demean_cache,
+        }
+        if _method == "compression":
+            model_kwargs.update({"reps": self._reps, "seed": self._seed})
+        else:
+            model_kwargs.update(
+                {"demeaner": self._demeaner, "fixef_sort": self._fixef_sort}
+            )
+        if _method == "feols":
+            model_kwargs["dtype"] = self._dtype
+        if _method in ["fepois", "feglm"]:
+            model_kwargs.update(
+                {
+                    "tol": iwls_tol,
+                    "maxiter": iwls_maxiter,
+                    "separation_check": separation_check,
+                }
+            )
+        if _method == "feglm":
+            model_kwargs["family"] = family
+
         all_splits = (["all"] if _run_full else []) + (
             _data[_splitvar].dropna().unique().tolist() if _run_split else []
         )
 
+        # models with the same fixed effects on the same sample form a group
+        # that shares the cache of demeaned variables; groups are independent
+        tasks = []
         for sample_split_value in all_splits:
-            for _, fval in enumerate(_fixef_keys):
-                fixef_key_models = FixestFormulaDict.get(fval)
-
-                # dictionary to cache demeaned data with index: na_index_str,
-                # only relevant for `.feols()`
-                lookup_demeaned_data: dict[str, pd.DataFrame] = {}
-
-                for FixestFormula in fixef_key_models:  # type: ignore
-                    # loop over both dictfe and dictfe_iv (if the latter is not None)
-                    # get Y, X, Z, fe, NA indices for model
-
-                    FIT: Union[Feols, Feiv, Fepois]
-
-                    if _method == "feols" and not _is_iv:
-                        FIT = Feols(
-                            FixestFormula=FixestFormula,
-                            data=_data,
-                            ssc_dict=_ssc_dict,
-                            drop_singletons=_drop_singletons,
-                            drop_intercept=_drop_intercept,
-                            weights=_weights,
-                            weights_type=_weights_type,
-                            solver=solver,
-                            collin_tol=collin_tol,
-                            fixef_tol=_fixef_tol,
-                            lookup_demeaned_data=lookup_demeaned_data,
-                            store_data=_store_data,
-                            copy_data=_copy_data,
-                            lean=_lean,
-                            sample_split_value=sample_split_value,
-                            sample_split_var=_splitvar,
-                        )
-                        FIT.prepare_model_matrix()
-                        FIT.demean()
-                        FIT.to_array()
-                        FIT.drop_multicol_vars()
-                        FIT.wls_transform()
-                    elif _method == "feols" and _is_iv:
-                        FIT = Feiv(
-                            FixestFormula=FixestFormula,
-                            data=_data,
-                            ssc_dict=_ssc_dict,
-                            drop_singletons=_drop_singletons,
-                            drop_intercept=_drop_intercept,
-                            weights=_weights,
-                            weights_type=_weights_type,
-                            solver=solver,
-                            collin_tol=collin_tol,
-                            fixef_tol=_fixef_tol,
-                            lookup_demeaned_data=lookup_demeaned_data,
-                            store_data=_store_data,
-                            copy_data=_copy_data,
-                            lean=_lean,
-                            sample_split_value=sample_split_value,
-                            sample_split_var=_splitvar,
-                        )
-                        FIT.prepare_model_matrix()
-                        FIT.demean()
-                        FIT.to_array()
-                        FIT.drop_multicol_vars()
-                        FIT.wls_transform()
-                    elif _method == "fepois":
-                        FIT = Fepois(
-                            FixestFormula=FixestFormula,
-                            data=_data,
-                            ssc_dict=_ssc_dict,
-                            drop_singletons=_drop_singletons,
-                            drop_intercept=_drop_intercept,
-                            weights=_weights,
-                            weights_type=_weights_type,
-                            solver=solver,
-                            collin_tol=collin_tol,
-                            fixef_tol=_fixef_tol,
-                            lookup_demeaned_data=lookup_demeaned_data,
-                            tol=iwls_tol,
-                            maxiter=iwls_maxiter,
-                            store_data=_store_data,
-                            copy_data=_copy_data,
-                            lean=_lean,
-                            sample_split_value=sample_split_value,
-                            sample_split_var=_splitvar,
-                            separation_check=separation_check,
-                            # solver=_solver
-                        )
-                        FIT.prepare_model_matrix()
-                        FIT.to_array()
-                        FIT.drop_multicol_vars()
-
-                    elif _method == "compression":
-                        FIT = FeolsCompressed(
-                            FixestFormula=FixestFormula,
-                            data=_data,
-                            ssc_dict=_ssc_dict,
-                            drop_singletons=_drop_singletons,
-                            drop_intercept=_drop_intercept,
-                            weights=_weights,
-                            weights_type=_weights_type,
-                            solver=solver,
-                            collin_tol=collin_tol,
-                            fixef_tol=_fixef_tol,
-                            lookup_demeaned_data=lookup_demeaned_data,
-                            store_data=_store_data,
-                            copy_data=_copy_data,
-                            lean=_lean,
-                            reps=self._reps,
-                            seed=self._seed,
-                            sample_split_value=sample_split_value,
-                            sample_split_var=_splitvar,
-                        )
-                        FIT.prepare_model_matrix()
-                        FIT.to_array()
-                        FIT.drop_multicol_vars()
-                        FIT.wls_transform()
-
-                    FIT.get_fit()
-                    # if X is empty: no inference (empty X only as shorthand for demeaning)  # noqa: W505
-                    if not FIT._X_is_empty:
-                        # inference
-                        vcov_type = _get_vcov_type(vcov, fval)
-                        FIT.vcov(vcov=vcov_type, data=FIT._data)
-
-                        FIT.get_inference()
-                        # other regression stats
-                        if _method == "feols" and not FIT._is_iv:
-                            FIT.get_performance()
-                        if isinstance(FIT, Feiv):
-                            FIT.first_stage()
-
-                    # delete large attributescl
-                    FIT._clear_attributes()
-                    FIT._sample_split_value = sample_split_value
-
-                    # store fitted model
-                    if sample_split_value != "all":
-                        FIT._model_name = f"{FixestFormula.fml} (sample: {FIT._sample_split_var} = {FIT._sample_split_value})"
-                    else:
-                        FIT._model_name = FixestFormula.fml
-
-                    self.all_fitted_models[FIT._model_name] = FIT
+            # restrict the data and the fixed effects index to the sample once
+            # per split, all models on the split share them
+            split_data = _data
+            split_fixef_index = _fixef_index
+            if sample_split_value != "all":
+                in_split = np.flatnonzero(_data[_splitvar] == sample_split_value)
+                split_data = _data.iloc[in_split].reset_index(drop=True)
+                if _fixef_index is not None:
+                    split_fixef_index = _fixef_index.take(in_split)
+            if _method != "compression":
+                model_kwargs_split = {**model_kwargs, "fixef_index": split_fixef_index}
+            else:
+                model_kwargs_split = model_kwargs
+
+            for fval in _fixef_keys:
+                tasks.append(
+                    {
+                        "method": _method,
+                        "is_iv": _is_iv,
+                        "FixestFormulas": FixestFormulaDict.get(fval),
+                        "fval": fval,
+                        "data": split_data,
+                        "sample_split_value": sample_split_value,
+                        "vcov": vcov,
+                        "model_kwargs": model_kwargs_split,
+                    }
+                )
+
+        if (
+            _n_jobs != 1
+            and len(tasks) > 1
+            and self._executor == "threads"
+            and not _numba_threads_are_safe()
+        ):
+            warnings.warn(
+                "numba uses its workqueue threading layer, which does not support "
+                "concurrent calls from several threads. The models are estimated "
+                "serially. Install TBB (e.g. `pip install tbb`) or use "
+                "`executor='processes'` to estimate them in parallel."
+            )
+            _n_jobs = 1
+
+        if _n_jobs == 1 or len(tasks) == 1:
+            results = [_estimate_model_group(**task) for task in tasks]
+        else:
+            max_workers = (os.cpu_count() or 1) if _n_jobs == -1 else _n_jobs
+            max_workers = min(max_workers, len(tasks))
+            executor: Union[ThreadPoolExecutor, ProcessPoolExecutor]
+            if self._executor == "threads":
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+            else:
+                # the worker processes would only fill copies of the cache
+                if self._demean_cache is not None:
+                    warnings.warn(
+                        "A `demean_cache` cannot be shared with worker processes "
+                        "and is not used. Use `executor='threads'` to fill the "
+                        "cache in parallel."
+                    )
+                    tasks = [
+                        {
+                            **task,
+                            "model_kwargs": {
+                                **task["model_kwargs"],
+                                "demean_cache": None,
+                            },
+                        }
+                        for task in tasks
+                    ]
+                # forking is unsafe once numba's threading layer is running
+                executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            with executor:
+                futures = [
+                    executor.submit(_estimate_model_group, **task) for task in tasks
+                ]
+                # collect in submission order: deterministic model order
+                results = [future.result() for future in futures]
+
+        for fits in results:
+            for FIT in fits:
+                self.all_fitted_models[FIT._model_name] = FIT
 
     def to_list(self):
         """
@@ -431,13 +517,38 @@ class FixestMulti:
                 fxst._vcov_type_detail,
                 _,
                 _,
-            ) = _deparse_vcov_input(vcov, False, False)
+            ) = _deparse_vcov_input(vcov, False)
 
             fxst.vcov(vcov=vcov)
             fxst.get_inference()
 
         return self
 
+    def vcov_many(
+        self, vcovs: list[Union[str, dict[str, str]]]
+    ) -> dict[str, dict[str, np.ndarray]]:
+        """
+        Compute several covariance matrices for all estimated models.
+
+        See `Feols.vcov_many()`. The inference of the models is not changed.
+
+        Parameters
+        ----------
+        vcovs : list[Union[str, dict[str, str]]]
+            A list of covariance types, each in the format of the `vcov`
+            argument of `vcov()`.
+
+        Returns
+        -------
+        dict[str, dict[str, np.ndarray]]
+            For each model, the covariance matrices keyed by a label of the
+            covariance type.
+        """
+        return {
+            model: fxst.vcov_many(vcovs)
+            for model, fxst in self.all_fitted_models.items()
+        }
+
     def tidy(self) -> pd.DataFrame:
         """
         Return the results of an estimation using `feols()` as a tidy Pandas DataFrame.
@@ -644,6 +755,112 @@ class FixestMulti:
         return model
 
 
+def _estimate_model_group(
+    method: str,
+    is_iv: bool,
+    FixestFormulas: list[FixestFormula],
+    fval: str,
+    data: pd.DataFrame,
+    sample_split_value: Union[str, int, float],
+    vcov: Union[str, dict[str, str], None],
+    model_kwargs: dict[str, Any],
+) -> list[Union[Feols, Feiv, Fepois]]:
+    """
+    Estimate a group of models that share fixed effects and the sample split.
+
+    The models of a group share a cache of demeaned variables. Different groups
+    are independent of each other and can be estimated in parallel.
+
+    Parameters
+    ----------
+    method : str
+        The estimation method. Either "feols", "fepois", "feglm" or "compression".
+    is_iv : bool
+        Whether the models are IV models.
+    FixestFormulas : list[FixestFormula]
+        The formulas of the models.
+    fval : str
+        The fixed effects of the models, "0" if there are none.
+    data : pd.DataFrame
+        The full data set.
+    sample_split_value : Union[str, int, float]
+        The value of the sample split variable, "all" for the full sample.
+    vcov : Union[str, dict[str, str], None]
+        The type of the variance-covariance matrix.
+    model_kwargs : dict[str, Any]
+        Further arguments passed to the model class.
+
+    Returns
+    -------
+    list[Union[Feols, Feiv, Fepois]]
+        The fitted models, in the order of `FixestFormulas`.
+    """
+    # cache of demeaned variables shared by the models of the group if the user
+    # did not pass a cache; only relevant for `.feols()`: fepois() demeans with
+    # different weights in every iteration, which would fill an unbounded cache
+    if (
+        model_kwargs.get("demean_cache") is None
+        and method == "feols"
+        and len(FixestFormulas) > 1
+    ):
+        model_kwargs = {**model_kwargs, "demean_cache": DemeanCache(max_bytes=None)}
+
+    fits = []
+    for fixest_formula in FixestFormulas:
+        FIT: Union[Feols, Feiv, Fepois]
+        model_class: type[Feols]
+        if method == "feols":
+            model_class = Feiv if is_iv else Feols
+        elif method == "fepois":
+            model_class = Fepois
+        elif method == "feglm":
+            model_class = Feglm
+        else:
+            model_class = FeolsCompressed
+
+        FIT = model_class(
+            FixestFormula=fixest_formula,
+            data=data,
+            sample_split_value=sample_split_value,
+            **model_kwargs,
+        )
+        # get Y, X, Z, fe, NA indices for model
+        FIT.prepare_model_matrix()
+        if method == "feols":
+            FIT.demean()
+        FIT.to_array()
+        FIT.drop_multicol_vars()
+        if method not in ["fepois", "feglm"]:
+            FIT.wls_transform()
+
+        FIT.get_fit()
+        # if X is empty: no inference (empty X only as shorthand for demeaning)
+        if not FIT._X_is_empty:
+            # inference
+            vcov_type = _get_vcov_type(vcov, fval)
+            FIT.vcov(vcov=vcov_type, data=FIT._data)
+
+            FIT.get_inference()
+            # other regression stats
+            if method == "feols" and not FIT._is_iv:
+                FIT.get_performance()
+            if isinstance(FIT, Feiv):
+                FIT.first_stage()
+
+        # delete large attributes
+        FIT._clear_attributes()
+        FIT._sample_split_value = sample_split_value
+
+        if sample_split_value != "all":
+            FIT._model_name = f"{fixest_formula.fml} (sample: {FIT._sample_split_var} = {FIT._sample_split_value})"
+        else:
+            FIT._model_name = fixest_formula.fml
+
+        fits.append(FIT)
+
+    return fits
+
+
 def _get_vcov_type(
     vcov: Union[str, dict[str, str], None], fval: str
 ) -> Union[str, dict[str, str]]:
@@ -1,22 +1,36 @@
 from pyfixest.estimation.demean_ import (
     demean,
 )
+from pyfixest.estimation.demean_cache_ import (
+    DemeanCache,
+)
 from pyfixest.estimation.detect_singletons_ import (
     detect_singletons,
 )
 from pyfixest.estimation.estimation import (
+    feglm,
     feols,
+    feols_stream,
     fepois,
 )
+from pyfixest.estimation.feglm_ import (
+    Feglm,
+)
 from pyfixest.estimation.feiv_ import (
     Feiv,
 )
 from pyfixest.estimation.feols_ import (
     Feols,
 )
+from pyfixest.estimation.feols_stream_ import (
+    FeolsStream,
+)
 from pyfixest.estimation.fepois_ import (
     Fepois,
 )
+from pyfixest.estimation.fixef_index_ import (
+    FixedEffectsIndex,
+)
 from pyfixest.estimation.FixestMulti_ import (
     FixestMulti,
 )
@@ -30,14 +44,20 @@ from pyfixest.estimation.multcomp import (
 
 __all__ = [
     "feols",
+    "feols_stream",
     "fepois",
+    "feglm",
     "bonferroni",
     "rwolf",
     "demean",
     "detect_singletons",
     "model_matrix_fixest",
     "Feols",
+    "FeolsStream",
     "Fepois",
+    "Feglm",
     "Feiv",
     "FixestMulti",
+    "FixedEffectsIndex",
+    "DemeanCache",
 ]
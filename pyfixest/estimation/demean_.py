@@ -1,26 +1,40 @@
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Optional
 
 import numba as nb
 import numpy as np
 import pandas as pd
 
+from pyfixest.estimation.vcov_utils import bucket_argsort
+
+if TYPE_CHECKING:
+    from pyfixest.estimation.demean_cache_ import DemeanCache
+
+# the observation-parallel kernels reduce thread-local group sums of shape
+# (n_chunks, n_groups) in every sweep, which only pays off for many
+# observations per group, see `benchmarks/demean_by_obs.py`
+_BY_OBS_MIN_OBS = 1_000_000
+_BY_OBS_MAX_GROUPS_PER_OBS = 0.01
+_BY_OBS_MIN_CHUNK_SIZE = 1_000
+
 
 def demean_model(
     Y: pd.DataFrame,
     X: pd.DataFrame,
     fe: Optional[pd.DataFrame],
     weights: Optional[np.ndarray],
-    lookup_demeaned_data: dict[str, Any],
-    na_index_str: str,
+    demean_cache: Optional["DemeanCache"],
     fixef_tol: float,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+    demeaner: str = "map",
+    group_weights: Optional[np.ndarray] = None,
+    fixef_sort: bool = False,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.Series]:
     """
     Demean a regression model.
 
     Demeans a single regression model via the alternating projections algorithm
     (see `demean` function). Prior to demeaning, the function checks if some of
     the variables have already been demeaned and uses values from the cache
-    `lookup_demeaned_data` if possible. If the model has no fixed effects, the
+    `demean_cache` if possible. If the model has no fixed effects, the
     function does not demean the data.
 
     Parameters
@@ -33,112 +47,74 @@ def demean_model(
         A DataFrame of the fixed effects. None if no fixed effects specified.
     weights : numpy.ndarray or None
         A numpy array of weights. None if no weights.
-    lookup_demeaned_data : dict[str, Any]
-        A dictionary with keys for each fixed effects combination and potentially
-        values of demeaned data frames. The function checks this dictionary to
-        see if some of the variables have already been demeaned.
-    na_index_str : str
-        A string with indices of dropped columns. Used for caching of demeaned
-        variables.
+    demean_cache : DemeanCache or None
+        A cache of demeaned variables. Variables that are found in the cache
+        are not demeaned again, and newly demeaned variables are added to it.
+        No caching if None.
     fixef_tol: float
         The tolerance for the demeaning algorithm.
+    demeaner: str
+        The demeaning algorithm. Either "map" (alternating projections) or
+        "irons_tuck" (accelerated alternating projections). Defaults to "map".
+    group_weights: np.ndarray, optional
+        Precomputed sums of weights by group, e.g. from a `FixedEffectsIndex`.
+        Computed from `weights` and `fe` if None (the default).
+    fixef_sort: bool
+        Whether to sort the observations by the groups of the fixed effect with
+        the most levels before demeaning (see `_demean_array()`). Defaults to
+        False.
 
     Returns
     -------
-    tuple[pd.DataFrame, pd.DataFrame, Optional[pd.DataFrame]]
+    tuple[pd.DataFrame, pd.DataFrame, pd.Series]
         A tuple of the following elements:
         - Yd : pd.DataFrame
             A DataFrame of the demeaned dependent variable.
         - Xd : pd.DataFrame
             A DataFrame of the demeaned covariates.
-        - Id : pd.DataFrame or None
-            A DataFrame of the demeaned Instruments. None if no IV.
+        - n_iter : pd.Series
+            The number of sweeps over all fixed effects the demeaning algorithm
+            needed to converge, for each column of Y and X. Zero if the model
+            has no fixed effects.
     """
     YX = pd.concat([Y, X], axis=1)
 
     yx_names = YX.columns
     YX_array = YX.to_numpy()
 
-    if YX_array.dtype != np.dtype("float64"):
+    # single precision input is kept, see _demean_array()
+    if YX_array.dtype not in [np.dtype("float32"), np.dtype("float64")]:
         YX_array = YX_array.astype(np.float64)
 
-    if weights is not None and weights.ndim > 1:
+    if weights is None:
+        weights = np.ones(YX_array.shape[0])
+    elif weights.ndim > 1:
         weights = weights.flatten()
 
     if fe is not None:
-        fe_array = fe.to_numpy()
-        # check if looked dict has data for na_index
-        if lookup_demeaned_data.get(na_index_str) is not None:
-            # get data out of lookup table: list of [algo, data]
-            value = lookup_demeaned_data.get(na_index_str)
-            if value is not None:
-                try:
-                    _, YX_demeaned_old = value
-                except ValueError:
-                    print("Error: Expected the value to be iterable with two elements.")
-            else:
-                pass
-
-            # get not yet demeaned covariates
-            var_diff_names = list(set(yx_names) - set(YX_demeaned_old.columns))
-
-            # if some variables still need to be demeaned
-            if var_diff_names:
-                # var_diff_names = var_diff_names
-
-                yx_names_list = list(yx_names)
-                var_diff_index = [yx_names_list.index(item) for item in var_diff_names]
-                # var_diff_index = list(yx_names).index(var_diff_names)
-                var_diff = YX_array[:, var_diff_index]
-                if var_diff.ndim == 1:
-                    var_diff = var_diff.reshape(len(var_diff), 1)
-
-                YX_demean_new, success = demean(
-                    x=var_diff, flist=fe_array, weights=weights, tol=fixef_tol
-                )
-                if success is False:
-                    raise ValueError("Demeaning failed after 100_000 iterations.")
-
-                YX_demeaned = pd.DataFrame(YX_demean_new)
-                YX_demeaned = np.concatenate([YX_demeaned_old, YX_demean_new], axis=1)
-                YX_demeaned = pd.DataFrame(YX_demeaned)
-
-                # check if var_diff_names is a list
-                if isinstance(var_diff_names, str):
-                    var_diff_names = [var_diff_names]
-
-                YX_demeaned.columns = pd.Index(
-                    list(YX_demeaned_old.columns) + var_diff_names
-                )
-
-            else:
-                # all variables already demeaned
-                YX_demeaned = YX_demeaned_old[yx_names]
-
-        else:
-            YX_demeaned, success = demean(
-                x=YX_array, flist=fe_array, weights=weights, tol=fixef_tol
-            )
-            if success is False:
-                raise ValueError("Demeaning failed after 100_000 iterations.")
-
-            YX_demeaned = pd.DataFrame(YX_demeaned)
-            YX_demeaned.columns = yx_names
-
-        lookup_demeaned_data[na_index_str] = [None, YX_demeaned]
-
+        demean_func = demean_cache.demean if demean_cache is not None else _demean_array
+        YX_demeaned_array, n_iter_arr = demean_func(
+            x=YX_array,
+            flist=fe.to_numpy(),
+            weights=weights,
+            tol=fixef_tol,
+            demeaner=demeaner,
+            group_weights=group_weights,
+            sort_by_group=fixef_sort,
+        )
+        n_iter = pd.Series(n_iter_arr, index=yx_names)
     else:
         # nothing to demean here
-        pass
+        YX_demeaned_array = YX_array
+        n_iter = pd.Series(0, index=yx_names)
 
-        YX_demeaned = pd.DataFrame(YX_array)
-        YX_demeaned.columns = yx_names
+    YX_demeaned = pd.DataFrame(YX_demeaned_array, columns=yx_names)
 
     # get demeaned Y, X (if no fixef, equal to Y, X, I)
     Yd = YX_demeaned[Y.columns]
     Xd = YX_demeaned[X.columns]
 
-    return Yd, Xd
+    return Yd, Xd, n_iter
 
 
 @nb.njit
@@ -168,6 +144,29 @@ def _subtract_weighted_group_mean(
         x[i] -= _group_weighted_sums[id] / group_weights[id]
 
 
+@nb.njit
+def _subtract_weighted_segment_mean(
+    x: np.ndarray,
+    sample_weights: np.ndarray,
+    offsets: np.ndarray,
+    group_weights: np.ndarray,
+) -> None:
+    "Subtract weighted group means for observations sorted by group."
+    for g in range(offsets.size - 1):
+        start = offsets[g]
+        end = offsets[g + 1]
+        if start == end:
+            continue
+
+        weighted_sum = 0.0
+        for i in range(start, end):
+            weighted_sum += sample_weights[i] * x[i]
+
+        mean = weighted_sum / group_weights[g]
+        for i in range(start, end):
+            x[i] -= mean
+
+
 @nb.njit
 def _calc_group_weights(
     sample_weights: np.ndarray, group_ids: np.ndarray, n_groups: np.ndarray
@@ -184,7 +183,490 @@ def _calc_group_weights(
     return group_weights
 
 
+@nb.njit
+def _apply_sweep(
+    x: np.ndarray,
+    sample_weights: np.ndarray,
+    flist: np.ndarray,
+    group_weights: np.ndarray,
+    _group_weighted_sums: np.ndarray,
+    offsets: Optional[np.ndarray] = None,
+) -> None:
+    """
+    One sweep of alternating projections over all fixed effects, in place.
+
+    If `offsets` is provided, the observations are sorted by the groups of the
+    first fixed effect and `offsets` holds the group boundaries. The first
+    fixed effect is then swept out via contiguous segment reductions.
+    """
+    start = 0
+    if offsets is not None:
+        _subtract_weighted_segment_mean(x, sample_weights, offsets, group_weights[:, 0])
+        start = 1
+
+    for j in range(start, flist.shape[1]):
+        _subtract_weighted_group_mean(
+            x,
+            sample_weights,
+            flist[:, j],
+            group_weights[:, j],
+            _group_weighted_sums,
+        )
+
+
+@nb.njit(parallel=True, nogil=True)
+def _demean_map(
+    x: np.ndarray,
+    flist: np.ndarray,
+    weights: np.ndarray,
+    tol: float = 1e-08,
+    maxiter: int = 100_000,
+    group_weights: Optional[np.ndarray] = None,
+    offsets: Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Demean an array via the method of alternating projections (MAP).
+
+    Returns the demeaned array, the number of sweeps over all fixed effects
+    needed for convergence per column and a convergence flag. Precomputed
+    `group_weights` (see `_calc_group_weights()`) are used if provided. See
+    `_apply_sweep()` for `offsets`.
+    """
+    n_samples, n_features = x.shape
+
+    if x.flags.f_contiguous:
+        res = np.empty((n_features, n_samples), dtype=x.dtype).T
+    else:
+        res = np.empty((n_samples, n_features), dtype=x.dtype)
+
+    n_threads = nb.get_num_threads()
+
+    if group_weights is None:
+        _group_weights = _calc_group_weights(weights, flist, flist.max() + 1)
+    else:
+        _group_weights = group_weights
+    n_groups = _group_weights.shape[0]
+    _group_weighted_sums = np.empty((n_threads, n_groups), dtype=np.float64)
+
+    x_curr = np.empty((n_threads, n_samples), dtype=np.float64)
+    x_prev = np.empty((n_threads, n_samples), dtype=np.float64)
+
+    n_iter = np.zeros(n_features, dtype=np.int64)
+
+    not_converged = 0
+    for k in nb.prange(n_features):
+        tid = nb.get_thread_id()
+
+        xk_curr = x_curr[tid, :]
+        xk_prev = x_prev[tid, :]
+        for i in range(n_samples):
+            xk_curr[i] = x[i, k]
+            xk_prev[i] = x[i, k] - 1.0
+
+        for it in range(maxiter):
+            _apply_sweep(
+                xk_curr,
+                weights,
+                flist,
+                _group_weights,
+                _group_weighted_sums[tid, :],
+                offsets,
+            )
+            if _sad_converged(xk_curr, xk_prev, tol):
+                n_iter[k] = it + 1
+                break
+
+            xk_prev[:] = xk_curr[:]
+        else:
+            n_iter[k] = maxiter
+            not_converged += 1
+
+        res[:, k] = xk_curr[:]
+
+    success = not not_converged
+    return (res, n_iter, success)
+
+
+@nb.njit(parallel=True, nogil=True)
+def _demean_irons_tuck(
+    x: np.ndarray,
+    flist: np.ndarray,
+    weights: np.ndarray,
+    tol: float = 1e-08,
+    maxiter: int = 100_000,
+    group_weights: Optional[np.ndarray] = None,
+    offsets: Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Demean an array via alternating projections with Irons-Tuck acceleration.
+
+    Every iteration applies two sweeps of alternating projections, `GX = F(X)`
+    and `GGX = F(GX)`, and then extrapolates
+
+        X <- GGX - <dGX, d2X> / <d2X, d2X> * dGX,
+
+    with `dGX = GGX - GX` and `d2X = GGX - 2 * GX + X`. The extrapolated
+    iterate is an affine combination of `GX` and `GGX` and hence stays in
+    `x - span(D)`, so the algorithm converges to the same projection as
+    `_demean_map()`. This is the acceleration employed by `fixest`.
+
+    Returns the demeaned array, the number of sweeps over all fixed effects
+    needed for convergence per column and a convergence flag. Precomputed
+    `group_weights` (see `_calc_group_weights()`) are used if provided. See
+    `_apply_sweep()` for `offsets`.
+    """
+    n_samples, n_features = x.shape
+
+    if x.flags.f_contiguous:
+        res = np.empty((n_features, n_samples), dtype=x.dtype).T
+    else:
+        res = np.empty((n_samples, n_features), dtype=x.dtype)
+
+    n_threads = nb.get_num_threads()
+
+    if group_weights is None:
+        _group_weights = _calc_group_weights(weights, flist, flist.max() + 1)
+    else:
+        _group_weights = group_weights
+    n_groups = _group_weights.shape[0]
+    _group_weighted_sums = np.empty((n_threads, n_groups), dtype=np.float64)
+
+    x_curr = np.empty((n_threads, n_samples), dtype=np.float64)
+    gx = np.empty((n_threads, n_samples), dtype=np.float64)
+    ggx = np.empty((n_threads, n_samples), dtype=np.float64)
+
+    n_iter = np.zeros(n_features, dtype=np.int64)
+
+    not_converged = 0
+    for k in nb.prange(n_features):
+        tid = nb.get_thread_id()
+
+        xk = x_curr[tid, :]
+        gxk = gx[tid, :]
+        ggxk = ggx[tid, :]
+        sums = _group_weighted_sums[tid, :]
+        for i in range(n_samples):
+            xk[i] = x[i, k]
+
+        converged = False
+        n_sweeps = 0
+        while n_sweeps < maxiter:
+            gxk[:] = xk[:]
+            _apply_sweep(gxk, weights, flist, _group_weights, sums, offsets)
+            n_sweeps += 1
+            if _sad_converged(gxk, xk, tol):
+                xk[:] = gxk[:]
+                converged = True
+                break
+
+            ggxk[:] = gxk[:]
+            _apply_sweep(ggxk, weights, flist, _group_weights, sums, offsets)
+            n_sweeps += 1
+            if _sad_converged(ggxk, gxk, tol):
+                xk[:] = ggxk[:]
+                converged = True
+                break
+
+            vprod = 0.0
+            ssq = 0.0
+            for i in range(n_samples):
+                delta_gx = ggxk[i] - gxk[i]
+                delta2_x = delta_gx - gxk[i] + xk[i]
+                vprod += delta_gx * delta2_x
+                ssq += delta2_x * delta2_x
+
+            if ssq == 0.0:
+                xk[:] = ggxk[:]
+                converged = True
+                break
+
+            coef = vprod / ssq
+            for i in range(n_samples):
+                xk[i] = ggxk[i] - coef * (ggxk[i] - gxk[i])
+
+        n_iter[k] = n_sweeps
+        if not converged:
+            not_converged += 1
+
+        res[:, k] = xk[:]
+
+    success = not not_converged
+    return (res, n_iter, success)
+
+
+@nb.njit
+def _n_chunks_by_obs(n_samples: int) -> int:
+    "Return the number of chunks: one per thread, of `_BY_OBS_MIN_CHUNK_SIZE` or more."
+    return max(1, min(nb.get_num_threads(), n_samples // _BY_OBS_MIN_CHUNK_SIZE))
+
+
+@nb.njit(parallel=True, locals=dict(id=nb.uint32))
+def _subtract_weighted_group_mean_parallel(
+    x: np.ndarray,
+    sample_weights: np.ndarray,
+    group_ids: np.ndarray,
+    group_weights: np.ndarray,
+    _partial_sums: np.ndarray,
+) -> None:
+    """
+    Subtract weighted group means, parallel over observations.
+
+    Every thread accumulates the group sums of one chunk of observations into
+    its row of `_partial_sums`, of shape (n_chunks, n_groups). The partial
+    sums are then reduced into group means (stored in the first row) and
+    subtracted from `x`. As the summation order depends on the number of
+    chunks, the result depends on the number of threads at the level of
+    floating point rounding.
+    """
+    n_samples = x.size
+    n_chunks, n_groups = _partial_sums.shape
+    chunk_size = (n_samples + n_chunks - 1) // n_chunks
+
+    for c in nb.prange(n_chunks):
+        sums = _partial_sums[c, :]
+        sums[:] = 0
+        for i in range(c * chunk_size, min((c + 1) * chunk_size, n_samples)):
+            id = group_ids[i]
+            sums[id] += sample_weights[i] * x[i]
+
+    for g in nb.prange(n_groups):
+        total = 0.0
+        for c in range(n_chunks):
+            total += _partial_sums[c, g]
+        _partial_sums[0, g] = total / group_weights[g]
+
+    for i in nb.prange(n_samples):
+        x[i] -= _partial_sums[0, group_ids[i]]
+
+
+@nb.njit(parallel=True)
+def _subtract_weighted_segment_mean_parallel(
+    x: np.ndarray,
+    sample_weights: np.ndarray,
+    offsets: np.ndarray,
+    group_weights: np.ndarray,
+) -> None:
+    "Subtract weighted group means for sorted observations, parallel over groups."
+    for g in nb.prange(offsets.size - 1):
+        start = offsets[g]
+        end = offsets[g + 1]
+        if start == end:
+            continue
+
+        weighted_sum = 0.0
+        for i in range(start, end):
+            weighted_sum += sample_weights[i] * x[i]
+
+        mean = weighted_sum / group_weights[g]
+        for i in range(start, end):
+            x[i] -= mean
+
+
+@nb.njit
+def _apply_sweep_parallel(
+    x: np.ndarray,
+    sample_weights: np.ndarray,
+    flist: np.ndarray,
+    group_weights: np.ndarray,
+    _partial_sums: np.ndarray,
+    offsets: Optional[np.ndarray] = None,
+) -> None:
+    "Apply one sweep as `_apply_sweep()` does, parallel over observations."
+    start = 0
+    if offsets is not None:
+        _subtract_weighted_segment_mean_parallel(
+            x, sample_weights, offsets, group_weights[:, 0]
+        )
+        start = 1
+
+    for j in range(start, flist.shape[1]):
+        _subtract_weighted_group_mean_parallel(
+            x,
+            sample_weights,
+            flist[:, j],
+            group_weights[:, j],
+            _partial_sums,
+        )
+
+
 @nb.njit(parallel=True)
+def _sad_converged_parallel(a: np.ndarray, b: np.ndarray, tol: float) -> bool:
+    n_violations = 0
+    for i in nb.prange(a.size):
+        if np.abs(a[i] - b[i]) >= tol:
+            n_violations += 1
+    return n_violations == 0
+
+
+@nb.njit(parallel=True)
+def _copy_parallel(dst: np.ndarray, src: np.ndarray) -> None:
+    for i in nb.prange(dst.size):
+        dst[i] = src[i]
+
+
+@nb.njit(parallel=True, nogil=True)
+def _demean_map_by_obs(
+    x: np.ndarray,
+    flist: np.ndarray,
+    weights: np.ndarray,
+    tol: float = 1e-08,
+    maxiter: int = 100_000,
+    group_weights: Optional[np.ndarray] = None,
+    offsets: Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Demean an array via MAP, parallel over observations.
+
+    Same as `_demean_map()`, but the columns of `x` are demeaned one after
+    another and every sweep is parallelized over observations instead. This
+    keeps all threads busy if `x` has fewer columns than there are threads.
+    The results match `_demean_map()` up to floating point rounding, which
+    depends on the number of threads.
+    """
+    n_samples, n_features = x.shape
+
+    if x.flags.f_contiguous:
+        res = np.empty((n_features, n_samples), dtype=x.dtype).T
+    else:
+        res = np.empty((n_samples, n_features), dtype=x.dtype)
+
+    n_chunks = _n_chunks_by_obs(n_samples)
+
+    if group_weights is None:
+        _group_weights = _calc_group_weights(weights, flist, flist.max() + 1)
+    else:
+        _group_weights = group_weights
+    n_groups = _group_weights.shape[0]
+    _partial_sums = np.empty((n_chunks, n_groups), dtype=np.float64)
+
+    xk_curr = np.empty(n_samples, dtype=np.float64)
+    xk_prev = np.empty(n_samples, dtype=np.float64)
+
+    n_iter = np.zeros(n_features, dtype=np.int64)
+
+    not_converged = 0
+    for k in range(n_features):
+        for i in nb.prange(n_samples):
+            xk_curr[i] = x[i, k]
+            xk_prev[i] = x[i, k] - 1.0
+
+        for it in range(maxiter):
+            _apply_sweep_parallel(
+                xk_curr, weights, flist, _group_weights, _partial_sums, offsets
+            )
+            if _sad_converged_parallel(xk_curr, xk_prev, tol):
+                n_iter[k] = it + 1
+                break
+
+            _copy_parallel(xk_prev, xk_curr)
+        else:
+            n_iter[k] = maxiter
+            not_converged += 1
+
+        for i in nb.prange(n_samples):
+            res[i, k] = xk_curr[i]
+
+    success = not not_converged
+    return (res, n_iter, success)
+
+
+@nb.njit(parallel=True, nogil=True)
+def _demean_irons_tuck_by_obs(
+    x: np.ndarray,
+    flist: np.ndarray,
+    weights: np.ndarray,
+    tol: float = 1e-08,
+    maxiter: int = 100_000,
+    group_weights: Optional[np.ndarray] = None,
+    offsets: Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Demean an array via accelerated MAP, parallel over observations.
+
+    Same as `_demean_irons_tuck()`, but the columns of `x` are demeaned one
+    after another and every sweep and extrapolation step is parallelized over
+    observations instead. The results match `_demean_irons_tuck()` up to
+    floating point rounding, which depends on the number of threads.
+    """
+    n_samples, n_features = x.shape
+
+    if x.flags.f_contiguous:
+        res = np.empty((n_features, n_samples), dtype=x.dtype).T
+    else:
+        res = np.empty((n_samples, n_features), dtype=x.dtype)
+
+    n_chunks = _n_chunks_by_obs(n_samples)
+
+    if group_weights is None:
+        _group_weights = _calc_group_weights(weights, flist, flist.max() + 1)
+    else:
+        _group_weights = group_weights
+    n_groups = _group_weights.shape[0]
+    _partial_sums = np.empty((n_chunks, n_groups), dtype=np.float64)
+
+    xk = np.empty(n_samples, dtype=np.float64)
+    gxk = np.empty(n_samples, dtype=np.float64)
+    ggxk = np.empty(n_samples, dtype=np.float64)
+
+    n_iter = np.zeros(n_features, dtype=np.int64)
+
+    not_converged = 0
+    for k in range(n_features):
+        for i in nb.prange(n_samples):
+            xk[i] = x[i, k]
+
+        converged = False
+        n_sweeps = 0
+        while n_sweeps < maxiter:
+            _copy_parallel(gxk, xk)
+            _apply_sweep_parallel(
+                gxk, weights, flist, _group_weights, _partial_sums, offsets
+            )
+            n_sweeps += 1
+            if _sad_converged_parallel(gxk, xk, tol):
+                _copy_parallel(xk, gxk)
+                converged = True
+                break
+
+            _copy_parallel(ggxk, gxk)
+            _apply_sweep_parallel(
+                ggxk, weights, flist, _group_weights, _partial_sums, offsets
+            )
+            n_sweeps += 1
+            if _sad_converged_parallel(ggxk, gxk, tol):
+                _copy_parallel(xk, ggxk)
+                converged = True
+                break
+
+            vprod = 0.0
+            ssq = 0.0
+            for i in nb.prange(n_samples):
+                delta_gx = ggxk[i] - gxk[i]
+                delta2_x = delta_gx - gxk[i] + xk[i]
+                vprod += delta_gx * delta2_x
+                ssq += delta2_x * delta2_x
+
+            if ssq == 0.0:
+                _copy_parallel(xk, ggxk)
+                converged = True
+                break
+
+            coef = vprod / ssq
+            for i in nb.prange(n_samples):
+                xk[i] = ggxk[i] - coef * (ggxk[i] - gxk[i])
+
+        n_iter[k] = n_sweeps
+        if not converged:
+            not_converged += 1
+
+        for i in nb.prange(n_samples):
+            res[i, k] = xk[i]
+
+    success = not not_converged
+    return (res, n_iter, success)
+
+
+@nb.njit
 def demean(
     x: np.ndarray,
     flist: np.ndarray,
@@ -218,50 +700,165 @@ def demean(
         A tuple containing the demeaned array of shape (n_samples, n_features)
         and a boolean indicating whether the algorithm converged successfully.
     """
-    n_samples, n_features = x.shape
-    n_factors = flist.shape[1]
+    res, _, success = _demean_map(x, flist, weights, tol, maxiter)
+    return (res, success)
 
-    if x.flags.f_contiguous:
-        res = np.empty((n_features, n_samples), dtype=x.dtype).T
+
+_DEMEANERS = {
+    "map": _demean_map,
+    "irons_tuck": _demean_irons_tuck,
+}
+
+_DEMEANERS_BY_OBS = {
+    "map": _demean_map_by_obs,
+    "irons_tuck": _demean_irons_tuck_by_obs,
+}
+
+
+def _demean_array(
+    x: np.ndarray,
+    flist: np.ndarray,
+    weights: np.ndarray,
+    tol: float = 1e-08,
+    demeaner: str = "map",
+    maxiter: int = 100_000,
+    group_weights: Optional[np.ndarray] = None,
+    sort_by_group: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Demean an array with the selected demeaning algorithm.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Input array of shape (n_samples, n_features). Needs to be of type
+        float32 or float64. The iterations are carried out in float64 for
+        either type and the result has the type of `x`.
+    flist : numpy.ndarray
+        Array of shape (n_samples, n_factors) specifying the fixed effects.
+        Needs to already be converted to integers.
+    weights : numpy.ndarray
+        Array of shape (n_samples,) specifying the weights.
+    tol : float, optional
+        Tolerance criterion for convergence. Defaults to 1e-08.
+    demeaner : str, optional
+        The demeaning algorithm. Either "map" (alternating projections, the
+        default) or "irons_tuck" (alternating projections with Irons-Tuck
+        acceleration).
+    maxiter : int, optional
+        Maximum number of sweeps over all fixed effects. Defaults to 100_000.
+    group_weights : numpy.ndarray, optional
+        Precomputed sums of `weights` by group, of shape (n_groups, n_factors),
+        e.g. from a `FixedEffectsIndex`. Computed from `weights` and `flist`
+        if None (the default).
+    sort_by_group : bool, optional
+        If True, the observations are permuted into the group order of the
+        fixed effect with the most groups before demeaning. This fixed effect
+        is then swept out via contiguous segment reductions instead of
+        scattered accesses to the group sums, which is faster for high
+        cardinality fixed effects. False by default.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        The demeaned array of shape (n_samples, n_features) and the number of
+        sweeps over all fixed effects needed for convergence for each column.
+
+    Notes
+    -----
+    The columns of `x` are demeaned in parallel. If there are fewer columns
+    than numba threads, many observations and few groups per observation (see
+    `_use_demean_by_obs()`), the columns are instead demeaned one after
+    another and each sweep is parallelized over observations, with
+    thread-local partial group sums. The result then depends on the number of
+    threads at the level of floating point rounding.
+    """
+    if demeaner not in _DEMEANERS:
+        raise ValueError(
+            f"demeaner must be one of {list(_DEMEANERS)} but it is {demeaner}."
+        )
+
+    offsets = order = None
+    if sort_by_group:
+        x, flist, weights, group_weights, order, offsets = _sort_by_group(
+            x, flist, weights, group_weights
+        )
+
+    if _use_demean_by_obs(x.shape[1], flist, offsets is not None):
+        demean_func = _DEMEANERS_BY_OBS[demeaner]
     else:
-        res = np.empty((n_samples, n_features), dtype=x.dtype)
+        demean_func = _DEMEANERS[demeaner]
 
-    n_threads = nb.get_num_threads()
+    res, n_iter, success = demean_func(
+        x, flist, weights, tol, maxiter, group_weights, offsets
+    )
+    if success is False:
+        raise ValueError(f"Demeaning failed after {maxiter:_} iterations.")
 
-    n_groups = flist.max() + 1
-    group_weights = _calc_group_weights(weights, flist, n_groups)
-    _group_weighted_sums = np.empty((n_threads, n_groups), dtype=x.dtype)
+    if order is not None:
+        res_sorted = res
+        res = np.empty_like(res_sorted)
+        res[order] = res_sorted
 
-    x_curr = np.empty((n_threads, n_samples), dtype=x.dtype)
-    x_prev = np.empty((n_threads, n_samples), dtype=x.dtype)
+    return res, n_iter
 
-    not_converged = 0
-    for k in nb.prange(n_features):
-        tid = nb.get_thread_id()
 
-        xk_curr = x_curr[tid, :]
-        xk_prev = x_prev[tid, :]
-        for i in range(n_samples):
-            xk_curr[i] = x[i, k]
-            xk_prev[i] = x[i, k] - 1.0
+def _use_demean_by_obs(
+    n_features: int, flist: np.ndarray, sorted_by_group: bool
+) -> bool:
+    """
+    Decide whether to demean in parallel over observations instead of columns.
 
-        for _ in range(maxiter):
-            for j in range(n_factors):
-                _subtract_weighted_group_mean(
-                    xk_curr,
-                    weights,
-                    flist[:, j],
-                    group_weights[:, j],
-                    _group_weighted_sums[tid, :],
-                )
-            if _sad_converged(xk_curr, xk_prev, tol):
-                break
+    Only if there are fewer columns than threads, at least `_BY_OBS_MIN_OBS`
+    observations and at most `_BY_OBS_MAX_GROUPS_PER_OBS` groups per
+    observation in the fixed effects that are swept via thread-local group
+    sums, i.e. all but the first fixed effect if `sorted_by_group`.
+    """
+    n_samples = flist.shape[0]
+    if n_features >= nb.get_num_threads() or n_samples < _BY_OBS_MIN_OBS:
+        return False
 
-            xk_prev[:] = xk_curr[:]
-        else:
-            not_converged += 1
+    flist_sums = flist[:, 1:] if sorted_by_group else flist
+    if flist_sums.shape[1] == 0:
+        return True
+    n_groups = int(flist_sums.max()) + 1
+    return n_groups <= _BY_OBS_MAX_GROUPS_PER_OBS * n_samples
 
-        res[:, k] = xk_curr[:]
 
-    success = not not_converged
-    return (res, success)
+def _sort_by_group(
+    x: np.ndarray,
+    flist: np.ndarray,
+    weights: np.ndarray,
+    group_weights: Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sort observations by the groups of the fixed effect with the most groups.
+
+    The fixed effect with the most groups is moved to the first column of
+    `flist`, as expected by `_apply_sweep()`.
+
+    Returns
+    -------
+    tuple
+        The sorted `x`, `flist`, `weights` and `group_weights`, the sort order
+        and the group boundaries of the first fixed effect in sorted order.
+    """
+    n_groups = flist.max(axis=0) + 1
+    j = int(np.argmax(n_groups))
+    cols = [j] + [i for i in range(flist.shape[1]) if i != j]
+
+    if group_weights is None:
+        group_weights = _calc_group_weights(weights, flist, np.max(n_groups))
+    group_weights = np.asfortranarray(group_weights[:, cols])
+
+    order, offsets = bucket_argsort(flist[:, j])
+
+    flist_sorted = np.empty((flist.shape[1], flist.shape[0]), dtype=flist.dtype).T
+    # the first fixed effect is constant within segments, no gather needed
+    flist_sorted[:, 0] = np.repeat(
+        np.arange(n_groups[j], dtype=flist.dtype), np.diff(offsets)
+    )
+    for i, col in enumerate(cols[1:], start=1):
+        flist_sorted[:, i] = flist[order, col]
+
+    return x[order], flist_sorted, weights[order], group_weights, order, offsets
@@ -0,0 +1,192 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Union
+
+import numpy as np
+
+from pyfixest.estimation.demean_ import _demean_array
+
+
+class DemeanCache:
+    """
+    A size-bounded cache of demeaned variables.
+
+    Demeaning is usually the most expensive step of fitting a fixed effects
+    model, and variants of the same model - different covariates, dependent
+    variables or inference - demean the same variables over and over. A
+    `DemeanCache` stores each demeaned variable separately and can be passed
+    to `feols()` and `fepois()` via the `demean_cache` argument, where it is
+    shared by all estimated models and by all calls that receive the same
+    cache.
+
+    Entries are keyed by a hash of the values of the variable, the fixed
+    effects, the weights, the estimation sample (implicitly, via the values of
+    the other keys) and the demeaning settings. A cached variable is hence
+    only reused if demeaning it again would produce the same result, and
+    modifying the data between calls does not require clearing the cache.
+    If the size of the cached arrays exceeds `max_bytes`, the least recently
+    used entries are evicted.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        The memory budget of the cache in bytes. Defaults to 1 GB. None for
+        an unbounded cache.
+
+    Attributes
+    ----------
+    nbytes : int
+        The size of the cached arrays in bytes.
+    hits : int
+        The number of variables that were found in the cache.
+    misses : int
+        The number of variables that were not found in the cache.
+
+    Examples
+    --------
+    ```{python}
+    import pyfixest as pf
+    from pyfixest.estimation import DemeanCache
+
+    data = pf.get_data()
+    cache = DemeanCache(max_bytes=100_000_000)
+
+    fit1 = pf.feols("Y ~ X1 | f1 + f2", data, demean_cache=cache)
+    # Y and X1 are not demeaned again
+    fit2 = pf.feols("Y ~ X1 + X2 | f1 + f2", data, demean_cache=cache)
+    cache
+    ```
+    """
+
+    def __init__(self, max_bytes: Optional[int] = 1_000_000_000):
+        if max_bytes is not None and (
+            not isinstance(max_bytes, int) or isinstance(max_bytes, bool)
+        ):
+            raise TypeError("The argument `max_bytes` must be of type int or None.")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("The argument `max_bytes` must be non-negative.")
+
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[np.ndarray, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        max_bytes = "None" if self.max_bytes is None else f"{self.max_bytes:_}"
+        return (
+            f"DemeanCache(entries={len(self)}, nbytes={self.nbytes:_}, "
+            f"max_bytes={max_bytes}, hits={self.hits}, misses={self.misses})"
+        )
+
+    def __getstate__(self) -> dict:
+        # locks cannot be pickled, e.g. when passed to a process pool
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        "Remove all entries from the cache."
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def demean(
+        self,
+        x: np.ndarray,
+        flist: np.ndarray,
+        weights: np.ndarray,
+        tol: float = 1e-08,
+        demeaner: str = "map",
+        group_weights: Optional[np.ndarray] = None,
+        sort_by_group: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Demean an array, reusing cached columns.
+
+        Only the columns of `x` that are not in the cache are demeaned, via
+        `_demean_array()`, and then added to the cache. The arguments and the
+        return values are the same as for `_demean_array()`.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            The demeaned array of shape (n_samples, n_features) and the number
+            of sweeps over all fixed effects needed for convergence for each
+            column. The number of sweeps of cached columns is the number of
+            sweeps when they were first demeaned.
+        """
+        model_hash = _hash_arrays(
+            flist,
+            weights,
+            np.array([tol]),
+            f"{demeaner},{sort_by_group}".encode(),
+        )
+        keys = [_hash_arrays(x[:, j], model_hash) for j in range(x.shape[1])]
+
+        res = np.empty_like(x)
+        n_iter = np.zeros(x.shape[1], dtype=np.int64)
+        missing = []
+        with self._lock:
+            for j, key in enumerate(keys):
+                entry = self._entries.get(key)
+                if entry is None:
+                    missing.append(j)
+                else:
+                    self._entries.move_to_end(key)
+                    res[:, j], n_iter[j] = entry
+            self.hits += x.shape[1] - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            res_missing, n_iter_missing = _demean_array(
+                x=x[:, missing],
+                flist=flist,
+                weights=weights,
+                tol=tol,
+                demeaner=demeaner,
+                group_weights=group_weights,
+                sort_by_group=sort_by_group,
+            )
+            res[:, missing] = res_missing
+            n_iter[missing] = n_iter_missing
+
+            with self._lock:
+                for i, j in enumerate(missing):
+                    self._put(keys[j], res_missing[:, i].copy(), n_iter_missing[i])
+
+        return res, n_iter
+
+    def _put(self, key: bytes, value: np.ndarray, n_iter: int) -> None:
+        "Add an entry and evict the least recently used entries if needed."
+        if self.max_bytes is not None and value.nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[0].nbytes
+        self._entries[key] = (value, n_iter)
+        self.nbytes += value.nbytes
+        while self.max_bytes is not None and self.nbytes > self.max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+
+def _hash_arrays(*arrays: Union[np.ndarray, bytes]) -> bytes:
+    "Hash the shapes, types and values of arrays."
+    h = hashlib.blake2b(digest_size=16)
+    for x in arrays:
+        if isinstance(x, bytes):
+            h.update(x)
+            continue
+        x = np.ascontiguousarray(x)
+        h.update(f"{x.dtype.str}{x.shape}".encode())
+        h.update(x.view(np.uint8).reshape(-1).data)
+    return h.digest()
@@ -3,16 +3,29 @@ from typing import Optional, Union
 import pandas as pd
 
 from pyfixest.errors import FeatureDeprecationError
+from pyfixest.estimation.demean_cache_ import DemeanCache
+from pyfixest.estimation.feglm_ import Feglm
 from pyfixest.estimation.feols_ import Feols
+from pyfixest.estimation.feols_stream_ import (
+    FeolsStream,
+    StreamSourceType,
+    _StreamSource,
+)
 from pyfixest.estimation.fepois_ import Fepois
-from pyfixest.estimation.FixestMulti_ import FixestMulti
-from pyfixest.utils.dev_utils import DataFrameType
+from pyfixest.estimation.fixef_index_ import FixedEffectsIndex
+from pyfixest.estimation.FixestMulti_ import FixestMulti, _get_vcov_type
+from pyfixest.estimation.FormulaParser import FixestFormulaParser
+from pyfixest.utils.dev_utils import (
+    DataInputType,
+    _get_column_names,
+    _is_arrow_table,
+)
 from pyfixest.utils.utils import ssc
 
 
 def feols(
     fml: str,
-    data: DataFrameType,  # type: ignore
+    data: DataInputType,  # type: ignore
     vcov: Optional[Union[str, dict[str, str]]] = None,
     weights: Union[None, str] = None,
     ssc: dict[str, Union[str, bool]] = ssc(),
@@ -31,6 +44,13 @@ def feols(
     seed: Optional[int] = None,
     split: Optional[str] = None,
     fsplit: Optional[str] = None,
+    demeaner: str = "map",
+    fixef_sort: bool = False,
+    fixef_index: Optional[FixedEffectsIndex] = None,
+    dtype: str = "float64",
+    n_jobs: int = 1,
+    executor: str = "threads",
+    demean_cache: Optional[DemeanCache] = None,
 ) -> Union[Feols, FixestMulti]:
     """
     Estimate a linear regression models with fixed effects using fixest formula syntax.
@@ -44,12 +64,22 @@ def feols(
         cumulative stepwise regression, multiple dependent variables,
         interaction of variables (i(X1,X2)), and interacted fixed effects (fe1^fe2).
 
-    data : DataFrameType
+    data : DataInputType
         A pandas or polars dataframe containing the variables in the formula.
+        Also accepts a polars LazyFrame or a pyarrow Table. For all inputs but
+        pandas dataframes, only the columns referenced by the formula, weights,
+        cluster and split variables are collected and converted to pandas,
+        and the converted data is not copied again. Post-estimation methods
+        that need other columns, e.g. `vcov()` with a new cluster variable,
+        then require passing the data.
 
     vcov : Union[str, dict[str, str]]
         Type of variance-covariance matrix for inference. Options include "iid",
-        "hetero", "HC1", "HC2", "HC3", or a dictionary for CRV1/CRV3 inference.
+        "hetero", "HC1", "HC2", "HC3", or a dictionary for CRV1/CRV3 inference
+        or for NW, DK and conley HAC inference, e.g. {"NW": "unit + time"},
+        {"DK": "time", "lag": 2} or {"conley": "lat + lon", "cutoff": 100}.
+        The time variable of NW and DK inference must be integer valued; lags
+        are differences of its values, so gaps in the periods are respected.
 
     weights : Union[None, str], optional.
         Default is None. Weights for WLS estimation. If None, all observations
@@ -79,12 +109,11 @@ def feols(
 
     copy_data : bool, optional
         Whether to copy the data before estimation, by default True.
-        If set to False, the data is not copied, which can save memory but
-        may lead to unintended changes in the input data outside of `fepois`.
-        For example, the input data set is re-index within the function.
-        As far as I know, the only other relevant case is
-        when using interacted fixed effects, in which case you'll find
-        a column with interacted fixed effects in the data set.
+        The data is copied once and shared by all estimated models. If
+        `store_data=False` or `lean=True`, only the columns referenced by
+        the models are copied, and the input data is never modified.
+        Otherwise, if set to False, the data is not copied, which can save
+        memory but re-indexes the input data set in place.
 
     store_data : bool, optional
         Whether to store the data in the model object, by default True.
@@ -140,6 +169,74 @@ def feols(
     fsplit: Optional[str]
         This argument is the same as split but also includes the full sample as the first estimation.
 
+    demeaner: str, optional
+        The algorithm used to project out the fixed effects. Either "map"
+        (the default), which runs alternating projections, or "irons_tuck",
+        which accelerates the alternating projections with the Irons-Tuck
+        extrapolation employed by `fixest`. The accelerated algorithm typically
+        needs a fraction of the iterations for models with multiple weakly
+        connected fixed effects and converges to the same solution up to
+        `fixef_tol`.
+
+    fixef_sort: bool, optional
+        If True, the observations are sorted by the groups of the fixed effect
+        with the most levels before demeaning, so that this fixed effect can
+        be projected out with contiguous memory access. This is faster for
+        high-dimensional fixed effects (e.g. millions of workers or firms) that
+        need many iterations to converge, but adds the cost of sorting the
+        data. Defaults to False.
+
+    fixef_index: Optional[FixedEffectsIndex]
+        A precomputed `FixedEffectsIndex` of `data`, which caches the
+        factorization and group structure of the fixed effects. Useful when
+        many models with the same fixed effects are fit on the same data: the
+        index is then reused for singleton detection, demeaning, CRV inference
+        when clustering by a fixed effect, and `fixef()`. All fixed effects of
+        the models need to be part of the index. Defaults to None.
+
+    dtype: str, optional
+        The floating point type of the dependent variable, covariates and
+        instruments. Either "float64" (the default) or "float32". With
+        "float32", the model matrices and demeaned variables are stored in
+        single precision, which roughly halves the memory needed for large
+        design matrices. The demeaning iterations and all cross-products
+        (e.g. X'X, X'y, the meat of the sandwich estimators) are accumulated
+        in double precision, so that the loss of accuracy is driven by the
+        rounding of the data to single precision (about 7 significant digits):
+        on the package's test data, coefficients and standard errors agree
+        with the "float64" path up to a relative error of about 1e-7, and on
+        a simulated panel with 2 million rows and 200,000 fixed effect levels
+        the coefficients differ by about 1e-5 standard errors. Ignored if
+        `use_compression=True`.
+
+    n_jobs: int, optional
+        The number of workers used to estimate multiple models in parallel.
+        Models that share fixed effects and the sample split are estimated
+        together (and share demeaned variables), while such groups of models,
+        e.g. from `split`, `fsplit` or `sw()` / `csw()` on the fixed effects,
+        are distributed over the workers. The order of the models is not
+        affected. 1 (the default) estimates all models serially, -1 uses all
+        CPUs.
+
+    executor: str, optional
+        The pool used if `n_jobs != 1`. Either "threads" (the default) or
+        "processes". With threads, the demeaning of different groups runs
+        concurrently, while the processes backend parallelizes all steps but
+        needs to copy the data to every worker. If numba runs on its workqueue
+        threading layer, which is not threadsafe, "threads" falls back to
+        serial estimation.
+
+    demean_cache: Optional[DemeanCache]
+        A `DemeanCache` that stores demeaned variables across calls. Variables
+        that were already demeaned with the same fixed effects, weights,
+        estimation sample and demeaning settings - e.g. by a previous call that
+        received the same cache - are taken from the cache instead of being
+        demeaned again. The cache is bounded by its memory budget and evicts
+        the least recently used variables. It is not used if the models are
+        estimated in worker processes (`n_jobs != 1` and
+        `executor="processes"`). If None (the default), only models with the
+        same fixed effects and sample within one call share demeaned variables.
+
     Returns
     -------
     object
@@ -192,9 +289,9 @@ def feols(
     Supported inference types are "iid", "hetero", "HC1", "HC2", "HC3", and
     "CRV1"/"CRV3". Clustered standard errors are specified via a dictionary,
     e.g. `{"CRV1": "f1"}` for CRV1 inference with clustering by `f1` or
-    `{"CRV3": "f1"}` for CRV3 inference with clustering by `f1`. For two-way
+    `{"CRV3": "f1"}` for CRV3 inference with clustering by `f1`. For multiway
     clustering, you can provide a formula string, e.g. `{"CRV1": "f1 + f2"}` for
-    CRV1 inference with clustering by `f1`.
+    CRV1 inference with two-way clustering by `f1` and `f2`.
 
     ```{python}
     fit4 = pf.feols("Y ~ X1 + X2 | f1 + f2", data, vcov={"CRV1": "f1 + f2"})
@@ -378,6 +475,13 @@ def feols(
         seed=seed,
         split=split,
         fsplit=fsplit,
+        demeaner=demeaner,
+        fixef_sort=fixef_sort,
+        fixef_index=fixef_index,
+        dtype=dtype,
+        n_jobs=n_jobs,
+        executor=executor,
+        demean_cache=demean_cache,
     )
 
     fixest = FixestMulti(
@@ -392,6 +496,13 @@ def feols(
         seed=seed,
         split=split,
         fsplit=fsplit,
+        demeaner=demeaner,
+        fixef_sort=fixef_sort,
+        fixef_index=fixef_index,
+        dtype=dtype,
+        n_jobs=n_jobs,
+        executor=executor,
+        demean_cache=demean_cache,
     )
 
     estimation = "feols" if not use_compression else "compression"
@@ -411,7 +522,7 @@ def feols(
 
 def fepois(
     fml: str,
-    data: DataFrameType,  # type: ignore
+    data: DataInputType,  # type: ignore
     vcov: Optional[Union[str, dict[str, str]]] = None,
     ssc: dict[str, Union[str, bool]] = ssc(),
     fixef_rm: str = "none",
@@ -428,6 +539,12 @@ def fepois(
     lean: bool = False,
     split: Optional[str] = None,
     fsplit: Optional[str] = None,
+    demeaner: str = "map",
+    fixef_sort: bool = False,
+    fixef_index: Optional[FixedEffectsIndex] = None,
+    n_jobs: int = 1,
+    executor: str = "threads",
+    demean_cache: Optional[DemeanCache] = None,
 ) -> Union[Feols, Fepois, FixestMulti]:
     """
     Estimate Poisson regression model with fixed effects using the `ppmlhdfe` algorithm.
@@ -446,12 +563,22 @@ def fepois(
         - Interacted fixed effects (fe1^fe2)
         Compatible with formula parsing via the formulaic module.
 
-    data : DataFrameType
+    data : DataInputType
         A pandas or polars dataframe containing the variables in the formula.
+        Also accepts a polars LazyFrame or a pyarrow Table. For all inputs but
+        pandas dataframes, only the columns referenced by the formula, weights,
+        cluster and split variables are collected and converted to pandas,
+        and the converted data is not copied again. Post-estimation methods
+        that need other columns, e.g. `vcov()` with a new cluster variable,
+        then require passing the data.
 
     vcov : Union[str, dict[str, str]]
         Type of variance-covariance matrix for inference. Options include "iid",
-        "hetero", "HC1", "HC2", "HC3", or a dictionary for CRV1/CRV3 inference.
+        "hetero", "HC1", "HC2", "HC3", or a dictionary for CRV1/CRV3 inference
+        or for NW, DK and conley HAC inference, e.g. {"NW": "unit + time"},
+        {"DK": "time", "lag": 2} or {"conley": "lat + lon", "cutoff": 100}.
+        The time variable of NW and DK inference must be integer valued; lags
+        are differences of its values, so gaps in the periods are respected.
 
     ssc : str
         A ssc object specifying the small sample correction for inference.
@@ -467,7 +594,9 @@ def fepois(
         Tolerance for IWLS convergence, by default 1e-08.
 
     iwls_maxiter : Optional[float], optional
-        Maximum number of iterations for IWLS convergence, by default 25.
+        Maximum number of iterations for IWLS convergence, by default 25. A
+        `NonConvergenceError` is raised if the algorithm does not converge. The
+        iterations are recorded in the `irls_trace` attribute of the model.
 
     collin_tol : float, optional
         Tolerance for collinearity check, by default 1e-10.
@@ -490,12 +619,11 @@ def fepois(
 
     copy_data : bool, optional
         Whether to copy the data before estimation, by default True.
-        If set to False, the data is not copied, which can save memory but
-        may lead to unintended changes in the input data outside of `fepois`.
-        For example, the input data set is re-index within the function.
-        As far as I know, the only other relevant case is
-        when using interacted fixed effects, in which case you'll find
-        a column with interacted fixed effects in the data set.
+        The data is copied once and shared by all estimated models. If
+        `store_data=False` or `lean=True`, only the columns referenced by
+        the models are copied, and the input data is never modified.
+        Otherwise, if set to False, the data is not copied, which can save
+        memory but re-indexes the input data set in place.
 
     store_data : bool, optional
         Whether to store the data in the model object, by default True.
@@ -520,6 +648,61 @@ def fepois(
     fsplit: Optional[str]
         This argument is the same as split but also includes the full sample as the first estimation.
 
+    demeaner: str, optional
+        The algorithm used to project out the fixed effects. Either "map"
+        (the default), which runs alternating projections, or "irons_tuck",
+        which accelerates the alternating projections with the Irons-Tuck
+        extrapolation employed by `fixest`. The accelerated algorithm typically
+        needs a fraction of the iterations for models with multiple weakly
+        connected fixed effects and converges to the same solution up to
+        `fixef_tol`.
+
+    fixef_sort: bool, optional
+        If True, the observations are sorted by the groups of the fixed effect
+        with the most levels before demeaning, so that this fixed effect can
+        be projected out with contiguous memory access. This is faster for
+        high-dimensional fixed effects (e.g. millions of workers or firms) that
+        need many iterations to converge, but adds the cost of sorting the
+        data. Defaults to False.
+
+    fixef_index: Optional[FixedEffectsIndex]
+        A precomputed `FixedEffectsIndex` of `data`, which caches the
+        factorization and group structure of the fixed effects. Useful when
+        many models with the same fixed effects are fit on the same data: the
+        index is then reused for singleton detection, demeaning, CRV inference
+        when clustering by a fixed effect, and `fixef()`. All fixed effects of
+        the models need to be part of the index. Defaults to None.
+
+    n_jobs: int, optional
+        The number of workers used to estimate multiple models in parallel.
+        Models that share fixed effects and the sample split are estimated
+        together (and share demeaned variables), while such groups of models,
+        e.g. from `split`, `fsplit` or `sw()` / `csw()` on the fixed effects,
+        are distributed over the workers. The order of the models is not
+        affected. 1 (the default) estimates all models serially, -1 uses all
+        CPUs.
+
+    executor: str, optional
+        The pool used if `n_jobs != 1`. Either "threads" (the default) or
+        "processes". With threads, the demeaning of different groups runs
+        concurrently, while the processes backend parallelizes all steps but
+        needs to copy the data to every worker. If numba runs on its workqueue
+        threading layer, which is not threadsafe, "threads" falls back to
+        serial estimation.
+
+    demean_cache: Optional[DemeanCache]
+        A `DemeanCache` that stores demeaned variables across calls. Variables
+        that were already demeaned with the same fixed effects, weights,
+        estimation sample and demeaning settings - e.g. by a previous call that
+        received the same cache - are taken from the cache instead of being
+        demeaned again. The cache is bounded by its memory budget and evicts
+        the least recently used variables. It is not used if the models are
+        estimated in worker processes (`n_jobs != 1` and
+        `executor="processes"`). As the weights change in every IWLS iteration,
+        only the first iteration uses the cache. If None (the default), only
+        models with the same fixed effects and sample within one call share
+        demeaned variables.
+
     Returns
     -------
     object
@@ -575,6 +758,12 @@ def fepois(
         split=split,
         fsplit=fsplit,
         separation_check=separation_check,
+        demeaner=demeaner,
+        fixef_sort=fixef_sort,
+        fixef_index=fixef_index,
+        n_jobs=n_jobs,
+        executor=executor,
+        demean_cache=demean_cache,
     )
 
     fixest = FixestMulti(
@@ -589,6 +778,12 @@ def fepois(
         seed=None,
         split=split,
         fsplit=fsplit,
+        demeaner=demeaner,
+        fixef_sort=fixef_sort,
+        fixef_index=fixef_index,
+        n_jobs=n_jobs,
+        executor=executor,
+        demean_cache=demean_cache,
     )
 
     fixest._prepare_estimation(
@@ -614,9 +809,465 @@ def fepois(
         return fixest.fetch_model(0, print_fml=False)
 
 
+def feglm(
+    fml: str,
+    data: DataInputType,  # type: ignore
+    family: str,
+    vcov: Optional[Union[str, dict[str, str]]] = None,
+    ssc: dict[str, Union[str, bool]] = ssc(),
+    fixef_rm: str = "none",
+    fixef_tol: float = 1e-08,
+    iwls_tol: float = 1e-08,
+    iwls_maxiter: int = 25,
+    collin_tol: float = 1e-10,
+    separation_check: Optional[list[str]] = ["fe"],
+    solver: str = "np.linalg.solve",
+    drop_intercept: bool = False,
+    copy_data: bool = True,
+    store_data: bool = True,
+    lean: bool = False,
+    split: Optional[str] = None,
+    fsplit: Optional[str] = None,
+    demeaner: str = "map",
+    fixef_sort: bool = False,
+    fixef_index: Optional[FixedEffectsIndex] = None,
+    n_jobs: int = 1,
+    executor: str = "threads",
+    demean_cache: Optional[DemeanCache] = None,
+) -> Union[Feols, Feglm, FixestMulti]:
+    """
+    Estimate a generalized linear model with fixed effects.
+
+    The model is fit via iterated weighted least squares with the same
+    algorithm as `fepois()`: in every iteration, the working variable and the
+    covariates are demeaned with the working weights of the family, and the
+    demeaning is warm-started from the last iteration. The separation checks
+    and all inference methods of `fepois()` are supported.
+
+    Parameters
+    ----------
+    fml : str
+        A two-sided formula string using fixest formula syntax.
+        Syntax: "Y ~ X1 + X2 | FE1 + FE2". "|" separates left-hand side and fixed
+        effects.
+        Special syntax includes:
+        - Stepwise regressions (sw, sw0)
+        - Cumulative stepwise regression (csw, csw0)
+        - Multiple dependent variables (Y1 + Y2 ~ X)
+        - Interaction of variables (i(X1,X2))
+        - Interacted fixed effects (fe1^fe2)
+        Compatible with formula parsing via the formulaic module.
+
+    data : DataInputType
+        A pandas or polars dataframe containing the variables in the formula.
+        Also accepts a polars LazyFrame or a pyarrow Table. For all inputs but
+        pandas dataframes, only the columns referenced by the formula, weights,
+        cluster and split variables are collected and converted to pandas,
+        and the converted data is not copied again. Post-estimation methods
+        that need other columns, e.g. `vcov()` with a new cluster variable,
+        then require passing the data.
+
+    family : str
+        The family of the model. One of "logit" or "probit" (binomial with
+        logit or probit link, for outcomes in [0, 1]), "negbin" (negative
+        binomial with log link, whose shape parameter theta is estimated by
+        maximum likelihood), "gamma" (gamma with log link) or "poisson" (same
+        as `fepois()`).
+
+    vcov : Union[str, dict[str, str]]
+        Type of variance-covariance matrix for inference. Options include "iid",
+        "hetero", "HC1", "HC2", "HC3", or a dictionary for CRV1/CRV3 inference
+        or for NW, DK and conley HAC inference, e.g. {"NW": "unit + time"},
+        {"DK": "time", "lag": 2} or {"conley": "lat + lon", "cutoff": 100}.
+        The time variable of NW and DK inference must be integer valued; lags
+        are differences of its values, so gaps in the periods are respected.
+
+    ssc : str
+        A ssc object specifying the small sample correction for inference.
+
+    fixef_rm : str
+        Specifies whether to drop singleton fixed effects.
+        Options: "none" (default), "singleton".
+
+    fixef_tol: float, optional
+        Tolerance for the fixed effects demeaning algorithm. Defaults to 1e-08.
+
+    iwls_tol : Optional[float], optional
+        Tolerance for IWLS convergence, by default 1e-08.
+
+    iwls_maxiter : Optional[float], optional
+        Maximum number of iterations for IWLS convergence, by default 25. A
+        `NonConvergenceError` is raised if the algorithm does not converge. The
+        iterations are recorded in the `irls_trace` attribute of the model.
+
+    collin_tol : float, optional
+        Tolerance for collinearity check, by default 1e-10.
+
+    separation_check: list[str], optional
+        Methods to identify and drop separated observations.
+        Either "fe" or "ir". Executes "fe" by default. For the binomial
+        families, observations that are perfectly predicted to be zero or one
+        are dropped. Not applicable to the gamma family.
+
+    solver : str, optional.
+        The solver to use for the regression. Can be either "np.linalg.solve" or
+        "np.linalg.lstsq". Defaults to "np.linalg.solve".
+
+    drop_intercept : bool, optional
+        Whether to drop the intercept from the model, by default False.
+
+    copy_data : bool, optional
+        Whether to copy the data before estimation, by default True.
+        The data is copied once and shared by all estimated models. If
+        `store_data=False` or `lean=True`, only the columns referenced by
+        the models are copied, and the input data is never modified.
+        Otherwise, if set to False, the data is not copied, which can save
+        memory but re-indexes the input data set in place.
+
+    store_data : bool, optional
+        Whether to store the data in the model object, by default True.
+        If set to False, the data is not stored in the model object, which can
+        improve performance and save memory. However, it will no longer be possible
+        to access the data via the `data` attribute of the model object. This has
+        impact on post-estimation capabilities that rely on the data, e.g. `predict()`
+        or `vcov()`.
+
+    lean: bool, optional
+        False by default. If True, then all large objects are removed from the
+        returned result: this will save memory but will block the possibility
+        to use many methods. It is recommended to use the argument vcov
+        to obtain the appropriate standard-errors at estimation time,
+        since obtaining different SEs won't be possible afterwards.
+
+    split: Optional[str]
+        A character string, i.e. 'split = var'. If provided, the sample is split according to the
+        variable and one estimation is performed for each value of that variable. If you also want
+        to include the estimation for the full sample, use the argument fsplit instead.
+
+    fsplit: Optional[str]
+        This argument is the same as split but also includes the full sample as the first estimation.
+
+    demeaner: str, optional
+        The algorithm used to project out the fixed effects. Either "map"
+        (the default), which runs alternating projections, or "irons_tuck",
+        which accelerates the alternating projections with the Irons-Tuck
+        extrapolation employed by `fixest`. The accelerated algorithm typically
+        needs a fraction of the iterations for models with multiple weakly
+        connected fixed effects and converges to the same solution up to
+        `fixef_tol`.
+
+    fixef_sort: bool, optional
+        If True, the observations are sorted by the groups of the fixed effect
+        with the most levels before demeaning, so that this fixed effect can
+        be projected out with contiguous memory access. This is faster for
+        high-dimensional fixed effects (e.g. millions of workers or firms) that
+        need many iterations to converge, but adds the cost of sorting the
+        data. Defaults to False.
+
+    fixef_index: Optional[FixedEffectsIndex]
+        A precomputed `FixedEffectsIndex` of `data`, which caches the
+        factorization and group structure of the fixed effects. Useful when
+        many models with the same fixed effects are fit on the same data: the
+        index is then reused for singleton detection, demeaning, CRV inference
+        when clustering by a fixed effect, and `fixef()`. All fixed effects of
+        the models need to be part of the index. Defaults to None.
+
+    n_jobs: int, optional
+        The number of workers used to estimate multiple models in parallel.
+        Models that share fixed effects and the sample split are estimated
+        together (and share demeaned variables), while such groups of models,
+        e.g. from `split`, `fsplit` or `sw()` / `csw()` on the fixed effects,
+        are distributed over the workers. The order of the models is not
+        affected. 1 (the default) estimates all models serially, -1 uses all
+        CPUs.
+
+    executor: str, optional
+        The pool used if `n_jobs != 1`. Either "threads" (the default) or
+        "processes". With threads, the demeaning of different groups runs
+        concurrently, while the processes backend parallelizes all steps but
+        needs to copy the data to every worker. If numba runs on its workqueue
+        threading layer, which is not threadsafe, "threads" falls back to
+        serial estimation.
+
+    demean_cache: Optional[DemeanCache]
+        A `DemeanCache` that stores demeaned variables across calls. Variables
+        that were already demeaned with the same fixed effects, weights,
+        estimation sample and demeaning settings - e.g. by a previous call that
+        received the same cache - are taken from the cache instead of being
+        demeaned again. The cache is bounded by its memory budget and evicts
+        the least recently used variables. It is not used if the models are
+        estimated in worker processes (`n_jobs != 1` and
+        `executor="processes"`). As the weights change in every IWLS iteration,
+        only the first iteration uses the cache. If None (the default), only
+        models with the same fixed effects and sample within one call share
+        demeaned variables.
+
+    Returns
+    -------
+    object
+        An instance of the `Feglm` class or an instance of class `FixestMulti`
+        for multiple models specified via `fml`.
+
+    Examples
+    --------
+    The `feglm()` function estimates a logit model with fixed effects for
+    `f1` and `f2` as follows:
+
+    ```{python}
+    import pyfixest as pf
+
+    data = pf.get_data()
+    data["Y_binary"] = (data["Y"] > 0).astype(int)
+    fit = pf.feglm("Y_binary ~ X1 + X2 | f1 + f2", data, family="logit")
+    fit.summary()
+    ```
+    For more examples, please take a look at the documentation of the `feols()`
+    function.
+    """
+    if not isinstance(family, str) or family not in [
+        "poisson",
+        "logit",
+        "probit",
+        "negbin",
+        "gamma",
+    ]:
+        raise ValueError(
+            "family must be one of 'poisson', 'logit', 'probit', 'negbin' or "
+            f"'gamma', but {family} was specified."
+        )
+
+    # WLS currently not supported for generalized linear models
+    weights = None
+    weights_type = "aweights"
+
+    _estimation_input_checks(
+        fml=fml,
+        data=data,
+        vcov=vcov,
+        weights=weights,
+        ssc=ssc,
+        fixef_rm=fixef_rm,
+        collin_tol=collin_tol,
+        copy_data=copy_data,
+        store_data=store_data,
+        lean=lean,
+        fixef_tol=fixef_tol,
+        weights_type=weights_type,
+        use_compression=False,
+        reps=None,
+        seed=None,
+        split=split,
+        fsplit=fsplit,
+        separation_check=separation_check,
+        demeaner=demeaner,
+        fixef_sort=fixef_sort,
+        fixef_index=fixef_index,
+        n_jobs=n_jobs,
+        executor=executor,
+        demean_cache=demean_cache,
+    )
+
+    fixest = FixestMulti(
+        data=data,
+        copy_data=copy_data,
+        store_data=store_data,
+        lean=lean,
+        fixef_tol=fixef_tol,
+        weights_type=weights_type,
+        use_compression=False,
+        reps=None,
+        seed=None,
+        split=split,
+        fsplit=fsplit,
+        demeaner=demeaner,
+        fixef_sort=fixef_sort,
+        fixef_index=fixef_index,
+        n_jobs=n_jobs,
+        executor=executor,
+        demean_cache=demean_cache,
+    )
+
+    fixest._prepare_estimation(
+        "feglm", fml, vcov, weights, ssc, fixef_rm, drop_intercept
+    )
+    if fixest._is_iv:
+        raise NotImplementedError(
+            "IV Estimation is not supported for generalized linear models."
+        )
+
+    fixest._estimate_all_models(
+        vcov=vcov,
+        iwls_tol=iwls_tol,
+        iwls_maxiter=iwls_maxiter,
+        collin_tol=collin_tol,
+        separation_check=separation_check,
+        solver=solver,
+        family=family,
+    )
+
+    if fixest._is_multiple_estimation:
+        return fixest
+    else:
+        return fixest.fetch_model(0, print_fml=False)
+
+
+def feols_stream(
+    fml: str,
+    data: StreamSourceType,
+    vcov: Optional[Union[str, dict[str, str]]] = None,
+    weights: Union[None, str] = None,
+    ssc: dict[str, Union[str, bool]] = ssc(),
+    collin_tol: float = 1e-10,
+    weights_type: str = "aweights",
+    solver: str = "np.linalg.solve",
+    batch_size: int = 1_000_000,
+) -> FeolsStream:
+    """
+    Estimate a linear regression model with fixed effects on data in chunks.
+
+    `feols_stream()` never holds the full data set in memory. It reads the data
+    chunk by chunk, e.g. the record batches of one or multiple parquet files,
+    and accumulates the sufficient statistics of the model: X'WX, X'Wy, y'Wy and,
+    for each fixed effect, the within-group sums of the dependent variable and
+    covariates. The fixed effects are then partialled out exactly. This makes it
+    possible to fit models on data sets that are larger than memory.
+
+    Parameters
+    ----------
+    fml : str
+        A two-sided formula string using fixest formula syntax, i.e.
+        "Y ~ X1 + X2 | FE1 + FE2". Multiple estimation syntax and IV
+        estimation are not supported.
+
+    data : StreamSourceType
+        The data source. One of
+        - a path or a list of paths to parquet files (requires pyarrow),
+        - a pyarrow Table or Dataset,
+        - a pandas or polars DataFrame,
+        - a list or tuple of chunks,
+        - a function without arguments returning an iterable of chunks,
+        - an iterator of chunks.
+        Chunks are pandas or polars DataFrames or pyarrow RecordBatches. For
+        paths, pyarrow objects and data frames, only the columns required by
+        the model are read. Iterators can only be consumed once and hence only
+        support iid inference.
+
+    vcov : Union[str, dict[str, str]]
+        Type of variance-covariance matrix for inference. Options include "iid",
+        "hetero", "HC1" and a dictionary {"CRV1": "clustervar"} for one-way
+        clustered inference. Heteroskedasticity-robust and clustered inference
+        require a second pass over the data. Defaults to "iid" without fixed
+        effects and to CRV1 clustered by the first fixed effect otherwise.
+
+    weights : Union[None, str], optional.
+        Default is None. Weights for WLS estimation. If None, all observations
+        are weighted equally. If a string, the name of the column in `data` that
+        contains the weights.
+
+    ssc : dict[str, Union[str, bool]]
+        A ssc object specifying the small sample correction for inference.
+
+    collin_tol : float, optional
+        Tolerance for collinearity check, by default 1e-10.
+
+    weights_type: str, optional
+        Options include `aweights` or `fweights`. `aweights` implement analytic or
+        precision weights, while `fweights` implement frequency weights.
+
+    solver : str, optional.
+        The solver to use for the regression. Can be either "np.linalg.solve" or
+        "np.linalg.lstsq". Defaults to "np.linalg.solve".
+
+    batch_size : int, optional
+        The number of rows per chunk for paths, pyarrow objects and data frames.
+        Defaults to 1_000_000.
+
+    Returns
+    -------
+    FeolsStream
+        An instance of the `FeolsStream` class, a `Feols` model that supports
+        `summary()`, `tidy()`, `etable()` and post-estimation `vcov()`, but not
+        methods that require the data, such as `predict()` or `fixef()`.
+
+    Notes
+    -----
+    The cost of partialling out the fixed effects is linear in the number of
+    levels of the fixed effect with the most levels, but cubic in the sum of the
+    levels of all other fixed effects. Second and higher fixed effects should
+    hence have a low to moderate number of levels. Unlike `feols()`, singleton
+    fixed effects are not dropped.
+
+    Examples
+    --------
+    ```{python}
+    import pyfixest as pf
+
+    data = pf.get_data()
+    chunks = [data.iloc[:500], data.iloc[500:]]
+
+    fit = pf.feols_stream("Y ~ X1 | f1 + f2", chunks, vcov="hetero")
+    fit.summary()
+    ```
+
+    Parquet files can be read directly, e.g. via
+    `pf.feols_stream("Y ~ X1 | f1", "data/*.parquet")` for a directory or a list
+    of files.
+    """
+    if not isinstance(fml, str):
+        raise TypeError("fml must be a string")
+    if not isinstance(vcov, (str, dict, type(None))):
+        raise TypeError("vcov must be a string, dictionary, or None")
+    if not isinstance(collin_tol, float):
+        raise TypeError("collin_tol must be a float")
+    if collin_tol <= 0 or collin_tol >= 1:
+        raise ValueError("collin_tol must be between zero and one")
+    if not (isinstance(weights, str) or weights is None):
+        raise ValueError(
+            f"weights must be a string or None but you provided weights = {weights}."
+        )
+    if weights_type not in ["aweights", "fweights"]:
+        raise ValueError(
+            f"The `weights_type` argument must be of type `aweights` or `fweights` but it is {weights_type}."
+        )
+    if not isinstance(batch_size, int) or isinstance(batch_size, bool):
+        raise TypeError("The function argument `batch_size` must be of type int.")
+    if batch_size <= 0:
+        raise ValueError(
+            "The function argument `batch_size` must be strictly positive."
+        )
+
+    FML = FixestFormulaParser(fml)
+    FML.set_fixest_multi_flag()
+    if FML._is_multiple_estimation:
+        raise NotImplementedError(
+            "Multiple estimation syntax is not supported by `feols_stream()`."
+        )
+    if FML.is_iv:
+        raise NotImplementedError("IV estimation is not supported by `feols_stream()`.")
+    fixest_formula = next(iter(FML.FixestFormulaDict.values()))[0]
+
+    fit = FeolsStream(
+        FixestFormula=fixest_formula,
+        source=_StreamSource(data, batch_size=batch_size),
+        ssc_dict=ssc,
+        weights=weights,
+        weights_type=weights_type,
+        collin_tol=collin_tol,
+        solver=solver,
+    )
+    fit.prepare_model_matrix()
+    fit.drop_multicol_vars()
+    fit.get_fit()
+    fit.vcov(_get_vcov_type(vcov, fixest_formula._fval))
+    fit.get_performance()
+    fit._model_name = fixest_formula.fml
+
+    return fit
+
+
 def _estimation_input_checks(
     fml: str,
-    data: DataFrameType,
+    data: DataInputType,
     vcov: Optional[Union[str, dict[str, str]]],
     weights: Union[None, str],
     ssc: dict[str, Union[str, bool]],
@@ -633,6 +1284,13 @@ def _estimation_input_checks(
     split: Optional[str],
     fsplit: Optional[str],
     separation_check: Optional[list[str]] = None,
+    demeaner: str = "map",
+    fixef_sort: bool = False,
+    fixef_index: Optional[FixedEffectsIndex] = None,
+    dtype: str = "float64",
+    n_jobs: int = 1,
+    executor: str = "threads",
+    demean_cache: Optional[DemeanCache] = None,
 ):
     if not isinstance(fml, str):
         raise TypeError("fml must be a string")
@@ -640,10 +1298,15 @@ def _estimation_input_checks(
         try:
             import polars as pl
 
-            if not isinstance(data, pl.DataFrame):
-                raise TypeError("data must be a pandas or polars dataframe")
+            if not (
+                isinstance(data, (pl.DataFrame, pl.LazyFrame)) or _is_arrow_table(data)
+            ):
+                raise TypeError(
+                    "data must be a pandas or polars dataframe or a pyarrow Table"
+                )
         except ImportError:
             raise TypeError("data must be a pandas or polars dataframe")
+    columns = _get_column_names(data)
     if not isinstance(vcov, (str, dict, type(None))):
         raise TypeError("vcov must be a string, dictionary, or None")
     if not isinstance(fixef_rm, str):
@@ -663,9 +1326,9 @@ def _estimation_input_checks(
             f"weights must be a string or None but you provided weights = {weights}."
         )
     if weights is not None:
-        assert weights in data.columns, "weights must be a column in data"
+        assert weights in columns, "weights must be a column in data"
 
-    bool_args = [copy_data, store_data, lean]
+    bool_args = [copy_data, store_data, lean, fixef_sort]
     for arg in bool_args:
         if not isinstance(arg, bool):
             raise TypeError(f"The function argument {arg} must be of type bool.")
@@ -729,10 +1392,10 @@ def _estimation_input_checks(
                         split is specified as {split}, while fsplit is specified as {fsplit}.
                         """)
 
-    if isinstance(split, str) and split not in data.columns:
+    if isinstance(split, str) and split not in columns:
         raise KeyError(f"Column '{split}' not found in data.")
 
-    if isinstance(fsplit, str) and fsplit not in data.columns:
+    if isinstance(fsplit, str) and fsplit not in columns:
         raise KeyError(f"Column '{fsplit}' not found in data.")
 
     if separation_check is not None:
@@ -745,3 +1408,43 @@ def _estimation_input_checks(
             raise ValueError(
                 "The function argument `separation_check` must be a list of strings containing 'fe' and/or 'ir'."
             )
+
+    if demeaner not in ["map", "irons_tuck"]:
+        raise ValueError(
+            f"The function argument `demeaner` must be either 'map' or 'irons_tuck' but it is {demeaner}."
+        )
+
+    if fixef_index is not None:
+        if not isinstance(fixef_index, FixedEffectsIndex):
+            raise TypeError(
+                "The function argument `fixef_index` must be of type FixedEffectsIndex."
+            )
+        # the rows of a LazyFrame are only known once collected, see Feols
+        if hasattr(data, "shape") and fixef_index.n_obs != data.shape[0]:
+            raise ValueError(
+                f"""
+                The `fixef_index` was built from a data set with {fixef_index.n_obs}
+                rows, but `data` has {data.shape[0]} rows.
+                """
+            )
+
+    if demean_cache is not None and not isinstance(demean_cache, DemeanCache):
+        raise TypeError(
+            "The function argument `demean_cache` must be of type DemeanCache."
+        )
+
+    if not isinstance(n_jobs, int) or isinstance(n_jobs, bool):
+        raise TypeError("The function argument `n_jobs` must be of type int.")
+    if n_jobs == 0 or n_jobs < -1:
+        raise ValueError(
+            "The function argument `n_jobs` must be a positive integer or -1."
+        )
+    if dtype not in ["float64", "float32"]:
+        raise ValueError(
+            f"The function argument `dtype` must be either 'float64' or 'float32' but it is {dtype}."
+        )
+
+    if executor not in ["threads", "processes"]:
+        raise ValueError(
+            f"The function argument `executor` must be either 'threads' or 'processes' but it is {executor}."
+        )
@@ -0,0 +1,101 @@
+from typing import Optional, Union
+
+import pandas as pd
+
+from pyfixest.estimation.demean_cache_ import DemeanCache
+from pyfixest.estimation.fepois_ import Fepois
+from pyfixest.estimation.fixef_index_ import FixedEffectsIndex
+from pyfixest.estimation.FormulaParser import FixestFormula
+from pyfixest.estimation.glm_family_ import NegativeBinomial, _get_family
+
+
+class Feglm(Fepois):
+    """
+    Estimate a generalized linear model.
+
+    Non user-facing class to estimate a generalized linear model with high
+    dimensional fixed effects via Iterated Weighted Least Squares (IWLS), as
+    for Poisson regression. The family of the model defines the link, variance
+    function and deviance of the IWLS algorithm, see `GLMFamily`.
+
+    Inherits from the Fepois class. Users should not directly instantiate this
+    class, but rather use the [feglm()](/reference/estimation.feglm.qmd)
+    function.
+
+    Attributes
+    ----------
+    family : str
+        The family of the model. One of "poisson", "logit", "probit", "negbin"
+        or "gamma".
+    theta : Optional[float]
+        The estimated shape parameter of the negative binomial family, None
+        for all other families.
+
+    See `Fepois` for all other attributes.
+    """
+
+    def __init__(
+        self,
+        FixestFormula: FixestFormula,
+        data: pd.DataFrame,
+        ssc_dict: dict[str, Union[str, bool]],
+        drop_singletons: bool,
+        drop_intercept: bool,
+        weights: Optional[str],
+        weights_type: Optional[str],
+        collin_tol: float,
+        fixef_tol: float,
+        demean_cache: Optional[DemeanCache],
+        tol: float,
+        maxiter: int,
+        family: str,
+        solver: str = "np.linalg.solve",
+        store_data: bool = True,
+        copy_data: bool = True,
+        lean: bool = False,
+        sample_split_var: Optional[str] = None,
+        sample_split_value: Optional[Union[str, int]] = None,
+        separation_check: Optional[list[str]] = None,
+        demeaner: str = "map",
+        fixef_sort: bool = False,
+        fixef_index: Optional[FixedEffectsIndex] = None,
+    ):
+        super().__init__(
+            FixestFormula,
+            data,
+            ssc_dict,
+            drop_singletons,
+            drop_intercept,
+            weights,
+            weights_type,
+            collin_tol,
+            fixef_tol,
+            demean_cache,
+            tol,
+            maxiter,
+            solver,
+            store_data,
+            copy_data,
+            lean,
+            sample_split_var,
+            sample_split_value,
+            separation_check=separation_check,
+            demeaner=demeaner,
+            fixef_sort=fixef_sort,
+            fixef_index=fixef_index,
+        )
+
+        self._family = _get_family(family)
+        self._method = "feglm"
+        self.family = family
+        self.theta: Optional[float] = None
+
+        # the native wild bootstrap is only implemented for linear models
+        self._supports_wildboottest = False
+
+    def get_fit(self) -> None:
+        "Fit the generalized linear model via IWLS, see `Fepois.get_fit()`."
+        super().get_fit()
+
+        if isinstance(self._family, NegativeBinomial):
+            self.theta = self._family.theta
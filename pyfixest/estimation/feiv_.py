@@ -6,7 +6,14 @@ import numpy as np
 import pandas as pd
 
 from pyfixest.estimation.demean_ import demean_model
-from pyfixest.estimation.feols_ import Feols, _drop_multicollinear_variables
+from pyfixest.estimation.demean_cache_ import DemeanCache
+from pyfixest.estimation.feols_ import (
+    Feols,
+    _crossprod,
+    _drop_multicollinear_variables,
+    _matvec,
+)
+from pyfixest.estimation.fixef_index_ import FixedEffectsIndex
 from pyfixest.estimation.FormulaParser import FixestFormula
 
 
@@ -40,6 +47,14 @@ class Feiv(Feols):
         Tolerance for collinearity check.
     solver: str, default is 'np.linalg.solve'
         Solver to use for the estimation. Alternative is 'np.linalg.lstsq'.
+    demeaner: str, default is 'map'
+        Demeaning algorithm. Alternative is 'irons_tuck'.
+    fixef_sort: bool, default is False
+        Whether to sort the observations by fixed effect groups for demeaning.
+    fixef_index: Optional[FixedEffectsIndex]
+        A precomputed index of the fixed effects of the estimation sample.
+    dtype: str, default is 'float64'
+        Floating point type of the model matrices. Alternative is 'float32'.
     weights_name : Optional[str]
         Name of the weights variable.
     weights_type : Optional[str]
@@ -138,13 +153,17 @@ class Feiv(Feols):
         weights_type: Optional[str],
         collin_tol: float,
         fixef_tol: float,
-        lookup_demeaned_data: dict[str, pd.DataFrame],
+        demean_cache: Optional[DemeanCache],
         solver: str = "np.linalg.solve",
         store_data: bool = True,
         copy_data: bool = True,
         lean: bool = False,
         sample_split_var: Optional[str] = None,
         sample_split_value: Optional[Union[str, int]] = None,
+        demeaner: str = "map",
+        fixef_sort: bool = False,
+        fixef_index: Optional[FixedEffectsIndex] = None,
+        dtype: str = "float64",
     ) -> None:
         super().__init__(
             FixestFormula,
@@ -156,13 +175,17 @@ class Feiv(Feols):
             weights_type,
             collin_tol,
             fixef_tol,
-            lookup_demeaned_data,
+            demean_cache,
             solver,
             store_data,
             copy_data,
             lean,
             sample_split_var,
             sample_split_value,
+            demeaner=demeaner,
+            fixef_sort=fixef_sort,
+            fixef_index=fixef_index,
+            dtype=dtype,
         )
 
         self._is_iv = True
@@ -174,7 +197,7 @@ class Feiv(Feols):
         "Transform variables for WLS estimation."
         super().wls_transform()
         if self._has_weights:
-            w = np.sqrt(self._weights)
+            w = np.sqrt(self._weights).astype(self._Z.dtype, copy=False)
             self._endogvar = self._endogvar * w
             self._Z = self._Z * w
 
@@ -188,15 +211,19 @@ class Feiv(Feols):
         "Demean instruments and endogeneous variable."
         super().demean()
         if self._has_fixef:
-            self._endogvard, self._Zd = demean_model(
+            self._endogvard, self._Zd, n_iter = demean_model(
                 self._endogvar,
                 self._Z,
                 self._fe,
                 self._weights.flatten(),
-                self._lookup_demeaned_data,
-                self._na_index_str,
+                self._demean_cache,
                 self._fixef_tol,
+                self._demeaner,
+                self._get_group_weights(),
+                self._fixef_sort,
             )
+            n_iter = n_iter[~n_iter.index.isin(self._demean_iterations.index)]
+            self._demean_iterations = pd.concat([self._demean_iterations, n_iter])
         else:
             self._endogvard = self._endogvar
             self._Zd = self._Z
@@ -220,10 +247,11 @@ class Feiv(Feols):
         _solver = self._solver
 
         # Start Second Stage
-        self._tZX = _Z.T @ _X
-        self._tXZ = _X.T @ _Z
-        self._tZy = _Z.T @ _Y
-        self._tZZinv = np.linalg.inv(_Z.T @ _Z)
+        self._tZX = _crossprod(_Z, _X)
+        self._tXZ = _crossprod(_X, _Z)
+        self._tZy = _crossprod(_Z, _Y)
+        tZZ = _crossprod(_Z, _Z)
+        self._tZZinv = np.linalg.inv(tZZ)
 
         H = self._tXZ @ self._tZZinv
         A = H @ self._tZX
@@ -231,12 +259,11 @@ class Feiv(Feols):
         self._beta_hat = self.solve_ols(A, B, _solver)
 
         # Predicted values and residuals
-        self._Y_hat_link = self._X @ self._beta_hat
+        self._Y_hat_link = _matvec(self._X, self._beta_hat)
         self._u_hat = self._Y.flatten() - self._Y_hat_link.flatten()
 
-        # Compute scores and hessian
-        self._scores = self._Z * self._u_hat[:, None]
-        self._hessian = self._Z.T @ self._Z
+        # Compute hessian
+        self._hessian = tZZ
 
         # Compute bread matrix
         D = np.linalg.inv(self._tXZ @ self._tZZinv @ self._tZX)
@@ -255,11 +282,16 @@ class Feiv(Feols):
             fml_first_stage += f" | {self._fixef}"
 
         # Type hint to reflect that vcov_detail can be either a dict or a str
-        vcov_detail: Union[dict[str, str], str]
+        vcov_detail: Union[dict[str, Union[str, float]], str]
 
         if self._is_clustered:
             a = self._clustervar[0]
             vcov_detail = {self._vcov_type_detail: a}
+        elif self._vcov_type == "HAC":
+            vcov_detail = {
+                self._vcov_type_detail: "+".join(self._hacvar),
+                **self._hac_options,
+            }
         else:
             vcov_detail = self._vcov_type_detail
 
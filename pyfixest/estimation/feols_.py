@@ -2,6 +2,7 @@ import functools
 import gc
 import warnings
 from importlib import import_module
+from numbers import Integral
 from typing import Optional, Union
 
 import numba as nb
@@ -13,7 +14,9 @@ from scipy.sparse.linalg import lsqr
 from scipy.stats import chi2, f, norm, t
 
 from pyfixest.errors import VcovTypeNotSupportedError
-from pyfixest.estimation.demean_ import demean_model
+from pyfixest.estimation.demean_ import _demean_array, demean_model
+from pyfixest.estimation.demean_cache_ import DemeanCache
+from pyfixest.estimation.fixef_index_ import FixedEffectsIndex
 from pyfixest.estimation.FormulaParser import FixestFormula
 from pyfixest.estimation.model_matrix_fixest_ import model_matrix_fixest
 from pyfixest.estimation.ritest import (
@@ -26,10 +29,22 @@ from pyfixest.estimation.ritest import (
 from pyfixest.estimation.vcov_utils import (
     _check_cluster_df,
     _compute_bread,
+    _conley_meat,
     _count_G_for_ssc_correction,
     _crv1_meat_loop,
+    _crv3_jackknife_loop,
+    _dk_meat,
+    _fixef_leverage,
     _get_cluster_df,
-    _prepare_twoway_clustering,
+    _hac_default_lag,
+    _hac_time_col,
+    _leverage,
+    _nw_meat,
+    _prepare_multiway_clustering,
+)
+from pyfixest.estimation.wildboottest_ import (
+    _wildboottest_many,
+    _wildboottest_problem,
 )
 from pyfixest.utils.dev_utils import (
     DataFrameType,
@@ -71,6 +86,19 @@ class Feols:
     solver : str, optional.
         The solver to use for the regression. Can be either "np.linalg.solve" or
         "np.linalg.lstsq". Defaults to "np.linalg.solve".
+    demeaner : str, optional.
+        The algorithm used to demean the model matrices by the fixed effects.
+        Either "map" (alternating projections) or "irons_tuck" (alternating
+        projections with Irons-Tuck acceleration). Defaults to "map".
+    fixef_sort : bool, optional.
+        Whether to sort the observations by the groups of the fixed effect with
+        the most levels before demeaning. Defaults to False.
+    dtype : str, optional.
+        The floating point type of the model matrices. Either "float64" (the
+        default) or "float32". See `feols()` for details.
+    fixef_index : FixedEffectsIndex, optional.
+        A precomputed index of the fixed effects of the estimation sample, i.e.
+        of the rows of `data` selected by the sample split. Defaults to None.
 
     Attributes
     ----------
@@ -97,6 +125,17 @@ class Feols:
         Alias for the _X array, used for calculations.
     _solver: str
         The solver used for the regression.
+    _demeaner: str
+        The algorithm used for demeaning.
+    _fixef_sort: bool
+        Whether the observations are sorted by fixed effect groups for demeaning.
+    _dtype: str
+        The floating point type of the model matrices.
+    _demean_iterations: pd.Series
+        The number of sweeps over all fixed effects the demeaning algorithm
+        needed to converge, per demeaned column. Set in demean().
+    _fixef_index: Optional[FixedEffectsIndex]
+        The precomputed index of the fixed effects, if any.
     _weights : np.ndarray
         Array of weights for each observation.
     _N : int
@@ -134,7 +173,7 @@ class Feols:
     _u_hat : np.ndarray
         Residuals of the regression model.
     _scores : np.ndarray
-        Scores used in the regression analysis.
+        Scores used in the regression analysis. Computed on access.
     _hessian : np.ndarray
         Hessian matrix used in the regression.
     _bread : np.ndarray
@@ -147,6 +186,10 @@ class Feols:
         Indicates if clustering is used in the variance-covariance calculation.
     _clustervar : Any
         Variable used for clustering in the variance-covariance calculation.
+    _hacvar : list[str]
+        Time (and unit) or coordinate variables used for HAC inference.
+    _hac_options : dict[str, float]
+        Number of lags or distance cutoff used for HAC inference.
     _G : Any
         Group information used in clustering.
     _ssc : Any
@@ -196,13 +239,17 @@ class Feols:
         weights_type: Optional[str],
         collin_tol: float,
         fixef_tol: float,
-        lookup_demeaned_data: dict[str, pd.DataFrame],
+        demean_cache: Optional[DemeanCache],
         solver: str = "np.linalg.solve",
         store_data: bool = True,
         copy_data: bool = True,
         lean: bool = False,
         sample_split_var: Optional[str] = None,
         sample_split_value: Optional[Union[str, int, float]] = None,
+        demeaner: str = "map",
+        fixef_sort: bool = False,
+        fixef_index: Optional[FixedEffectsIndex] = None,
+        dtype: str = "float64",
     ) -> None:
         self._sample_split_value = sample_split_value
         self._sample_split_var = sample_split_var
@@ -211,13 +258,22 @@ class Feols:
         self._is_iv = False
         self.FixestFormula = FixestFormula
 
-        if sample_split_value == "all":
-            data_split = data.copy()
-        else:
-            data_split = data[data[sample_split_var] == sample_split_value].copy()
-        data_split.reset_index(drop=True, inplace=True)  # set index to 0:N
+        # `data` is shared by all models of a `FixestMulti` and must not be
+        # modified; methods that drop rows or add columns return new frames
+        data_split = data
+        if sample_split_value != "all":
+            in_split = data[sample_split_var] == sample_split_value
+            if not in_split.all():
+                data_split = data[in_split]
+        if not data_split.index.equals(pd.RangeIndex(data_split.shape[0])):
+            data_split = data_split.reset_index(drop=True)  # set index to 0:N
+
+        if fixef_index is not None and fixef_index.n_obs != data_split.shape[0]:
+            raise ValueError(
+                "The `fixef_index` must have as many rows as the estimation sample."
+            )
 
-        self._data = data_split.copy() if copy_data else data_split
+        self._data = data_split
         self._ssc_dict = ssc_dict
         self._drop_singletons = drop_singletons
         self._drop_intercept = drop_intercept
@@ -227,19 +283,20 @@ class Feols:
         self._collin_tol = collin_tol
         self._fixef_tol = fixef_tol
         self._solver = solver
-        self._lookup_demeaned_data = lookup_demeaned_data
+        self._demeaner = demeaner
+        self._fixef_sort = fixef_sort
+        self._dtype = dtype
+        self._demean_iterations = pd.Series(dtype=np.int64)
+        self._fixef_index = fixef_index
+        self._demean_cache = demean_cache
         self._store_data = store_data
         self._copy_data = copy_data
         self._lean = lean
         self._use_mundlak = False
 
         self._support_crv3_inference = True
-        if self._weights_name is not None:
-            self._supports_wildboottest = False
-        self._supports_wildboottest = True
+        self._supports_wildboottest = not self._is_iv
         self._supports_cluster_causal_variance = True
-        if self._has_weights or self._is_iv:
-            self._supports_wildboottest = False
 
         # attributes that have to be enriched outside of the class -
         # not really optimal code change later
@@ -259,7 +316,6 @@ class Feols:
         self._Y_hat_link = np.array([])
         self._Y_hat_response = np.array([])
         self._u_hat = np.array([])
-        self._scores = np.array([])
         self._hessian = np.array([])
         self._bread = np.array([])
 
@@ -268,9 +324,13 @@ class Feols:
         self._vcov_type_detail = ""
         self._is_clustered = False
         self._clustervar: list[str] = []
+        self._hacvar: list[str] = []
+        self._hac_options: dict[str, float] = {}
         self._G: list[int] = []
         self._ssc = np.array([], dtype=np.float64)
         self._vcov = np.array([])
+        # integer codes of the cluster variables, shared by vcov_many()
+        self._cluster_codes: Optional[dict] = None
         self.na_index = np.array([])  # initiated outside of the class
         self.n_separation_na = 0
 
@@ -295,7 +355,7 @@ class Feols:
         self._adj_r2_within = np.nan
 
         # special for poisson
-        self.deviance = None
+        self.deviance: Optional[np.ndarray] = None
 
         # set functions inherited from other modules
         _module = import_module("pyfixest.report")
@@ -317,6 +377,8 @@ class Feols:
             drop_singletons=self._drop_singletons,
             drop_intercept=self._drop_intercept,
             weights=self._weights_name,
+            fixef_index=self._fixef_index,
+            dtype=self._dtype,
         )
 
         self._Y = mm_dict.get("Y")
@@ -384,18 +446,40 @@ class Feols:
     def demean(self):
         "Demean the dependent variable and covariates by the fixed effect(s)."
         if self._has_fixef:
-            self._Yd, self._Xd = demean_model(
+            self._Yd, self._Xd, self._demean_iterations = demean_model(
                 self._Y,
                 self._X,
                 self._fe,
                 self._weights.flatten(),
-                self._lookup_demeaned_data,
-                self._na_index_str,
+                self._demean_cache,
                 self._fixef_tol,
+                self._demeaner,
+                self._get_group_weights(),
+                self._fixef_sort,
             )
         else:
             self._Yd, self._Xd = self._Y, self._X
 
+    def _get_group_weights(self) -> Optional[np.ndarray]:
+        """
+        Fetch the group weights for demeaning from the fixed effects index.
+
+        Only possible for unweighted models that use all rows of the index.
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            The group weights of the model's fixed effects, or None.
+        """
+        if (
+            self._fixef_index is None
+            or self._has_weights
+            or self._N_rows != self._fixef_index.n_obs
+        ):
+            return None
+
+        return self._fixef_index.group_weights(self._fe.columns.tolist())
+
     def to_array(self):
         "Convert estimation data frames to np arrays."
         self._Y, self._X = (
@@ -407,7 +491,7 @@ class Feols:
         "Transform model matrices for WLS Estimation."
         self._X_untransformed = self._X.copy()
         if self._has_weights:
-            w = np.sqrt(self._weights)
+            w = np.sqrt(self._weights).astype(self._X.dtype, copy=False)
             self._Y = self._Y * w
             self._X = self._X * w
 
@@ -467,21 +551,30 @@ class Feols:
             self._Z = self._X
             _Z = self._Z
             _solver = self._solver
-            self._tZX = _Z.T @ _X
-            self._tZy = _Z.T @ _Y
+            self._tZX = _crossprod(_Z, _X)
+            self._tZy = _crossprod(_Z, _Y)
 
             self._beta_hat = self.solve_ols(self._tZX, self._tZy, _solver)
 
-            self._Y_hat_link = self._X @ self._beta_hat
+            self._Y_hat_link = _matvec(self._X, self._beta_hat)
             self._u_hat = self._Y.flatten() - self._Y_hat_link.flatten()
 
-            self._scores = _X * self._u_hat[:, None]
             self._hessian = self._tZX.copy()
 
             # IV attributes, set to None for OLS, Poisson
             self._tXZ = np.array([])
             self._tZZinv = np.array([])
 
+    @property
+    def _scores(self) -> np.ndarray:
+        """
+        The scores `_Z * _u_hat` of shape (N, k).
+
+        Not stored on the model, as the variance kernels work with `_Z` and
+        `_u_hat` directly. Computed on access.
+        """
+        return self._Z * self._u_hat.astype(self._Z.dtype, copy=False)[:, None]
+
     def vcov(
         self, vcov: Union[str, dict[str, str]], data: Optional[DataFrameType] = None
     ) -> "Feols":
@@ -496,8 +589,16 @@ class Feols:
             If a string, it can be one of "iid", "hetero", "HC1", "HC2", "HC3".
             If a dictionary, it should have the format {"CRV1": "clustervar"} for
             CRV1 inference or {"CRV3": "clustervar"}
-            for CRV3 inference. Note that CRV3 inference is currently not supported
-            for IV estimation.
+            for CRV3 inference. For multiway clustering, pass several cluster
+            variables as in {"CRV1": "clustervar1 + clustervar2 + clustervar3"}.
+            Note that CRV3 inference is currently not supported for IV estimation.
+            HAC inference is specified as {"NW": "unitvar + timevar"} for panel
+            Newey-West (or {"NW": "timevar"} for a single time series),
+            {"DK": "timevar"} for Driscoll-Kraay and
+            {"conley": "latvar + lonvar", "cutoff": 100} for Conley spatial
+            standard errors with a distance cutoff in kilometers. The number
+            of lags for "NW" and "DK" can be set via the "lag" key and defaults
+            to floor(T^(1/4)), with T the number of periods.
         data: Optional[DataFrameType], optional
             The data used for estimation. If None, tries to fetch the data from the
             model object. Defaults to None.
@@ -536,7 +637,17 @@ class Feols:
             self._vcov_type_detail,
             self._is_clustered,
             self._clustervar,
-        ) = _deparse_vcov_input(vcov, _has_fixef, _is_iv)
+        ) = _deparse_vcov_input(vcov, _is_iv)
+
+        if (
+            self._vcov_type_detail in ["HC2", "HC3"]
+            and _has_fixef
+            and (_method != "feols" or self._fe.shape[1] > 1)
+        ):
+            raise VcovTypeNotSupportedError(
+                "HC2 and HC3 inference types are only supported for OLS regressions "
+                "with at most one fixed effect."
+            )
 
         self._bread = _compute_bread(_is_iv, _tXZ, _tZZinv, _tZX, _hessian)
 
@@ -569,7 +680,11 @@ class Feols:
             self._vcov = self._ssc * self._vcov_hetero()
 
         elif self._vcov_type == "CRV":
-            if data is not None:
+            cluster_df_index = self._get_cluster_df_from_fixef_index(data)
+            if cluster_df_index is not None:
+                # integer coded cluster variables, no need to copy from data
+                self._cluster_df = cluster_df_index
+            elif data is not None:
                 # use input data set
                 self._cluster_df = _get_cluster_df(
                     data=data,
@@ -583,24 +698,22 @@ class Feols:
                 )
                 _check_cluster_df(cluster_df=self._cluster_df, data=self._data)
 
-            if self._cluster_df.shape[1] > 1:
-                self._cluster_df = _prepare_twoway_clustering(
-                    clustervar=self._clustervar, cluster_df=self._cluster_df
-                )
+            # integer coded cluster variables and, for multiway clustering,
+            # their intersections
+            self._cluster_df, vcov_sign_list = _prepare_multiway_clustering(
+                cluster_df=self._cluster_df, codes=self._cluster_codes
+            )
 
             self._G = _count_G_for_ssc_correction(
                 cluster_df=self._cluster_df, ssc_dict=_ssc_dict
             )
 
-            # loop over columns of cluster_df
-            vcov_sign_list = [1, 1, -1]
-
             self._vcov = np.zeros((self._k, self._k))
 
+            # loop over columns of cluster_df
             for x, col in enumerate(self._cluster_df.columns):
-                cluster_col_pd = self._cluster_df[col]
-                cluster_col, _ = pd.factorize(cluster_col_pd)
-                clustid = np.unique(cluster_col)
+                cluster_col = self._cluster_df[col].to_numpy()
+                clustid = np.arange(cluster_col.max() + 1)
 
                 ssc = get_ssc(
                     ssc_dict=_ssc_dict,
@@ -628,12 +741,14 @@ class Feols:
                             "CRV3 inference is not supported with IV regression."
                         )
 
-                    if (
-                        (_has_fixef is False)
-                        and (_method == "feols")
-                        and (_is_iv is False)
-                    ):
-                        self._vcov += self._ssc[x] * self._vcov_crv3_fast(
+                    if _method == "feols" and _is_iv is False:
+                        # leave-one-cluster-out fits from the demeaned model
+                        # matrices; no need to re-run `feols()` per cluster
+                        if not _has_fixef or self._fixef_nested_in_cluster(cluster_col):
+                            crv3_func = self._vcov_crv3_fast
+                        else:
+                            crv3_func = self._vcov_crv3_demean
+                        self._vcov += self._ssc[x] * crv3_func(
                             clustid=clustid, cluster_col=cluster_col
                         )
                     else:
@@ -641,11 +756,126 @@ class Feols:
                             clustid=clustid, cluster_col=cluster_col
                         )
 
+        elif self._vcov_type == "HAC":
+            self._hacvar, self._hac_options = _deparse_hac_input(vcov)  # type: ignore
+            hac_data = self._data if data is None else data
+            hac_df = _get_cluster_df(data=hac_data, clustervar=self._hacvar)
+            _check_cluster_df(cluster_df=hac_df, data=hac_data)
+
+            _vcov, G = self._vcov_hac(hac_df=hac_df)
+            self._G = [G]
+
+            self._ssc = get_ssc(
+                ssc_dict=_ssc_dict,
+                N=_N,
+                k=_k,
+                G=G,
+                vcov_sign=1,
+                vcov_type="CRV" if self._vcov_type_detail == "DK" else "hetero",
+            )
+
+            self._vcov = self._ssc * _vcov
+
         # update p-value, t-stat, standard error, confint
         self.get_inference()
 
         return self
 
+    def vcov_many(
+        self,
+        vcovs: list[Union[str, dict[str, str]]],
+        data: Optional[DataFrameType] = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Compute several covariance matrices for an estimated regression model.
+
+        The integer codes of the cluster variables (and of their intersections)
+        are computed once and shared by all covariance types. The inference of
+        the model itself is not changed.
+
+        Parameters
+        ----------
+        vcovs : list[Union[str, dict[str, str]]]
+            A list of covariance types, each in the format of the `vcov`
+            argument of `vcov()`.
+        data: Optional[DataFrameType], optional
+            The data used for estimation. If None, tries to fetch the data from the
+            model object. Defaults to None.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The covariance matrices, keyed by a label of the covariance type,
+            e.g. "hetero" or "CRV1: f1+f2".
+
+        Examples
+        --------
+        ```{python}
+        import pyfixest as pf
+
+        data = pf.get_data()
+        fit = pf.feols("Y ~ X1 | f1", data=data)
+        fit.vcov_many(["hetero", {"CRV1": "f1"}, {"CRV1": "f1 + f2"}])
+        ```
+        """
+        if isinstance(data, pl.DataFrame):
+            data = _polars_to_pandas(data)
+
+        state = {
+            attr: getattr(self, attr)
+            for attr in _VCOV_ATTRIBUTES
+            if hasattr(self, attr)
+        }
+
+        res = {}
+        self._cluster_codes = {}
+        try:
+            for vcov in vcovs:
+                self.vcov(vcov, data=data)
+                res[_vcov_label(vcov)] = self._vcov
+        finally:
+            self._cluster_codes = None
+            for attr, value in state.items():
+                setattr(self, attr, value)
+
+        return res
+
+    def _get_cluster_df_from_fixef_index(
+        self, data: Optional[pd.DataFrame]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch the cluster variables from the fixed effects index.
+
+        Only possible if all cluster variables are part of the index, the
+        estimation data is used and the cluster variables have no missing values.
+
+        Parameters
+        ----------
+        data : Optional[pd.DataFrame]
+            The data passed to `vcov()`.
+
+        Returns
+        -------
+        Optional[pd.DataFrame]
+            The integer coded cluster variables, or None.
+        """
+        _fixef_index = self._fixef_index
+        if (
+            _fixef_index is None
+            or (data is not None and data is not self._data)
+            or self._data.empty
+            or not all(x in _fixef_index.names for x in self._clustervar)
+        ):
+            return None
+
+        codes = _fixef_index.get_codes(
+            self._clustervar, rows=self._data.index.to_numpy()
+        )
+        if np.any(codes < 0):
+            return None
+
+        return pd.DataFrame(codes, columns=self._clustervar, index=self._data.index)
+
     def _vcov_iid(self):
         _N = self._N
         _u_hat = self._u_hat
@@ -654,15 +884,16 @@ class Feols:
 
         if _method == "feols":
             sigma2 = np.sum(_u_hat.flatten() ** 2) / (_N - 1)
-        elif _method == "fepois":
-            sigma2 = 1
+        elif _method in ["fepois", "feglm"]:
+            sigma2 = self._dispersion
 
         _vcov = _bread * sigma2
 
         return _vcov
 
     def _vcov_hetero(self):
-        _scores = self._scores
+        _Z = self._Z
+        _u_hat = self._u_hat
         _vcov_type_detail = self._vcov_type_detail
         _tXZ = self._tXZ
         _tZZinv = self._tZZinv
@@ -671,23 +902,88 @@ class Feols:
         _is_iv = self._is_iv
         _bread = self._bread
 
+        # Omega = sum_i w_i * Z_i'Z_i, without forming the scores Z_i * u_i
+        u_hat_sq = _u_hat.flatten().astype(np.float64) ** 2
         if _vcov_type_detail in ["hetero", "HC1"]:
-            transformed_scores = _scores
+            omega_weights = u_hat_sq
         elif _vcov_type_detail in ["HC2", "HC3"]:
-            leverage = np.sum(_X * (_X @ np.linalg.inv(_tZX)), axis=1)
-            transformed_scores = (
-                _scores / np.sqrt(1 - leverage)[:, None]
+            leverage = _leverage(_X, _tZX)
+            if self._has_fixef:
+                # the leverage of the (one-way) fixed effects projection adds to
+                # the leverage of the demeaned covariates
+                leverage += _fixef_leverage(
+                    fe=np.asarray(self._fe).reshape(-1),
+                    weights=self._weights.flatten(),
+                )
+            omega_weights = (
+                u_hat_sq / (1 - leverage)
                 if _vcov_type_detail == "HC2"
-                else _scores / (1 - leverage)[:, None]
+                else u_hat_sq / (1 - leverage) ** 2
             )
 
-        Omega = transformed_scores.T @ transformed_scores
+        Omega = _weighted_crossprod(_Z, omega_weights)
 
         _meat = _tXZ @ _tZZinv @ Omega @ _tZZinv @ _tZX if _is_iv else Omega
         _vcov = _bread @ _meat @ _bread
 
         return _vcov
 
+    def _vcov_hac(self, hac_df: pd.DataFrame) -> tuple[np.ndarray, int]:
+        """
+        Compute the NW, DK or conley HAC variance matrix.
+
+        Returns the variance matrix, without small sample correction, and the
+        number of groups used for the small sample correction: the number of
+        periods for "DK" and the number of observations otherwise.
+        """
+        _Z = self._Z
+        _is_iv = self._is_iv
+        _tXZ = self._tXZ
+        _tZZinv = self._tZZinv
+        _tZX = self._tZX
+        _bread = self._bread
+        _vcov_type_detail = self._vcov_type_detail
+
+        weighted_uhat = self._u_hat.flatten().astype(np.float64)
+        G = self._N
+
+        if _vcov_type_detail in ["NW", "DK"]:
+            # lags are differences of the time variable, not of its ranks
+            time_col = _hac_time_col(hac_df.iloc[:, -1])
+            n_periods = np.unique(time_col).size
+            lag = self._hac_options.get("lag", _hac_default_lag(n_periods))
+            if _vcov_type_detail == "NW":
+                unit_col = (
+                    pd.factorize(hac_df.iloc[:, 0])[0]
+                    if hac_df.shape[1] == 2
+                    else np.zeros(time_col.size, dtype=time_col.dtype)
+                )
+                meat = _nw_meat(
+                    _Z=_Z,
+                    weighted_uhat=weighted_uhat,
+                    unit_col=unit_col,
+                    time_col=time_col,
+                    lag=int(lag),
+                )
+            else:
+                meat = _dk_meat(
+                    _Z=_Z, weighted_uhat=weighted_uhat, time_col=time_col, lag=int(lag)
+                )
+                G = n_periods
+        else:
+            meat = _conley_meat(
+                _Z=_Z,
+                weighted_uhat=weighted_uhat,
+                lat=hac_df.iloc[:, 0].to_numpy(dtype=np.float64),
+                lon=hac_df.iloc[:, 1].to_numpy(dtype=np.float64),
+                cutoff=float(self._hac_options["cutoff"]),
+            )
+
+        if _is_iv:
+            meat = _tXZ @ _tZZinv @ meat @ _tZZinv @ _tZX
+
+        return _bread @ meat @ _bread, G
+
     def _vcov_crv1(self, clustid: np.ndarray, cluster_col: np.ndarray):
         _Z = self._Z
         _u_hat = self._u_hat
@@ -705,7 +1001,7 @@ class Feols:
         weighted_uhat = _u_hat.reshape(-1, 1) if _u_hat.ndim == 1 else _u_hat
 
         meat = _crv1_meat_loop(
-            _Z=_Z.astype(np.float64),
+            _Z=_Z,
             weighted_uhat=weighted_uhat.astype(np.float64),
             clustid=clustid,
             cluster_col=cluster_col,
@@ -720,26 +1016,20 @@ class Feols:
         return _vcov
 
     def _vcov_crv3_fast(self, clustid, cluster_col):
-        _k = self._k
-        _Y = self._Y
         _X = self._X
-        _beta_hat = self._beta_hat
-
-        beta_jack = np.zeros((len(clustid), _k))
-
-        # inverse hessian precomputed?
-        tXX = np.transpose(_X) @ _X
-        tXy = np.transpose(_X) @ _Y
+        _Y = self._Y
+        _u_hat = self._u_hat
 
-        # compute leave-one-out regression coefficients (aka clusterjacks')  # noqa: W505
-        for ixg, g in enumerate(clustid):
-            Xg = _X[np.equal(g, cluster_col)]
-            Yg = _Y[np.equal(g, cluster_col)]
-            tXgXg = np.transpose(Xg) @ Xg
-            # jackknife regression coefficient
-            beta_jack[ixg, :] = (
-                np.linalg.pinv(tXX - tXgXg) @ (tXy - np.transpose(Xg) @ Yg)
-            ).flatten()
+        # leave-one-out regression coefficients (aka clusterjacks') minus the
+        # full sample coefficients, via rank updates of X'X
+        beta_centered = _crv3_jackknife_loop(
+            X=_X,
+            u_hat=_u_hat.flatten().astype(np.float64),
+            cluster_col=cluster_col,
+            tXX=_crossprod(_X, _X),
+            tXy=_crossprod(_X, _Y).flatten(),
+            beta_hat=self._beta_hat.flatten().astype(np.float64),
+        )[clustid]
 
         # optional: beta_bar in MNW (2022)
         # center = "estimate"
@@ -747,14 +1037,87 @@ class Feols:
         #    beta_center = beta_hat
         # else:
         #    beta_center = np.mean(beta_jack, axis = 0)
-        beta_center = _beta_hat
+        _vcov = beta_centered.T @ beta_centered
 
-        vcov_mat = np.zeros((_k, _k))
+        return _vcov
+
+    def _fixef_nested_in_cluster(self, cluster_col: np.ndarray) -> bool:
+        """
+        Check if all fixed effects are nested within the clusters.
+
+        If every level of every fixed effect is observed in a single cluster,
+        the fixed effects projection is block diagonal by cluster: dropping a
+        cluster does not change the demeaned variables of the other clusters,
+        and the leave-one-cluster-out fits can be computed from the demeaned
+        model matrices of the full sample via `_vcov_crv3_fast()`.
+
+        Parameters
+        ----------
+        cluster_col : np.ndarray
+            The integer coded cluster variable.
+
+        Returns
+        -------
+        bool
+            True if all fixed effects are nested within the clusters.
+        """
+        fe = self._fe.to_numpy() if isinstance(self._fe, pd.DataFrame) else self._fe
+        fe = fe.reshape((fe.shape[0], -1)).astype(np.int64)
+        n_clusters = np.int64(cluster_col.max()) + 1
+        for j in range(fe.shape[1]):
+            n_levels = np.unique(fe[:, j]).size
+            n_pairs = np.unique(fe[:, j] * n_clusters + cluster_col).size
+            if n_pairs != n_levels:
+                return False
+
+        return True
+
+    def _vcov_crv3_demean(self, clustid, cluster_col):
+        """
+        Compute the CRV3 vcov for fixed effects that are not nested in clusters.
+
+        Dropping a cluster changes the fixed effects projection of the other
+        clusters, so the model needs to be demeaned again on each leave-one-
+        cluster-out sample. As the demeaned variables of the full sample only
+        differ from the original variables by a linear combination of the
+        fixed effects, they can be demeaned instead: the result is the same,
+        the demeaning starts close to the solution, and the formula parsing
+        and creation of the model matrices of a full re-estimation are
+        skipped.
+        """
+        _k = self._k
+        _beta_hat = self._beta_hat
+        _fixef_tol = self._fixef_tol
+        _demeaner = self._demeaner
+        _fixef_sort = self._fixef_sort
+
+        weights = self._weights.flatten().astype(np.float64)
+        fe = self._fe.to_numpy() if isinstance(self._fe, pd.DataFrame) else self._fe
+        fe = np.asfortranarray(fe.reshape((fe.shape[0], -1)).astype(np.uint32))
+        # demeaned, but not yet multiplied by the square root of the weights
+        YX = np.column_stack(
+            [self._Yd.to_numpy().reshape(-1, 1), self._X_untransformed]
+        ).astype(np.float64)
+
+        beta_jack = np.zeros((len(clustid), _k))
         for ixg, g in enumerate(clustid):
-            beta_centered = beta_jack[ixg, :] - beta_center
-            vcov_mat += np.outer(beta_centered, beta_centered)
+            keep = ~np.equal(g, cluster_col)
+            weights_g = weights[keep]
+            YX_g, _ = _demean_array(
+                x=YX[keep],
+                flist=fe[keep],
+                weights=weights_g,
+                tol=_fixef_tol,
+                demeaner=_demeaner,
+                sort_by_group=_fixef_sort,
+            )
+            YX_g *= np.sqrt(weights_g)[:, None]
+            Y_g = YX_g[:, :1]
+            X_g = YX_g[:, 1:]
+            beta_jack[ixg, :] = (np.linalg.pinv(X_g.T @ X_g) @ (X_g.T @ Y_g)).flatten()
 
-        _vcov = vcov_mat
+        beta_centered = beta_jack - _beta_hat
+        _vcov = beta_centered.T @ beta_centered
 
         return _vcov
 
@@ -770,22 +1133,27 @@ class Feols:
         beta_jack = np.zeros((len(clustid), _k))
 
         # lazy loading to avoid circular import
+        from pyfixest.estimation.feglm_ import Feglm
+
         fixest_module = import_module("pyfixest.estimation")
         if _method == "feols":
-            fit_ = getattr(fixest_module, "feols")
+            fit_ = functools.partial(
+                getattr(fixest_module, "feols"),
+                weights=_weights_name,
+                weights_type=_weights_type,
+            )
+        elif isinstance(self, Feglm):
+            fit_ = functools.partial(
+                getattr(fixest_module, "feglm"), family=self.family
+            )
         else:
+            # fepois() and feglm() do not support weights
             fit_ = getattr(fixest_module, "fepois")
 
         for ixg, g in enumerate(clustid):
             # direct leave one cluster out implementation
             data = _data[~np.equal(g, cluster_col)]
-            fit = fit_(
-                fml=_fml,
-                data=data,
-                vcov="iid",
-                weights=_weights_name,
-                weights_type=_weights_type,
-            )
+            fit = fit_(fml=_fml, data=data, vcov="iid")
             beta_jack[ixg, :] = fit.coef().to_numpy()
 
         # optional: beta_bar in MNW (2022)
@@ -825,17 +1193,24 @@ class Feols:
         _N = self._N
         _k = self._k
         _G = (
-            np.min(np.array(self._G)) if self._vcov_type == "CRV" else np.array(self._G)
+            np.min(np.array(self._G))
+            if self._vcov_type in ["CRV", "HAC"]
+            else np.array(self._G)
         )  # fixest default
         _method = self._method
 
         self._se = np.sqrt(np.diagonal(_vcov))
         self._tstat = _beta_hat / self._se
 
-        df = _N - _k if _vcov_type in ["iid", "hetero"] else _G - 1
+        df = (
+            _N - _k
+            if _vcov_type in ["iid", "hetero"]
+            or self._vcov_type_detail in ["NW", "conley"]
+            else _G - 1
+        )
 
         # use t-dist for linear models, but normal for non-linear models
-        if _method == "fepois":
+        if _method in ["fepois", "feglm"]:
             self._pvalue = 2 * (1 - norm.cdf(np.abs(self._tstat)))
             z = np.abs(norm.ppf(alpha / 2))
         else:
@@ -902,7 +1277,8 @@ class Feols:
             self._has_fixef = False
 
     def _clear_attributes(self):
-        attributes = []
+        # the cache is only needed for fitting, and is not pickled with the model
+        attributes = ["_demean_cache"]
 
         if not self._store_data:
             attributes += ["_data"]
@@ -921,7 +1297,6 @@ class Feols:
                 "_tZy",
                 "_tZX",
                 "_weights",
-                "_scores",
                 "_tZZinv",
                 "_u_hat",
                 "_Y_hat_link",
@@ -1036,7 +1411,7 @@ class Feols:
         n_restriction = R.shape[0]
         self._dfn = n_restriction
 
-        if self._is_clustered:
+        if self._is_clustered or self._vcov_type_detail == "DK":
             self._dfd = np.min(np.array(self._G)) - 1
         else:
             self._dfd = _N - _k - _k_fe
@@ -1076,24 +1451,31 @@ class Feols:
         reps: int,
         cluster: Optional[str] = None,
         param: Optional[str] = None,
-        weights_type: Optional[str] = "rademacher",
-        impose_null: Optional[bool] = True,
-        bootstrap_type: Optional[str] = "11",
+        weights_type: str = "rademacher",
+        impose_null: bool = True,
+        bootstrap_type: str = "11",
         seed: Optional[int] = None,
-        adj: Optional[bool] = True,
-        cluster_adj: Optional[bool] = True,
-        parallel: Optional[bool] = False,
+        adj: bool = True,
+        cluster_adj: bool = True,
+        parallel: bool = False,
         return_bootstrapped_t_stats=False,
     ):
         """
         Run a wild cluster bootstrap based on an object of type "Feols".
 
+        The WCR11 and WCU11 bootstraps (`bootstrap_type = '11'`) are computed
+        natively on the demeaned model matrices and support fixed effects,
+        regression weights and multiway clustering. The remaining bootstrap
+        types are computed via the `wildboottest` package, which supports
+        neither weights nor multiway clustering.
+
         Parameters
         ----------
         reps : int
             The number of bootstrap iterations to run.
         cluster : Union[str, None], optional
-            The variable used for clustering. Defaults to None. If None, then
+            The variable used for clustering, e.g. "f1" or "f1 + f2" for multiway
+            clustering. Defaults to None. If None, then
             uses the variable specified in the model's `clustervar` attribute.
             If no `_clustervar` attribute is found, runs a heteroskedasticity-
             robust bootstrap.
@@ -1118,9 +1500,8 @@ class Feols:
             Indicates whether to apply a small sample adjustment for the number
             of clusters. Defaults to True.
         parallel : bool, optional
-            Indicates whether to run the bootstrap in parallel. Defaults to False.
-        seed : Union[str, None], optional
-            An option to provide a random seed. Defaults to None.
+            Indicates whether to run the bootstrap in parallel. Only used for
+            bootstrap types other than '11'. Defaults to False.
         return_bootstrapped_t_stats : bool, optional:
             If True, the method returns a tuple of the regular output and the
             bootstrapped t-stats. Defaults to False.
@@ -1140,47 +1521,52 @@ class Feols:
         _X = self._X
         _xnames = self._coefnames
         _data = self._data
-        _clustervar = self._clustervar
         _supports_wildboottest = self._supports_wildboottest
 
+        if not _supports_wildboottest or _is_iv:
+            raise NotImplementedError(
+                "Wild cluster bootstrap is not supported for this model type."
+                if not _is_iv
+                else "Wild cluster bootstrap is not supported for IV estimation."
+            )
+
+        if self._method == "fepois":
+            raise NotImplementedError(
+                "Wild cluster bootstrap is not supported for Poisson regression."
+            )
+
         if param is not None and param not in _xnames:
             raise ValueError(
                 f"Parameter {param} not found in the model's coefficients."
             )
 
-        if not _supports_wildboottest:
-            if self._is_iv:
-                raise NotImplementedError(
-                    "Wild cluster bootstrap is not supported for IV estimation."
-                )
-            if self._has_weights:
-                raise NotImplementedError(
-                    "Wild cluster bootstrap is not supported for WLS estimation."
-                )
-
-        cluster_list = []
-
-        if cluster is not None and isinstance(cluster, str):
-            cluster_list = [cluster]
-        if cluster is not None and isinstance(cluster, list):
-            cluster_list = cluster
-
-        if cluster is None and _clustervar is not None:
-            if isinstance(_clustervar, str):
-                cluster_list = [_clustervar]
-            else:
-                cluster_list = _clustervar
-
+        cluster_list = self._wildboottest_cluster_list(cluster)
         run_heteroskedastic = not cluster_list
 
-        if not run_heteroskedastic and not len(cluster_list) == 1:
+        if bootstrap_type == "11":
+            return self._wildboottest_native(
+                reps=reps,
+                cluster_list=cluster_list,
+                param=param,
+                weights_type=weights_type,
+                impose_null=impose_null,
+                seed=seed,
+                adj=adj,
+                cluster_adj=cluster_adj,
+                return_bootstrapped_t_stats=return_bootstrapped_t_stats,
+            )
+
+        # other bootstrap types via the `wildboottest` package
+        if self._has_weights:
             raise NotImplementedError(
-                "Multiway clustering is currently not supported with the wild cluster bootstrap."
+                "Wild cluster bootstrap is not supported for WLS estimation "
+                f"with bootstrap_type {bootstrap_type}."
             )
 
-        if not run_heteroskedastic and cluster_list[0] not in _data.columns:
-            raise ValueError(
-                f"Cluster variable {cluster_list[0]} not found in the data."
+        if not run_heteroskedastic and not len(cluster_list) == 1:
+            raise NotImplementedError(
+                "Multiway clustering is not supported with the wild cluster "
+                f"bootstrap with bootstrap_type {bootstrap_type}."
             )
 
         try:
@@ -1190,16 +1576,6 @@ class Feols:
                 "Module 'wildboottest' not found. Please install 'wildboottest', e.g. via `PyPi`."
             )
 
-        if _is_iv:
-            raise NotImplementedError(
-                "Wild cluster bootstrap is not supported with IV estimation."
-            )
-
-        if self._method == "fepois":
-            raise NotImplementedError(
-                "Wild cluster bootstrap is not supported for Poisson regression."
-            )
-
         if _has_fixef:
             # update _X, _xnames
             fml_linear, fixef = self._fml.split("|")
@@ -1285,6 +1661,195 @@ class Feols:
         else:
             return res_df
 
+    def _wildboottest_cluster_list(self, cluster: Optional[str]) -> list[str]:
+        """
+        Get the cluster variables of the wild bootstrap.
+
+        Falls back to the cluster variables of the model if `cluster` is None.
+        An empty list implies a heteroskedastic bootstrap.
+        """
+        cluster_list = []
+
+        if cluster is not None and isinstance(cluster, str):
+            cluster_list = [x.strip() for x in cluster.split("+")]
+        if cluster is not None and isinstance(cluster, list):
+            cluster_list = cluster
+
+        if cluster is None and self._clustervar is not None:
+            if isinstance(self._clustervar, str):
+                cluster_list = [self._clustervar]
+            else:
+                cluster_list = self._clustervar
+
+        for x in cluster_list:
+            if x not in self._data.columns:
+                raise ValueError(f"Cluster variable {x} not found in the data.")
+
+        return cluster_list
+
+    def _wildboottest_native(
+        self,
+        reps: int,
+        cluster_list: list[str],
+        param: Optional[str],
+        weights_type: str,
+        impose_null: bool,
+        seed: Optional[int],
+        adj: bool,
+        cluster_adj: bool,
+        return_bootstrapped_t_stats: bool,
+    ):
+        """
+        Run a WCR11 / WCU11 wild (cluster) bootstrap via `_wildboottest_many()`.
+
+        See `wildboottest()` for the parameters.
+        """
+        problem, inference = self._wildboottest_problem(
+            cluster_list=cluster_list,
+            param=param,
+            impose_null=impose_null,
+            adj=adj,
+            cluster_adj=cluster_adj,
+        )
+
+        t_stats, t_boot, full_enumeration = _wildboottest_many(
+            problems=[problem],
+            reps=reps,
+            weights_type=weights_type,
+            seed=seed,
+        )
+        t_stat = t_stats[0]
+        t_boot = t_boot[:, 0]
+
+        if full_enumeration:
+            warnings.warn(
+                "2^G < the number of boot iterations, setting full_enumeration to True."
+            )
+
+        res = {
+            "param": param,
+            "t value": np.float64(t_stat),
+            "Pr(>|t|)": np.mean(np.abs(t_stat) < np.abs(t_boot)),
+            "bootstrap_type": "11",
+            "inference": inference,
+            "impose_null": impose_null,
+        }
+
+        res_df = pd.Series(res)
+
+        if return_bootstrapped_t_stats:
+            return res_df, t_boot
+        else:
+            return res_df
+
+    def _wildboottest_problem(
+        self,
+        cluster_list: list[str],
+        param: Optional[str],
+        impose_null: bool,
+        adj: bool,
+        cluster_adj: bool,
+    ) -> tuple[dict, str]:
+        """
+        Set up the WCR11 / WCU11 wild (cluster) bootstrap of `param`.
+
+        Works on the demeaned and weighted model matrices, so fixed effects are
+        never expanded into dummies. Multiway clustering draws the bootstrap
+        weights at the level of the intersection of the cluster variables.
+
+        Returns
+        -------
+        tuple[dict, str]
+            The bootstrap problem, see `_wildboottest_problem()` in
+            `wildboottest_.py`, and the inference label.
+        """
+        _N = self._N
+        _k = self._k
+
+        if param is None:
+            raise ValueError("The wild bootstrap requires a parameter `param`.")
+
+        R = np.zeros(_k)
+        R[self._coefnames.index(param)] = 1
+        ssc_dict: dict[str, Union[str, bool]] = {
+            "adj": adj,
+            "fixef_k": "none",
+            "cluster_adj": cluster_adj,
+            "cluster_df": "conventional",
+        }
+
+        if cluster_list:
+            inference = f"CRV({'+'.join(cluster_list)})"
+            cluster_df = _get_cluster_df(data=self._data, clustervar=cluster_list)
+            _check_cluster_df(cluster_df=cluster_df, data=self._data)
+            cluster_df, vcov_signs = _prepare_multiway_clustering(cluster_df)
+            cluster_cols = [cluster_df[col].to_numpy() for col in cluster_df.columns]
+            cluster_ssc = [
+                get_ssc(
+                    ssc_dict=ssc_dict,
+                    N=_N,
+                    k=_k,
+                    G=int(cluster_col.max()) + 1,
+                    vcov_sign=vcov_sign,
+                    vcov_type="CRV",
+                )[0]
+                for cluster_col, vcov_sign in zip(cluster_cols, vcov_signs)
+            ]
+            # the intersection of all cluster variables
+            bootcluster = cluster_cols[-1]
+        else:
+            inference = "HC"
+            bootcluster = np.arange(_N)
+            cluster_cols = [bootcluster]
+            cluster_ssc = [
+                get_ssc(
+                    ssc_dict=ssc_dict,
+                    N=_N,
+                    k=_k,
+                    G=_N,
+                    vcov_sign=1,
+                    vcov_type="hetero",
+                )[0]
+            ]
+
+        demean_errors = None
+        if self._has_fixef and not self._fixef_nested_in_cluster(bootcluster):
+            demean_errors = self._demean_scaled
+
+        problem = _wildboottest_problem(
+            X=self._X,
+            Y=self._Y.flatten(),
+            R=R,
+            r=0.0,
+            bootcluster=bootcluster,
+            cluster_cols=cluster_cols,
+            cluster_ssc=cluster_ssc,
+            impose_null=impose_null,
+            demean_errors=demean_errors,
+        )
+
+        return problem, inference
+
+    def _demean_scaled(self, x: np.ndarray) -> np.ndarray:
+        """
+        Demean an array that is scaled by the square root of the weights, as
+        the model matrices `_X` and `_Y`, by the fixed effects.
+        """
+        sqrt_weights = np.sqrt(self._weights.flatten().astype(np.float64))
+        fe = self._fe.to_numpy() if isinstance(self._fe, pd.DataFrame) else self._fe
+        fe = np.asfortranarray(fe.reshape((fe.shape[0], -1)).astype(np.uint32))
+
+        x_demeaned, _ = _demean_array(
+            x=x / sqrt_weights[:, None],
+            flist=fe,
+            weights=sqrt_weights**2,
+            tol=self._fixef_tol,
+            demeaner=self._demeaner,
+            sort_by_group=self._fixef_sort,
+        )
+
+        return x_demeaned * sqrt_weights[:, None]
+
     def ccv(
         self,
         treatment,
@@ -1522,14 +2087,20 @@ class Feols:
             X = X.to_numpy()
             uhat = (Y - X @ self._beta_hat).flatten()
 
-        D2 = Formula("-1+" + fixef_fml).get_model_matrix(_data, output="sparse")
-        cols = D2.model_spec.column_names
+        if self._fixef_index is not None:
+            D2, fe_cols = self._fixef_index.dummies(
+                self._fixef.replace("^", "_").split("+"),
+                rows=_data.index.to_numpy(),
+            )
+            cols = [(f"C({x})", level) for x, level in fe_cols]
+        else:
+            D2 = Formula("-1+" + fixef_fml).get_model_matrix(_data, output="sparse")
+            cols = [_extract_variable_level(x) for x in D2.model_spec.column_names]
 
         alpha = lsqr(D2, uhat, atol=atol, btol=btol)[0]
 
         res: dict[str, dict[str, float]] = {}
-        for i, col in enumerate(cols):
-            variable, level = _extract_variable_level(col)
+        for i, (variable, level) in enumerate(cols):
             # check if res already has a key variable
             if variable not in res:
                 res[variable] = dict()
@@ -1872,7 +2443,10 @@ class Feols:
             raise ValueError("No coefficients match the keep/drop patterns.")
 
         if not joint:
-            if self._vcov_type in ["iid", "hetero"]:
+            if self._vcov_type in ["iid", "hetero"] or self._vcov_type_detail in [
+                "NW",
+                "conley",
+            ]:
                 df = self._N - self._k
             else:
                 _G = np.min(np.array(self._G))  # fixest default
@@ -2023,7 +2597,7 @@ class Feols:
                 """
             )
 
-        if choose_algorithm == "slow" or _method == "fepois":
+        if choose_algorithm == "slow" or _method in ["fepois", "feglm"]:
             vcov_input: Union[str, dict[str, str]]
             if cluster is not None:
                 vcov_input = {"CRV1": cluster}
@@ -2039,6 +2613,9 @@ class Feols:
             if type == "randomization-c":
                 vcov_input = "iid"
 
+            # lazy loading to avoid circular import
+            from pyfixest.estimation.feglm_ import Feglm
+
             ri_stats = _get_ritest_stats_slow(
                 data=_data,
                 resampvar=resampvar_,
@@ -2049,6 +2626,7 @@ class Feols:
                 type=type,
                 rng=rng,
                 model=_method,
+                family=self.family if isinstance(self, Feglm) else None,
             )
 
         else:
@@ -2276,7 +2854,7 @@ def _drop_multicollinear_variables(
     """
     # TODO: avoid doing this computation twice, e.g. compute tXXinv here as fixest does
 
-    tXX = X.T @ X
+    tXX = _crossprod(X, X)
     id_excl, n_excl, all_removed = _find_collinear_variables(tXX, collin_tol)
 
     collin_vars = []
@@ -2377,6 +2955,26 @@ def _find_collinear_variables(
     return id_excl.astype(np.bool_), n_excl, False
 
 
+# attributes set by `Feols.vcov()` and `Feols.get_inference()`
+_VCOV_ATTRIBUTES = [
+    "_vcov_type",
+    "_vcov_type_detail",
+    "_is_clustered",
+    "_clustervar",
+    "_hacvar",
+    "_hac_options",
+    "_cluster_df",
+    "_G",
+    "_ssc",
+    "_bread",
+    "_vcov",
+    "_se",
+    "_tstat",
+    "_pvalue",
+    "_conf_int",
+]
+
+
 def _check_vcov_input(vcov: Union[str, dict[str, str]], data: pd.DataFrame):
     """
     Check the input for the vcov argument in the Feols class.
@@ -2394,15 +2992,22 @@ def _check_vcov_input(vcov: Union[str, dict[str, str]], data: pd.DataFrame):
     """
     assert isinstance(vcov, (dict, str, list)), "vcov must be a dict, string or list"
     if isinstance(vcov, dict):
-        assert list(vcov.keys())[0] in [
+        vcov_type_detail = list(vcov.keys())[0]
+        assert vcov_type_detail in [
             "CRV1",
             "CRV3",
-        ], "vcov dict key must be CRV1 or CRV3"
+            "NW",
+            "DK",
+            "conley",
+        ], "vcov dict key must be CRV1, CRV3, NW, DK or conley"
         assert isinstance(
             list(vcov.values())[0], str
         ), "vcov dict value must be a string"
-        deparse_vcov = list(vcov.values())[0].split("+")
-        assert len(deparse_vcov) <= 2, "not more than twoway clustering is supported"
+        hac_options = {"NW": ["lag"], "DK": ["lag"], "conley": ["cutoff"]}
+        assert all(
+            key in hac_options.get(vcov_type_detail, [])
+            for key in list(vcov.keys())[1:]
+        ), "vcov dict contains unsupported options"
 
     if isinstance(vcov, list):
         assert all(isinstance(v, str) for v in vcov), "vcov list must contain strings"
@@ -2419,7 +3024,7 @@ def _check_vcov_input(vcov: Union[str, dict[str, str]], data: pd.DataFrame):
         ], "vcov string must be iid, hetero, HC1, HC2, or HC3"
 
 
-def _deparse_vcov_input(vcov: Union[str, dict[str, str]], has_fixef: bool, is_iv: bool):
+def _deparse_vcov_input(vcov: Union[str, dict[str, str]], is_iv: bool):
     """
     Deparse the vcov argument passed to the Feols class.
 
@@ -2427,18 +3032,16 @@ def _deparse_vcov_input(vcov: Union[str, dict[str, str]], has_fixef: bool, is_iv
     ----------
     vcov : Union[str, dict[str, str]]
         The vcov argument passed to the Feols class.
-    has_fixef : bool
-        Whether the regression has fixed effects.
     is_iv : bool
         Whether the regression is an IV regression.
 
     Returns
     -------
     vcov_type : str
-        The type of vcov to be used. Either "iid", "hetero", or "CRV".
+        The type of vcov to be used. Either "iid", "hetero", "CRV" or "HAC".
     vcov_type_detail : str or list
         The type of vcov to be used, with more detail. Options include "iid",
-        "hetero", "HC1", "HC2", "HC3", "CRV1", or "CRV3".
+        "hetero", "HC1", "HC2", "HC3", "CRV1", "CRV3", "NW", "DK" or "conley".
     is_clustered : bool
         Indicates whether the vcov is clustered.
     clustervar : str
@@ -2461,18 +3064,16 @@ def _deparse_vcov_input(vcov: Union[str, dict[str, str]], has_fixef: bool, is_iv
     elif vcov_type_detail in ["hetero", "HC1", "HC2", "HC3"]:
         vcov_type = "hetero"
         is_clustered = False
-        if vcov_type_detail in ["HC2", "HC3"]:
-            if has_fixef:
-                raise VcovTypeNotSupportedError(
-                    "HC2 and HC3 inference types are not supported for regressions with fixed effects."
-                )
-            if is_iv:
-                raise VcovTypeNotSupportedError(
-                    "HC2 and HC3 inference types are not supported for IV regressions."
-                )
+        if vcov_type_detail in ["HC2", "HC3"] and is_iv:
+            raise VcovTypeNotSupportedError(
+                "HC2 and HC3 inference types are not supported for IV regressions."
+            )
     elif vcov_type_detail in ["CRV1", "CRV3"]:
         vcov_type = "CRV"
         is_clustered = True
+    elif vcov_type_detail in ["NW", "DK", "conley"]:
+        vcov_type = "HAC"
+        is_clustered = False
 
     clustervar = deparse_vcov if is_clustered else None
 
@@ -2489,6 +3090,83 @@ def _deparse_vcov_input(vcov: Union[str, dict[str, str]], has_fixef: bool, is_iv
     return vcov_type, vcov_type_detail, is_clustered, clustervar
 
 
+def _vcov_label(vcov: Union[str, dict[str, str]]) -> str:
+    """
+    Label a vcov argument, e.g. "hetero", "CRV1: f1+f2" or "NW: unit+time (lag=2)".
+
+    Parameters
+    ----------
+    vcov : Union[str, dict[str, str]]
+        The vcov argument passed to the Feols class.
+
+    Returns
+    -------
+    str
+        The label.
+    """
+    if isinstance(vcov, str):
+        return vcov
+
+    items = list(vcov.items())
+    vcov_type_detail, variables = items[0]
+    label = f"{vcov_type_detail}: {variables.replace(' ', '')}"
+    if len(items) > 1:
+        label += " (" + ", ".join(f"{key}={value}" for key, value in items[1:]) + ")"
+
+    return label
+
+
+def _deparse_hac_input(vcov: dict) -> tuple[list[str], dict[str, float]]:
+    """
+    Deparse the vcov argument for HAC inference.
+
+    Parameters
+    ----------
+    vcov : dict
+        The vcov argument, e.g. {"NW": "unit + time", "lag": 2},
+        {"DK": "time"} or {"conley": "lat + lon", "cutoff": 100}.
+
+    Returns
+    -------
+    hacvar : list[str]
+        The names of the time (and unit) or coordinate variables.
+    hac_options : dict[str, float]
+        The options of the HAC estimator, i.e. the number of lags for "NW"
+        and "DK" and the distance cutoff in kilometers for "conley".
+    """
+    vcov_type_detail, hacvar_str = list(vcov.items())[0]
+    hacvar = [x.replace(" ", "") for x in hacvar_str.split("+")]
+    hac_options = dict(list(vcov.items())[1:])
+
+    if vcov_type_detail == "NW" and len(hacvar) not in [1, 2]:
+        raise ValueError(
+            "NW inference requires a time variable or a unit and a time variable, "
+            f"as in 'unit + time', but {hacvar_str} was specified."
+        )
+    if vcov_type_detail == "DK" and len(hacvar) != 1:
+        raise ValueError(
+            "DK inference requires a single time variable, "
+            f"but {hacvar_str} was specified."
+        )
+    if vcov_type_detail == "conley":
+        if len(hacvar) != 2:
+            raise ValueError(
+                "conley inference requires a latitude and a longitude variable, "
+                f"as in 'lat + lon', but {hacvar_str} was specified."
+            )
+        if "cutoff" not in hac_options or not hac_options["cutoff"] > 0:
+            raise ValueError(
+                "conley inference requires a positive distance `cutoff` in kilometers."
+            )
+    if "lag" in hac_options:
+        if not isinstance(hac_options["lag"], Integral) or hac_options["lag"] < 0:
+            raise ValueError("The number of lags `lag` must be a non-negative integer.")
+        # numpy integers are accepted as well
+        hac_options["lag"] = int(hac_options["lag"])
+
+    return hacvar, hac_options
+
+
 def _apply_fixef_numpy(df_fe_values, fixef_dicts):
     fixef_mat = np.zeros_like(df_fe_values, dtype=float)
     for i, (fixef, subdict) in enumerate(fixef_dicts.items()):
@@ -2497,3 +3175,101 @@ def _apply_fixef_numpy(df_fe_values, fixef_dicts):
         fixef_mat[:, i] = mapping[inverse]
 
     return fixef_mat
+
+
+def _crossprod(A: np.ndarray, B: np.ndarray, chunk_size: int = 65_536) -> np.ndarray:
+    """
+    Compute A'B, accumulating in double precision.
+
+    Single precision inputs are upcast in chunks of `chunk_size` rows, so that
+    the cross-product is accurate without a full double precision copy of
+    `A` and `B`.
+
+    Parameters
+    ----------
+    A : np.ndarray
+        An array of shape (n_obs, k_A).
+    B : np.ndarray
+        An array of shape (n_obs, k_B).
+    chunk_size : int, optional
+        The number of rows upcast at once. Defaults to 65_536.
+
+    Returns
+    -------
+    np.ndarray
+        A float64 array of shape (k_A, k_B).
+    """
+    if A.dtype == np.float64 and B.dtype == np.float64:
+        return A.T @ B
+
+    res = np.zeros((A.shape[1], B.shape[1]), dtype=np.float64)
+    for start in range(0, A.shape[0], chunk_size):
+        A_chunk = A[start : start + chunk_size].astype(np.float64)
+        B_chunk = B[start : start + chunk_size].astype(np.float64)
+        res += A_chunk.T @ B_chunk
+
+    return res
+
+
+def _weighted_crossprod(
+    A: np.ndarray, w: np.ndarray, chunk_size: int = 65_536
+) -> np.ndarray:
+    """
+    Compute A' diag(w) A, accumulating in double precision.
+
+    The weighted rows are formed in chunks of `chunk_size` rows, so that no
+    weighted copy of `A` of shape (n_obs, k) is allocated.
+
+    Parameters
+    ----------
+    A : np.ndarray
+        An array of shape (n_obs, k).
+    w : np.ndarray
+        A float64 array of shape (n_obs,).
+    chunk_size : int, optional
+        The number of rows weighted at once. Defaults to 65_536.
+
+    Returns
+    -------
+    np.ndarray
+        A float64 array of shape (k, k).
+    """
+    res = np.zeros((A.shape[1], A.shape[1]), dtype=np.float64)
+    for start in range(0, A.shape[0], chunk_size):
+        A_chunk = A[start : start + chunk_size].astype(np.float64, copy=False)
+        w_chunk = w[start : start + chunk_size]
+        res += (A_chunk * w_chunk[:, None]).T @ A_chunk
+
+    return res
+
+
+def _matvec(A: np.ndarray, b: np.ndarray, chunk_size: int = 65_536) -> np.ndarray:
+    """
+    Compute A @ b in double precision.
+
+    Same as `_crossprod()`, single precision `A` is upcast in chunks of rows.
+
+    Parameters
+    ----------
+    A : np.ndarray
+        An array of shape (n_obs, k).
+    b : np.ndarray
+        A float64 array of shape (k,).
+    chunk_size : int, optional
+        The number of rows upcast at once. Defaults to 65_536.
+
+    Returns
+    -------
+    np.ndarray
+        A float64 array of shape (n_obs,).
+    """
+    if A.dtype == np.float64:
+        return A @ b
+
+    res = np.empty(A.shape[0], dtype=np.float64)
+    for start in range(0, A.shape[0], chunk_size):
+        res[start : start + chunk_size] = (
+            A[start : start + chunk_size].astype(np.float64) @ b
+        )
+
+    return res
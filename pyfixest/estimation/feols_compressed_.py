@@ -6,6 +6,7 @@ import pandas as pd
 import polars as pl
 from tqdm import tqdm
 
+from pyfixest.estimation.demean_cache_ import DemeanCache
 from pyfixest.estimation.feols_ import Feols
 from pyfixest.estimation.FormulaParser import FixestFormula
 from pyfixest.utils.dev_utils import DataFrameType
@@ -39,8 +40,8 @@ class FeolsCompressed(Feols):
         The tolerance level for collinearity.
     fixef_tol : float
         The tolerance level for the fixed effects.
-    lookup_demeaned_data : dict[str, pd.DataFrame]
-        The lookup table for demeaned data.
+    demean_cache : Optional[DemeanCache]
+        The cache of demeaned variables.
     solver : str
         The solver to use.
     store_data : bool
@@ -68,7 +69,7 @@ class FeolsCompressed(Feols):
         weights_type: Optional[str],
         collin_tol: float,
         fixef_tol: float,
-        lookup_demeaned_data: dict[str, pd.DataFrame],
+        demean_cache: Optional[DemeanCache],
         solver: str = "np.linalg.solve",
         store_data: bool = True,
         copy_data: bool = True,
@@ -88,7 +89,7 @@ class FeolsCompressed(Feols):
             weights_type,
             collin_tol,
             fixef_tol,
-            lookup_demeaned_data,
+            demean_cache,
             solver,
             store_data,
             copy_data,
@@ -106,6 +107,7 @@ class FeolsCompressed(Feols):
         self._support_crv3_inference = False
         self._support_iid_inference = True
         self._supports_cluster_causal_variance = False
+        self._supports_wildboottest = False
         if weights is not None:
             raise ValueError(
                 "weights argument needs to be None. WLS not supported for compressed regression."
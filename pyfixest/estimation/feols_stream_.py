@@ -0,0 +1,825 @@
+import os
+import re
+import warnings
+from collections.abc import Iterable, Iterator
+from typing import Any, Callable, Optional, Union, cast
+
+import numpy as np
+import pandas as pd
+import polars as pl
+from scipy import sparse
+
+from pyfixest.errors import NanInClusterVarError, VcovTypeNotSupportedError
+from pyfixest.estimation.feols_ import (
+    Feols,
+    _deparse_vcov_input,
+    _find_collinear_variables,
+)
+from pyfixest.estimation.fixef_index_ import _get_fixef_column
+from pyfixest.estimation.FormulaParser import FixestFormula
+from pyfixest.estimation.model_matrix_fixest_ import model_matrix_fixest
+from pyfixest.utils.dev_utils import DataFrameType, _polars_to_pandas
+from pyfixest.utils.utils import get_ssc
+
+StreamSourceType = Union[
+    str,
+    os.PathLike,
+    DataFrameType,
+    Iterable[Any],
+    Callable[[], Iterable[Any]],
+]
+
+
+class FeolsStream(Feols):
+    """
+    Non user-facing class for OLS on data that is processed in chunks.
+
+    Users should not directly instantiate this class, but rather use the
+    [feols_stream()](/reference/estimation.feols_stream.qmd) function.
+
+    The model is estimated from sufficient statistics that are accumulated
+    chunk by chunk, so that the full data set never needs to be held in memory:
+    X'WX, X'Wy and y'Wy, and for each fixed effect the within-group sums of the
+    dependent variable and covariates. The fixed effects are then partialled out
+    exactly via the Frisch-Waugh-Lovell theorem. Iid inference only needs these
+    statistics. Heteroskedasticity-robust and one-way CRV1 inference require a
+    second pass over the data, in which the residuals and scores are recomputed
+    chunk by chunk.
+
+    Parameters
+    ----------
+    FixestFormula : FixestFormula
+        The formula object.
+    source : _StreamSource
+        The data source, yielding pandas DataFrames.
+    ssc_dict : dict[str, Union[str, bool]]
+        The ssc dictionary.
+    weights : Optional[str]
+        The column name of the weights. None if no weights are used.
+    weights_type : Optional[str]
+        The type of weights, either "aweights" or "fweights".
+    collin_tol : float
+        The tolerance level for collinearity.
+    solver : str
+        The solver to use.
+    """
+
+    def __init__(
+        self,
+        FixestFormula: FixestFormula,
+        source: "_StreamSource",
+        ssc_dict: dict[str, Union[str, bool]],
+        weights: Optional[str],
+        weights_type: Optional[str],
+        collin_tol: float,
+        solver: str = "np.linalg.solve",
+    ) -> None:
+        super().__init__(
+            FixestFormula=FixestFormula,
+            data=pd.DataFrame(),
+            ssc_dict=ssc_dict,
+            drop_singletons=False,
+            drop_intercept=False,
+            weights=weights,
+            weights_type=weights_type,
+            collin_tol=collin_tol,
+            fixef_tol=1e-08,
+            demean_cache=None,
+            solver=solver,
+            store_data=False,
+            copy_data=False,
+            lean=False,
+            sample_split_value="all",
+        )
+
+        if FixestFormula.fml_first_stage is not None:
+            raise NotImplementedError(
+                "Streamed estimation is not supported with IV regression."
+            )
+
+        self._method = "feols"
+        self._source = source
+        self._support_crv3_inference = False
+        self._supports_wildboottest = False
+        self._supports_cluster_causal_variance = False
+        self._fe_names = (
+            FixestFormula._fval.split("+") if FixestFormula._fval != "0" else []
+        )
+        self._fe_registries = [_LevelRegistry() for _ in self._fe_names]
+        self._n_chunks = 0
+
+    def prepare_model_matrix(self):
+        "Accumulate the sufficient statistics in a first pass over the data."
+        columns = self._source.get_columns(self.FixestFormula.fml, self._weights_name)
+        n_fe = len(self._fe_names)
+
+        N_rows = 0
+        sum_w = 0.0
+        sum_y = 0.0
+        VtV = None
+        Dtw: list[np.ndarray] = [np.zeros(0)] * n_fe
+        DtV: list[np.ndarray] = [np.empty((0, 0))] * n_fe
+        DtD: dict[tuple[int, int], sparse.csr_matrix] = {}
+
+        for chunk in self._source.iter_chunks(columns):
+            V, w, codes, _ = self._get_chunk_matrices(chunk, grow_levels=True)
+            if V is None:
+                continue
+
+            N_rows += V.shape[0]
+            sum_w += np.sum(w)
+            sum_y += np.sum(w * V[:, 0])
+            VtV_chunk = (V * w[:, None]).T @ V
+            VtV = VtV_chunk if VtV is None else VtV + VtV_chunk
+
+            Dw = [
+                _indicator(codes[j], registry.n_levels, w)
+                for j, registry in enumerate(self._fe_registries)
+            ]
+            for j in range(n_fe):
+                n_levels = Dw[j].shape[0]
+                Dtw[j] = (
+                    np.pad(Dtw[j], (0, n_levels - Dtw[j].size))
+                    + np.asarray(Dw[j].sum(axis=1)).flatten()
+                )
+                DtV[j] = _pad_rows(DtV[j], n_levels, V.shape[1]) + Dw[j] @ V
+                for h in range(j + 1, n_fe):
+                    cross = (
+                        Dw[j] @ _indicator(codes[h], self._fe_registries[h].n_levels).T
+                    )
+                    if (j, h) in DtD:
+                        DtD[(j, h)].resize(cross.shape)
+                        cross = DtD[(j, h)] + cross
+                    DtD[(j, h)] = sparse.csr_matrix(cross)
+
+        if VtV is None:
+            raise ValueError("The data source did not yield any complete observations.")
+
+        self._N_rows = N_rows
+        self._N = sum_w if self._weights_type == "fweights" else N_rows
+        self._sum_w = sum_w
+        self._sum_y = sum_y
+        self._yty = VtV[0, 0]
+
+        self._has_fixef = n_fe > 0
+        self._fixef = self.FixestFormula._fval
+        if self._has_fixef:
+            self._k_fe = pd.Series(
+                [registry.n_levels for registry in self._fe_registries],
+                index=[x.replace("^", "_") for x in self._fe_names],
+            )
+            VtV, self._fe_coefs = _partial_out_fixef(VtV, Dtw, DtV, DtD)
+
+        self._VtV = VtV
+
+    def _get_chunk_matrices(
+        self, chunk: pd.DataFrame, grow_levels: bool
+    ) -> tuple[Optional[np.ndarray], np.ndarray, list[np.ndarray], pd.Index]:
+        """
+        Create the model matrices of a single chunk.
+
+        Parameters
+        ----------
+        chunk : pd.DataFrame
+            The chunk.
+        grow_levels : bool
+            Whether unseen levels of the fixed effects are allowed.
+
+        Returns
+        -------
+        tuple
+            The matrix [y, X] (None if the chunk has no complete observations),
+            the weights, the codes of the fixed effects and the index of the
+            complete rows in `chunk`.
+        """
+        mm_dict = model_matrix_fixest(
+            FixestFormula=self.FixestFormula,
+            data=chunk,
+            weights=self._weights_name,
+        )
+        Y = mm_dict["Y"]
+        X = mm_dict["X"]
+
+        coefnames = X.columns.tolist()
+        if self._n_chunks == 0:
+            self._depvar = Y.columns[0]
+            self._coefnames = coefnames
+            self._coefnames_all = coefnames
+            self._icovars = mm_dict.get("icovars")
+        elif coefnames != self._coefnames_all:
+            raise ValueError(
+                f"""
+                The covariates of the chunks differ: {coefnames} vs. {self._coefnames_all}.
+                This usually happens if a categorical covariate does not have the same
+                levels in each chunk. Please encode such variables as fixed effects.
+                """
+            )
+        self._n_chunks += 1
+
+        if Y.shape[0] == 0:
+            return None, np.array([]), [], Y.index
+
+        V = np.column_stack(
+            [Y.to_numpy(dtype=np.float64), X.to_numpy(dtype=np.float64)]
+        )
+        weights_df = mm_dict["weights_df"]
+        w = (
+            weights_df.to_numpy(dtype=np.float64).flatten()
+            if weights_df is not None
+            else np.ones(V.shape[0])
+        )
+
+        chunk_complete = chunk.loc[Y.index]
+        codes = [
+            registry.encode(_get_fixef_column(chunk_complete, fe), grow=grow_levels)
+            for fe, registry in zip(self._fe_names, self._fe_registries)
+        ]
+
+        return V, w, codes, Y.index
+
+    def demean(self):
+        "Skip demeaning, the fixed effects are partialled out via sufficient statistics."
+        pass
+
+    def to_array(self):
+        "Skip the conversion to arrays, all statistics are arrays already."
+        pass
+
+    def wls_transform(self):
+        "Skip the WLS transformation, weights enter the sufficient statistics."
+        pass
+
+    def drop_multicol_vars(self):
+        "Detect and drop multicollinear variables."
+        tXX = self._VtV[1:, 1:]
+        id_excl, n_excl, all_removed = _find_collinear_variables(tXX, self._collin_tol)
+        if all_removed:
+            raise ValueError(
+                """
+                All variables are collinear. Maybe your model specification introduces multicollinearity? If not, please reach out to the package authors!.
+                """
+            )
+
+        self._collin_vars = []
+        self._collin_index = []
+        self._keep_idx = np.flatnonzero(~id_excl)
+        if n_excl > 0:
+            self._collin_vars = np.array(self._coefnames)[id_excl].tolist()
+            self._collin_index = np.flatnonzero(id_excl).tolist()
+            self._coefnames = np.array(self._coefnames)[self._keep_idx].tolist()
+            warnings.warn(
+                f"""
+            The following variables are collinear: {self._collin_vars}.
+            The variables are dropped from the model.
+            """
+            )
+
+        self._k = len(self._keep_idx)
+        self._X_is_empty = self._k == 0
+
+    def get_fit(self) -> None:
+        """
+        Fit the OLS model from the sufficient statistics.
+
+        Returns
+        -------
+        None
+        """
+        keep = self._keep_idx + 1
+        self._tZX = self._VtV[np.ix_(keep, keep)]
+        self._tZy = self._VtV[keep, 0]
+        self._beta_hat = self.solve_ols(self._tZX, self._tZy, self._solver)
+        self._hessian = self._tZX.copy()
+
+        # weighted sum of squared residuals
+        self._ssr = max(
+            self._VtV[0, 0]
+            - 2 * self._beta_hat @ self._tZy
+            + self._beta_hat @ self._tZX @ self._beta_hat,
+            0.0,
+        )
+
+    def vcov(
+        self, vcov: Union[str, dict[str, str]], data: Optional[DataFrameType] = None
+    ) -> "FeolsStream":
+        """
+        Compute covariance matrices for a streamed regression model.
+
+        Iid inference is computed from the sufficient statistics of the first
+        pass over the data. Heteroskedasticity-robust (HC1) and one-way CRV1
+        inference require another pass over the data source.
+
+        Parameters
+        ----------
+        vcov : Union[str, dict[str, str]]
+            A string or dictionary specifying the type of variance-covariance matrix
+            to use for inference. Either "iid", "hetero", "HC1" or a dictionary
+            {"CRV1": "clustervar"}.
+        data : Optional[DataFrameType], optional
+            Not supported, needs to be None. The data source of the model is used.
+
+        Returns
+        -------
+        FeolsStream
+            An instance of class FeolsStream with updated inference.
+        """
+        if data is not None:
+            raise NotImplementedError(
+                "Streamed regression does not support passing `data` to `vcov()`."
+            )
+
+        (
+            self._vcov_type,
+            self._vcov_type_detail,
+            self._is_clustered,
+            self._clustervar,
+        ) = _deparse_vcov_input(vcov, False)
+
+        if self._vcov_type_detail in ["HC2", "HC3", "CRV3", "NW", "DK", "conley"]:
+            raise VcovTypeNotSupportedError(
+                f"{self._vcov_type_detail} inference is not supported for streamed regression."
+            )
+        if self._is_clustered and len(self._clustervar) > 1:
+            raise NotImplementedError(
+                "Multiway clustering is not supported for streamed regression."
+            )
+
+        self._bread = np.linalg.inv(self._hessian)
+        _ssc_dict = self._ssc_dict
+        _N = self._N
+        _k = self._k
+
+        if self._vcov_type == "iid":
+            self._ssc = get_ssc(
+                ssc_dict=_ssc_dict, N=_N, k=_k, G=1, vcov_sign=1, vcov_type="iid"
+            )
+            self._vcov = self._ssc * self._bread * self._ssr / (_N - 1)
+        else:
+            meat, G = self._get_meat()
+            self._G = [G]
+            self._ssc = get_ssc(
+                ssc_dict=_ssc_dict,
+                N=_N,
+                k=_k,
+                G=G,
+                vcov_sign=1,
+                vcov_type="hetero" if self._vcov_type == "hetero" else "CRV",
+            )
+            self._vcov = self._ssc * (self._bread @ meat @ self._bread)
+
+        self.get_inference()
+
+        return self
+
+    def _get_meat(self) -> tuple[np.ndarray, int]:
+        """
+        Compute the meat of the sandwich estimator in a second pass over the data.
+
+        Returns
+        -------
+        tuple[np.ndarray, int]
+            The meat matrix and the number of clusters (the number of
+            observations for heteroskedasticity-robust inference).
+        """
+        if not self._source.reiterable:
+            raise ValueError(
+                """
+                Heteroskedasticity-robust and clustered inference require a second
+                pass over the data, but the data source can only be iterated once.
+                Please pass a file path, a list of data frames or a function returning
+                a fresh iterator of chunks, or use vcov = 'iid'.
+                """
+            )
+
+        columns = self._source.get_columns(
+            self.FixestFormula.fml, self._weights_name, self._clustervar
+        )
+        k = self._k
+        keep = self._keep_idx + 1
+        # coefficients of [y, X] on the fixed effects and the residualizing vector
+        beta_full = np.concatenate([[1.0], -self._beta_hat])
+        cols = np.concatenate([[0], keep])
+
+        meat = np.zeros((k, k))
+        cluster_registry = _LevelRegistry()
+        cluster_scores = np.zeros((0, k))
+        N_rows = 0
+
+        for chunk in self._source.iter_chunks(columns):
+            V, w, codes, index = self._get_chunk_matrices(chunk, grow_levels=False)
+            if V is None:
+                continue
+            N_rows += V.shape[0]
+
+            V = V[:, cols]
+            for j, fe_coefs in enumerate(getattr(self, "_fe_coefs", [])):
+                V -= fe_coefs[codes[j]][:, cols]
+            u = V @ beta_full
+            scores = V[:, 1:] * (w * u)[:, None]
+
+            if self._is_clustered:
+                cluster = chunk.loc[index, self._clustervar[0]]
+                if cluster.isna().any():
+                    raise NanInClusterVarError(
+                        "CRV inference not supported with missing values in the cluster variable."
+                        "Please drop missing values before running the regression."
+                    )
+                cluster_codes = cluster_registry.encode(cluster)
+                cluster_scores = _pad_rows(
+                    cluster_scores, cluster_registry.n_levels, k
+                ) + (_indicator(cluster_codes, cluster_registry.n_levels) @ scores)
+            else:
+                meat += scores.T @ scores
+
+        if N_rows != self._N_rows:
+            raise ValueError(
+                "The data source yielded different data in the second pass over the data."
+            )
+
+        if self._is_clustered:
+            return cluster_scores.T @ cluster_scores, cluster_registry.n_levels
+
+        return meat, self._N
+
+    def get_performance(self) -> None:
+        """
+        Get Goodness-of-Fit measures.
+
+        Computes the R-squared, the within R-squared and the RMSE from the
+        sufficient statistics. With weights, only the within R-squared is
+        not reported, as for `feols()`.
+
+        Returns
+        -------
+        None
+        """
+        _N = self._N
+        ssu = self._ssr
+
+        if self._has_weights:
+            self._rmse = np.nan
+            self._r2 = np.nan
+            self._r2_within = np.nan
+        else:
+            ssy = self._yty - self._sum_y**2 / self._sum_w
+            self._rmse = np.sqrt(ssu / _N)
+            self._r2 = 1 - ssu / ssy
+            self._r2_within = 1 - ssu / self._VtV[0, 0] if self._has_fixef else np.nan
+
+        self._adj_r2 = np.nan
+        self._adj_r2_within = np.nan
+
+    def predict(
+        self,
+        newdata: Optional[DataFrameType] = None,
+        atol: float = 1e-6,
+        btol: float = 1e-6,
+        type: str = "link",
+    ) -> np.ndarray:
+        """
+        Compute predicted values.
+
+        Parameters
+        ----------
+        newdata : Optional[DataFrameType]
+            The new data.
+        atol : float
+            The absolute tolerance.
+        btol : float
+            The relative tolerance.
+        type : str
+            The type of prediction.
+
+        Returns
+        -------
+        np.ndarray
+            The predicted values.
+        """
+        raise NotImplementedError(
+            "Predictions are not supported for streamed regression."
+        )
+
+    def resid(self) -> np.ndarray:
+        "Raise, residuals are not stored for streamed regression."
+        raise NotImplementedError(
+            "Residuals are not supported for streamed regression."
+        )
+
+    def fixef(self, atol: float = 1e-6, btol: float = 1e-6) -> dict[str, dict]:
+        "Raise, fixed effects are not computed for streamed regression."
+        raise NotImplementedError(
+            "Fixed effects are not supported for streamed regression."
+        )
+
+
+class _StreamSource:
+    """
+    A source of data chunks for streamed estimation.
+
+    Parameters
+    ----------
+    data : StreamSourceType
+        A path (or list of paths) to parquet files, a pyarrow Table or Dataset,
+        a pandas or polars DataFrame, a list or tuple of chunks, a function
+        returning an iterable of chunks or an iterator of chunks. Chunks are
+        pandas or polars DataFrames or pyarrow RecordBatches / Tables.
+    batch_size : int
+        The number of rows per chunk for data sources that are split by
+        pyfixest (paths, pyarrow Tables and Datasets, data frames).
+    """
+
+    def __init__(self, data: StreamSourceType, batch_size: int) -> None:
+        self._batch_size = batch_size
+        self._dataset = None
+
+        if isinstance(data, (str, os.PathLike)) or (
+            isinstance(data, (list, tuple))
+            and len(data) > 0
+            and all(isinstance(x, (str, os.PathLike)) for x in data)
+        ):
+            self._dataset = _arrow_dataset(None, path=data)
+            self._data = None
+        elif type(data).__name__ in ["Table", "FileSystemDataset", "InMemoryDataset"]:
+            self._dataset = _arrow_dataset(data)
+            self._data = None
+        else:
+            self._data = data
+
+        self.reiterable = self._dataset is not None or isinstance(
+            data, (pd.DataFrame, pl.DataFrame, list, tuple)
+        )
+        self.reiterable = self.reiterable or (
+            callable(data) and not isinstance(data, Iterator)
+        )
+        self._n_iter = 0
+
+    def get_columns(
+        self,
+        fml: str,
+        weights: Optional[str],
+        clustervar: Optional[list[str]] = None,
+    ) -> Optional[list[str]]:
+        """
+        Get the columns of the data source that are needed for estimation.
+
+        Parameters
+        ----------
+        fml : str
+            The model formula.
+        weights : Optional[str]
+            The name of the weights column.
+        clustervar : Optional[list[str]]
+            The cluster variables.
+
+        Returns
+        -------
+        Optional[list[str]]
+            The needed columns, or None if the columns of the source are unknown.
+        """
+        names = self._column_names()
+        if names is None:
+            return None
+
+        tokens = set(re.findall(r"\w+", fml))
+        tokens.update([weights] if weights is not None else [])
+        for var in clustervar or []:
+            tokens.update(re.findall(r"\w+", var))
+            # interacted cluster variables are created from the fixed effects
+            tokens.update(var.split("_"))
+
+        return [x for x in names if x in tokens]
+
+    def _column_names(self) -> Optional[list[str]]:
+        if self._dataset is not None:
+            return list(self._dataset.schema.names)
+        if isinstance(self._data, (pd.DataFrame, pl.DataFrame)):
+            return [str(x) for x in self._data.columns]
+        return None
+
+    def iter_chunks(
+        self, columns: Optional[list[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the data source in chunks.
+
+        Parameters
+        ----------
+        columns : Optional[list[str]]
+            The columns to read. Only used for sources with known columns.
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+            The chunks as pandas DataFrames with a default index.
+        """
+        if self._n_iter > 0 and not self.reiterable:
+            raise ValueError("The data source can only be iterated once.")
+        self._n_iter += 1
+
+        data = self._data
+        if self._dataset is not None:
+            chunks: Iterable[Any] = self._dataset.to_batches(
+                columns=columns, batch_size=self._batch_size
+            )
+        elif isinstance(data, (pd.DataFrame, pl.DataFrame)):
+            if columns is not None:
+                data = data[columns]
+            chunks = (
+                data[start : start + self._batch_size]
+                for start in range(0, data.shape[0], self._batch_size)
+            )
+        elif isinstance(data, (list, tuple)):
+            chunks = data
+        elif callable(data) and not isinstance(data, Iterator):
+            chunks = data()
+        else:
+            # an iterator of chunks
+            chunks = cast(Iterable[Any], data)
+
+        for chunk in chunks:
+            yield _chunk_to_pandas(chunk)
+
+
+class _LevelRegistry:
+    "Map the levels of a variable to integer codes consistently across chunks."
+
+    def __init__(self) -> None:
+        self.levels: Optional[pd.Index] = None
+
+    @property
+    def n_levels(self) -> int:
+        return 0 if self.levels is None else len(self.levels)
+
+    def encode(self, values: pd.Series, grow: bool = True) -> np.ndarray:
+        """
+        Encode the values of a chunk as integer codes.
+
+        Parameters
+        ----------
+        values : pd.Series
+            The values of the chunk, without missing values.
+        grow : bool
+            Whether unseen levels are added. If False, unseen levels raise
+            a ValueError.
+
+        Returns
+        -------
+        np.ndarray
+            The integer codes of the values.
+        """
+        codes, uniques = pd.factorize(values)
+        uniques = pd.Index(uniques)
+        if self.levels is None:
+            self.levels = pd.Index([], dtype=uniques.dtype)
+
+        idx = self.levels.get_indexer(uniques)
+        is_new = idx < 0
+        if np.any(is_new):
+            if not grow:
+                raise ValueError(
+                    "The data source yielded different data in the second pass over the data."
+                )
+            idx[is_new] = self.levels.size + np.arange(np.sum(is_new))
+            self.levels = self.levels.append(uniques[is_new])
+
+        return idx[codes]
+
+
+def _indicator(
+    codes: np.ndarray, n_levels: int, weights: Optional[np.ndarray] = None
+) -> sparse.csr_matrix:
+    "Create a sparse (n_levels x N) indicator matrix, optionally weighted."
+    N = codes.size
+    data = np.ones(N) if weights is None else weights
+    return sparse.csr_matrix((data, (codes, np.arange(N))), shape=(n_levels, N))
+
+
+def _pad_rows(x: np.ndarray, n_rows: int, n_cols: int) -> np.ndarray:
+    "Pad a matrix with rows of zeros up to `n_rows` rows."
+    if x.shape[0] == 0:
+        return np.zeros((n_rows, n_cols))
+    if x.shape[0] < n_rows:
+        return np.vstack([x, np.zeros((n_rows - x.shape[0], n_cols))])
+    return x
+
+
+def _partial_out_fixef(
+    VtV: np.ndarray,
+    Dtw: list[np.ndarray],
+    DtV: list[np.ndarray],
+    DtD: dict[tuple[int, int], sparse.csr_matrix],
+    tol: float = 1e-10,
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    """
+    Partial out fixed effects from the sufficient statistics of V = [y, X].
+
+    The fixed effect with the most levels is absorbed via its (diagonal) block
+    of D'WD, all other fixed effects via the dense Schur complement of that
+    block. The cost is thus cubic in the number of levels of all but the
+    largest fixed effect.
+
+    Parameters
+    ----------
+    VtV : np.ndarray
+        The matrix V'WV.
+    Dtw : list[np.ndarray]
+        For each fixed effect, the sum of weights per level, i.e. the
+        diagonal of D_j'WD_j.
+    DtV : list[np.ndarray]
+        For each fixed effect j, the matrix D_j'WV.
+    DtD : dict[tuple[int, int], sparse.csr_matrix]
+        For each pair of fixed effects j < h, the sparse matrix D_j'WD_h.
+    tol : float
+        The relative tolerance for the eigenvalues of the Schur complement.
+        Smaller eigenvalues are treated as zero, as the fixed effects
+        are not jointly identified.
+
+    Returns
+    -------
+    tuple[np.ndarray, list[np.ndarray]]
+        The matrix V'WMV, where M is the annihilator of the fixed effects, and
+        for each fixed effect the coefficients of V on the fixed effects, i.e.
+        MV = V - sum_j D_j @ coefs[j].
+    """
+    n_fe = len(DtV)
+    n_levels = [x.shape[0] for x in DtV]
+    # pad all statistics to the final number of levels
+    DtV = [_pad_rows(x, n, VtV.shape[1]) for x, n in zip(DtV, n_levels)]
+
+    def cross(j: int, h: int) -> sparse.csr_matrix:
+        M = DtD[(j, h)].copy() if j < h else DtD[(h, j)].T.tocsr()
+        M.resize((n_levels[j], n_levels[h]))
+        return M
+
+    a = int(np.argmax(n_levels))
+    rest = [j for j in range(n_fe) if j != a]
+
+    A = Dtw[a]
+    A_inv = np.divide(1.0, A, out=np.zeros_like(A), where=A > 0)
+
+    da = DtV[a]
+    VtMV = VtV - da.T @ (A_inv[:, None] * da)
+    coefs: list[np.ndarray] = [np.empty(0)] * n_fe
+
+    if not rest:
+        coefs[a] = A_inv[:, None] * da
+        return VtMV, coefs
+
+    B = sparse.hstack([cross(a, h) for h in rest]).tocsr()
+    E = sparse.bmat(
+        [[sparse.diags(Dtw[j]) if j == h else cross(j, h) for h in rest] for j in rest]
+    )
+    S = E.toarray() - (B.T @ sparse.diags(A_inv) @ B).toarray()
+    dr = np.vstack([DtV[j] for j in rest])
+    r = dr - B.T @ (A_inv[:, None] * da)
+
+    # pseudo-inverse of the Schur complement
+    eigval, eigvec = np.linalg.eigh(S)
+    pos = eigval > tol * max(np.max(np.abs(eigval)), 1.0)
+    gamma = eigvec[:, pos] @ ((eigvec[:, pos].T @ r) / eigval[pos][:, None])
+
+    VtMV = VtMV - r.T @ gamma
+    coefs[a] = A_inv[:, None] * (da - B @ gamma)
+    offsets = np.cumsum([0] + [n_levels[j] for j in rest])
+    for i, j in enumerate(rest):
+        coefs[j] = gamma[offsets[i] : offsets[i + 1]]
+
+    return VtMV, coefs
+
+
+def _arrow_dataset(
+    data: Any, path: Optional[Union[str, os.PathLike, list, tuple]] = None
+) -> Any:
+    "Wrap a pyarrow Table or Dataset, or parquet file(s) at `path`, as a Dataset."
+    try:
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError(
+            """pyarrow is not installed. Please install pyarrow to read
+            parquet files in chunks."""
+        )
+
+    if path is None:
+        return data if isinstance(data, ds.Dataset) else ds.dataset(data)
+
+    if isinstance(path, (list, tuple)):
+        path = [os.fspath(x) for x in path]
+    else:
+        path = os.fspath(path)
+
+    return ds.dataset(path, format="parquet")
+
+
+def _chunk_to_pandas(chunk: Any) -> pd.DataFrame:
+    "Convert a chunk to a pandas DataFrame with a default index."
+    if isinstance(chunk, pl.DataFrame):
+        chunk = _polars_to_pandas(chunk)
+    elif not isinstance(chunk, pd.DataFrame):
+        if not hasattr(chunk, "to_pandas"):
+            raise TypeError(
+                f"Chunks must be pandas or polars DataFrames or pyarrow RecordBatches, but got {type(chunk)}."
+            )
+        chunk = chunk.to_pandas()
+
+    # new frame: model_matrix_fixest() adds interacted fixed effects as columns
+    return chunk.reset_index(drop=True)
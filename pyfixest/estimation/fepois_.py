@@ -1,7 +1,8 @@
+import time
 import warnings
-from importlib import import_module
 from typing import Optional, Protocol, Union
 
+import numba as nb
 import numpy as np
 import pandas as pd
 
@@ -9,10 +10,20 @@ from pyfixest.errors import (
     NonConvergenceError,
     NotImplementedError,
 )
-from pyfixest.estimation.demean_ import demean
+from pyfixest.estimation.demean_ import _demean_array
+from pyfixest.estimation.demean_cache_ import DemeanCache
 from pyfixest.estimation.feols_ import Feols
+from pyfixest.estimation.fixef_index_ import FixedEffectsIndex
 from pyfixest.estimation.FormulaParser import FixestFormula
-from pyfixest.utils.dev_utils import DataFrameType, _to_integer
+from pyfixest.estimation.glm_family_ import GLMFamily, Poisson
+from pyfixest.utils.dev_utils import DataFrameType
+
+# the initial tolerance of the demeaning in the IRLS algorithm
+_IRLS_INITIAL_FIXEF_TOL = 1e-4
+# the maximum number of step halvings per iteration of the IRLS algorithm
+_IRLS_MAX_STEP_HALVINGS = 10
+# the over-relaxation factor of the iterative rectifier separation check
+_RELU_OVERRELAXATION = 1.5
 
 
 class Fepois(Feols):
@@ -54,7 +65,12 @@ class Fepois(Feols):
         Solver to use for the estimation. Alternative is 'np.linalg.lstsq'.
     fixef_tol: float, default = 1e-08.
         Tolerance level for the convergence of the demeaning algorithm.
-    solver:
+    demeaner: str, default is 'map'
+        Demeaning algorithm. Alternative is 'irons_tuck'.
+    fixef_sort: bool, default is False
+        Whether to sort the observations by fixed effect groups for demeaning.
+    fixef_index: Optional[FixedEffectsIndex]
+        A precomputed index of the fixed effects of the estimation sample.
     weights_name : Optional[str]
         Name of the weights variable.
     weights_type : Optional[str]
@@ -62,6 +78,11 @@ class Fepois(Feols):
     _data: pd.DataFrame
         The data frame used in the estimation. None if arguments `lean = True` or
         `store_data = False`.
+    irls_trace: pd.DataFrame
+        The trace of the IRLS algorithm, with one row per iteration: the
+        deviance, the convergence criterion, the number of step halvings, the
+        tolerance and the maximum number of iterations of the demeaning, and
+        the wall time in seconds.
     """
 
     def __init__(
@@ -75,7 +96,7 @@ class Fepois(Feols):
         weights_type: Optional[str],
         collin_tol: float,
         fixef_tol: float,
-        lookup_demeaned_data: dict[str, pd.DataFrame],
+        demean_cache: Optional[DemeanCache],
         tol: float,
         maxiter: int,
         solver: str = "np.linalg.solve",
@@ -85,6 +106,9 @@ class Fepois(Feols):
         sample_split_var: Optional[str] = None,
         sample_split_value: Optional[Union[str, int]] = None,
         separation_check: Optional[list[str]] = None,
+        demeaner: str = "map",
+        fixef_sort: bool = False,
+        fixef_index: Optional[FixedEffectsIndex] = None,
     ):
         super().__init__(
             FixestFormula,
@@ -96,13 +120,16 @@ class Fepois(Feols):
             weights_type,
             collin_tol,
             fixef_tol,
-            lookup_demeaned_data,
+            demean_cache,
             solver,
             store_data,
             copy_data,
             lean,
             sample_split_var,
             sample_split_value,
+            demeaner=demeaner,
+            fixef_sort=fixef_sort,
+            fixef_index=fixef_index,
         )
 
         # input checks
@@ -118,6 +145,9 @@ class Fepois(Feols):
         self._support_iid_inference = True
         self._supports_cluster_causal_variance = False
 
+        self._family: GLMFamily = Poisson()
+        self._dispersion = 1.0
+
         self._Y_hat_response = np.array([])
         self.deviance = None
         self._Xbeta = np.array([])
@@ -126,13 +156,8 @@ class Fepois(Feols):
         "Prepare model inputs for estimation."
         super().prepare_model_matrix()
 
-        # check if Y is a weakly positive integer
-        self._Y = _to_integer(self._Y)
-        # check that self._Y is a weakly positive integer
-        if np.any(self._Y < 0):
-            raise ValueError(
-                "The dependent variable must be a weakly positive integer."
-            )
+        # check the support of the dependent variable
+        self._Y = self._family.check_outcome(self._Y)
 
         # check for separation
         na_separation: list[int] = []
@@ -141,20 +166,22 @@ class Fepois(Feols):
             and self.separation_check is not None
             and self.separation_check  # not an empty list
         ):
-            na_separation = _check_for_separation(
-                Y=self._Y,
-                X=self._X,
-                fe=self._fe,
-                fml=self._fml,
-                data=self._data,
-                methods=self.separation_check,
-            )
+            for Y_boundary in self._family.separation_outcomes(self._Y):
+                na_separation += _check_for_separation(
+                    Y=Y_boundary,
+                    X=self._X,
+                    fe=self._fe,
+                    fml=self._fml,
+                    data=self._data,
+                    methods=self.separation_check,
+                )
 
         if na_separation:
             self._Y.drop(na_separation, axis=0, inplace=True)
             self._X.drop(na_separation, axis=0, inplace=True)
             self._fe.drop(na_separation, axis=0, inplace=True)
-            self._data.drop(na_separation, axis=0, inplace=True)
+            # the data may be shared with other models, do not modify it in place
+            self._data = self._data.drop(na_separation, axis=0)
             self._N = self._Y.shape[0]
 
             self.na_index = np.concatenate([self.na_index, np.array(na_separation)])
@@ -176,10 +203,22 @@ class Fepois(Feols):
         """
         Fit a Poisson Regression Model via Iterated Weighted Least Squares (IWLS).
 
+        The link, variance and deviance are taken from the GLM family of the
+        model, which is the Poisson family for `Fepois`. If the deviance of an
+        iteration is not finite or increases, the step is halved up to
+        `_IRLS_MAX_STEP_HALVINGS` times. The iterations are recorded in the
+        `irls_trace` attribute.
+
         Returns
         -------
         None
 
+        Raises
+        ------
+        NonConvergenceError
+            If the algorithm does not converge in `maxiter` iterations or the
+            deviance is not finite even after halving the step.
+
         Attributes
         ----------
         beta_hat : np.ndarray
@@ -204,62 +243,79 @@ class Fepois(Feols):
         _X = self._X
         _fe = self._fe
         _N = self._N
-        _convergence = self.convergence  # False
+        _convergence = False
         _maxiter = self.maxiter
         _tol = self.tol
         _fixef_tol = self._fixef_tol
+        _demeaner = self._demeaner
         _solver = self._solver
+        _family = self._family
 
-        def compute_deviance(_Y: np.ndarray, mu: np.ndarray):
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                deviance = (
-                    2 * np.sum(np.where(_Y == 0, 0, _Y * np.log(_Y / mu)) - (_Y - mu))
-                ).flatten()
-            return deviance
-
-        stop_iterating = False
         crit = 1
+        # as in ppmlhdfe, the demeaning starts with a loose tolerance that is
+        # tightened to `_fixef_tol` as the IRLS algorithm converges
+        inner_tol = max(_fixef_tol, _IRLS_INITIAL_FIXEF_TOL)
+        warm_start: Optional[tuple[np.ndarray, np.ndarray]] = None
+        delta_old = np.zeros((_X.shape[1], 1))
+        trace = []
 
         for i in range(_maxiter):
-            if stop_iterating:
-                _convergence = True
-                break
-            if i == _maxiter:
-                raise NonConvergenceError(
-                    f"""
-                    The IRLS algorithm did not converge with {_maxiter}
-                    iterations. Try to increase the maximum number of iterations.
-                    """
-                )
+            iteration_start = time.perf_counter()
+            demean_tol = inner_tol
+            n_iter = np.zeros(1, dtype=np.int64)
 
             if i == 0:
-                _mean = np.mean(_Y)
-                mu = (_Y + _mean) / 2
-                eta = np.log(mu)
-                Z = eta + _Y / mu - 1
-                reg_Z = Z.copy()
-                last = compute_deviance(_Y, mu)
-
+                mu = _family.initialize(_Y)
+                eta = _family.link(mu)
+                last = _family.deviance(_Y, mu)
+                param_change = 0.0
             else:
-                # update w and Z
-                Z = eta + _Y / mu - 1  # eq (8)
-                reg_Z = Z.copy()  # eq (9)
-
-            # tighten HDFE tolerance - currently not possible with PyHDFE
-            # if crit < 10 * inner_tol:
-            #    inner_tol = inner_tol / 10
+                # update the ancillary parameters of the family for the fitted
+                # means, e.g. theta of the negative binomial
+                param_change = _family.update(_Y, mu)
+                if param_change > 0:
+                    last = _family.deviance(_Y, mu)
+
+            # update w and Z
+            mu_eta = _family.mu_eta(eta)
+            irls_weights = mu_eta**2 / _family.variance(mu)
+            Z = eta + (_Y - mu) / mu_eta  # eq (8)
+            reg_Z = Z.copy()  # eq (9)
 
             # Step 1: weighted demeaning
             ZX = np.concatenate([reg_Z, _X], axis=1)
 
             if _fe is not None:
-                # ZX_resid = algorithm.residualize(ZX, mu)
-                ZX_resid, success = demean(
-                    x=ZX, flist=_fe, weights=mu.flatten(), tol=_fixef_tol
+                # Warm start: the residuals of the last iteration differ from
+                # ZX_last by a linear combination of the fixed effects, which
+                # the demeaning removes for any weights. Hence demeaning
+                # ZX_resid_last + (ZX - ZX_last) yields the residuals of ZX, but
+                # starts from a point close to the solution.
+                if warm_start is None:
+                    ZX_start = ZX
+                else:
+                    ZX_last, ZX_resid_last = warm_start
+                    ZX_start = ZX_resid_last + (ZX - ZX_last)
+                # only the first iteration is looked up in the cache: later
+                # iterations have new weights and warm-started inputs, which
+                # would never be found in it
+                demean_func = (
+                    self._demean_cache.demean
+                    if self._demean_cache is not None and warm_start is None
+                    else _demean_array
+                )
+                ZX_resid, n_iter = demean_func(
+                    x=ZX_start,
+                    flist=_fe,
+                    weights=irls_weights.flatten(),
+                    tol=inner_tol,
+                    demeaner=_demeaner,
+                    sort_by_group=self._fixef_sort,
+                )
+                warm_start = (ZX, ZX_resid)
+                self._demean_iterations = pd.Series(
+                    n_iter, index=[self._depvar, *self._coefnames]
                 )
-                if success is False:
-                    raise ValueError("Demeaning failed after 100_000 iterations.")
             else:
                 ZX_resid = ZX
 
@@ -267,8 +323,8 @@ class Fepois(Feols):
             X_resid = ZX_resid[:, 1:]  # x_resid
 
             # Step 2: estimate WLS
-            WX = np.sqrt(mu) * X_resid
-            WZ = np.sqrt(mu) * Z_resid
+            WX = np.sqrt(irls_weights) * X_resid
+            WZ = np.sqrt(irls_weights) * Z_resid
 
             XWX = WX.transpose() @ WX
             XWZ = WX.transpose() @ WZ
@@ -278,18 +334,78 @@ class Fepois(Feols):
             )  # eq (10), delta_new -> reg_z
             resid = Z_resid - X_resid @ delta_new
 
-            mu_old = mu.copy()
+            weights_old = irls_weights
             # more updating
+            eta_old = eta
             eta = Z - resid
-            mu = np.exp(eta)
+            mu = _family.inverse_link(eta)
+            deviance = _family.deviance(_Y, mu)
+
+            # step halving: if the deviance is not finite or, after the first
+            # iteration, increases by more than the precision of the demeaning,
+            # move eta only part of the way from its last value
+            step_halvings = 0
+            step = 1.0
+            while (
+                not np.isfinite(deviance).all()
+                or (
+                    i > 0
+                    and (deviance - last) / (0.1 + np.abs(last)) > max(_tol, demean_tol)
+                )
+            ) and step_halvings < _IRLS_MAX_STEP_HALVINGS:
+                step_halvings += 1
+                step /= 2
+                eta = eta_old + step * (Z - resid - eta_old)
+                mu = _family.inverse_link(eta)
+                deviance = _family.deviance(_Y, mu)
+
+            if not np.isfinite(deviance).all():
+                raise NonConvergenceError(
+                    f"The deviance of the IRLS algorithm is not finite in iteration {i + 1}, "
+                    f"even after {_IRLS_MAX_STEP_HALVINGS} step halvings."
+                )
+            if step_halvings > 0:
+                delta_new = delta_old + step * (delta_new - delta_old)
+                resid = Z - eta
+            delta_old = delta_new
 
             # same criterion as fixest
             # https://github.com/lrberge/fixest/blob/6b852fa277b947cea0bad8630986225ddb2d6f1b/R/ESTIMATION_FUNS.R#L2746
-            deviance = compute_deviance(_Y, mu)
-            crit = np.abs(deviance - last) / (0.1 + np.abs(last))
+            crit = max(
+                (np.abs(deviance - last) / (0.1 + np.abs(last))).item(), param_change
+            )
             last = deviance.copy()
 
-            stop_iterating = crit < _tol
+            trace.append(
+                {
+                    "iteration": i + 1,
+                    "deviance": deviance.item(),
+                    "crit": crit,
+                    "step_halvings": step_halvings,
+                    "demean_tol": demean_tol if _fe is not None else np.nan,
+                    "demean_iterations": int(np.max(n_iter)),
+                    "time": time.perf_counter() - iteration_start,
+                }
+            )
+
+            # only stop if the last demeaning used the target tolerance
+            if crit < _tol and (_fe is None or demean_tol <= _fixef_tol):
+                _convergence = True
+                break
+            if crit < _tol:
+                inner_tol = _fixef_tol
+            elif crit < 10 * inner_tol:
+                inner_tol = max(inner_tol / 10, _fixef_tol)
+
+        self.irls_trace = pd.DataFrame(trace).set_index("iteration")
+
+        if not _convergence:
+            raise NonConvergenceError(
+                f"The IRLS algorithm did not converge in {_maxiter} iterations: the "
+                f"relative change of the deviance in the last iteration is {crit:.3g}, "
+                f"the tolerance is {_tol:.3g}. Try to increase the maximum number of "
+                "iterations via `iwls_maxiter`."
+            )
 
         self._beta_hat = delta_new.flatten()
         self._Y_hat_response = mu
@@ -298,15 +414,17 @@ class Fepois(Feols):
         # needed for the calculation of the vcov
 
         # updat for inference
-        self._weights = mu_old
-        self._irls_weights = mu
+        self._weights = weights_old
+        self._irls_weights = _family.mu_eta(eta) ** 2 / _family.variance(mu)
         # if only one dim
         if self._weights.ndim == 1:
             self._weights = self._weights.reshape((self._N, 1))
 
         self._u_hat = (WZ - WX @ delta_new).flatten()
         self._u_hat_working = resid
-        self._u_hat_response = self._Y - np.exp(eta)
+        self._u_hat_response = self._Y - mu
+        # as for sigma2 in `_vcov_iid()`, degrees of freedom enter via the ssc
+        self._dispersion = _family.dispersion(_Y, mu, _N - 1)
 
         self._Y = WZ
         self._X = WX
@@ -317,11 +435,10 @@ class Fepois(Feols):
         self._tZXinv = np.linalg.inv(self._tZX)
         self._Xbeta = eta
 
-        self._scores = self._u_hat[:, None] * self._X
         self._hessian = XWX
 
-        if _convergence:
-            self._convergence = True
+        self._convergence = True
+        self.convergence = True
 
     def resid(self, type: str = "response") -> np.ndarray:
         """
@@ -410,7 +527,7 @@ class Fepois(Feols):
         if type == "link":
             return _Xbeta  # np.exp(_Xbeta)
         elif type == "response":
-            return np.exp(_Xbeta)
+            return self._family.inverse_link(_Xbeta)
         else:
             raise ValueError("type must be one of 'response' or 'link'.")
 
@@ -536,29 +653,58 @@ def _check_for_separation_fe(
     """
     separation_na: set[int] = set()
     if fe is not None and not (Y > 0).all(axis=0).all():
-        Y_help = (Y > 0).astype(int).squeeze()
-
-        # loop over all elements of fe
-        for x in fe.columns:
-            ctab = pd.crosstab(Y_help, fe[x])
-            null_column = ctab.xs(0)
-            # sep_candidate if
-            # fixed effect level has only observations with Y > 0
-            sep_candidate = (np.sum(ctab > 0, axis=0).values == 1) & (
-                null_column > 0
-            ).to_numpy().flatten()
-            # droplist: list of levels to drop
-            droplist = ctab.xs(0)[sep_candidate].index.tolist()
-
-            # dropset: list of indices to drop
-            if len(droplist) > 0:
-                fe_in_droplist = fe[x].isin(droplist)
-                dropset = set(fe[x][fe_in_droplist].index)
-                separation_na = separation_na.union(dropset)
+        is_separated = _separation_fe_mask(
+            is_positive=(Y.to_numpy() > 0).all(axis=1),
+            ids=np.asfortranarray(fe.to_numpy().astype(np.uint32)),
+        )
+        separation_na = set(fe.index[is_separated])
 
     return separation_na
 
 
+@nb.njit
+def _separation_fe_mask(is_positive: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """
+    Detect observations in fixed effect levels with only zero outcomes.
+
+    Counts the observations with a positive outcome for each level of each
+    fixed effect in one pass over the integer coded fixed effects. Unlike for
+    `detect_singletons()`, no iteration to a fixed point is needed: only
+    observations with a zero outcome are dropped, so the number of positive
+    observations of any remaining level never changes.
+
+    Parameters
+    ----------
+    is_positive : np.ndarray
+        A boolean array of shape (n_samples,) indicating a positive outcome.
+    ids : np.ndarray
+        A 2D array of shape (n_samples, n_features) of non-negative integer
+        fixed effect identifiers, preferably in column-major order.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean array of shape (n_samples,) indicating the separated
+        observations.
+    """
+    n_samples, n_features = ids.shape
+    counts = np.empty(np.max(ids) + 1, dtype=np.uint32)
+    is_separated = np.zeros(n_samples, dtype=np.bool_)
+
+    for j in range(n_features):
+        col = ids[:, j]
+
+        counts[:] = 0
+        for i in range(n_samples):
+            counts[col[i]] += is_positive[i]
+
+        for i in range(n_samples):
+            if counts[col[i]] == 0:
+                is_separated[i] = True
+
+    return is_separated
+
+
 def _check_for_separation_ir(
     fml: str,
     data: pd.DataFrame,
@@ -594,64 +740,23 @@ def _check_for_separation_ir(
     set
         Set of indices of separated observations.
     """
-    # lazy load to avoid circular import
-    fixest_module = import_module("pyfixest.estimation")
-    feols = getattr(fixest_module, "feols")
-    # initialize
     separation_na: set[int] = set()
-    tmp_suffix = "_separationTmp"
-    # build formula
-    name_dependent, rest = fml.split("~")
-    name_dependent_separation = "U"
-    if name_dependent_separation in data.columns:
-        name_dependent_separation += tmp_suffix
-
-    fml_separation = f"{name_dependent_separation} ~ {rest}"
 
-    dependent: pd.Series = data[name_dependent]
-    is_interior = dependent > 0
+    is_interior = Y.to_numpy().min(axis=1) > 0
     if is_interior.all():
         # no boundary sample, can exit
         return separation_na
 
-    # initialize variables
-    tmp: pd.DataFrame = pd.DataFrame(index=data.index)
-    tmp["U"] = (dependent == 0).astype(float).rename("U")
-    # weights
-    N0 = (dependent > 0).sum()
-    K = N0 / tol**2
-    tmp["omega"] = pd.Series(
-        np.where(dependent > 0, K, 1), name="omega", index=data.index
+    is_separated = _separation_relu(
+        is_interior=is_interior,
+        X=X.to_numpy().astype(np.float64),
+        fe=np.asfortranarray(fe.to_numpy().astype(np.uint32)),
+        tol=tol,
+        maxiter=maxiter,
     )
-    # combine data
-    # TODO: avoid create new object?
-    tmp = data.join(tmp, how="left", validate="one_to_one", rsuffix=tmp_suffix)
-    # TODO: need to ensure that join doesn't create duplicated columns
-    # assert not tmp.columns.duplicated().any()
-
-    iteration = 0
-    has_converged = False
-    while iteration < maxiter:
-        iteration += 1
-        # regress U on X
-        # TODO: check acceleration in ppmlhdfe's implementation: https://github.com/sergiocorreia/ppmlhdfe/blob/master/src/ppmlhdfe_separation_relu.mata#L135
-        fitted = feols(fml_separation, data=tmp, weights="omega")
-        tmp["Uhat"] = pd.Series(fitted.predict(), index=fitted._data.index, name="Uhat")
-        Uhat = tmp["Uhat"]
-        # update when within tolerance of zero
-        # need to be more strict below zero to avoid false positives
-        within_zero = (Uhat > -0.1 * tol) & (Uhat < tol)
-        Uhat.where(~(is_interior | within_zero.fillna(True)), 0, inplace=True)
-        if (Uhat >= 0).all():
-            # all separated observations have been identified
-            has_converged = True
-            break
-        tmp.loc[~is_interior, "U"] = np.fmax(
-            Uhat[~is_interior], 0
-        )  # rectified linear unit (ReLU)
-
-    if has_converged:
-        separation_na = set(dependent[Uhat > 0].index)
+
+    if is_separated is not None:
+        separation_na = set(Y.index[is_separated])
     else:
         warnings.warn(
             "iterative rectivier separation check: maximum number of iterations reached before convergence"
@@ -660,6 +765,96 @@ def _check_for_separation_ir(
     return separation_na
 
 
+def _separation_relu(
+    is_interior: np.ndarray,
+    X: np.ndarray,
+    fe: np.ndarray,
+    tol: float = 1e-4,
+    maxiter: int = 100,
+    fixef_tol: float = 1e-08,
+    accelerate: bool = True,
+) -> Optional[np.ndarray]:
+    """
+    Detect separated observations via the iterative rectifier (ReLU) algorithm.
+
+    Iteratively regresses U on X and the fixed effects by WLS, with a large
+    weight K on the interior observations, and sets U to the positive part of
+    the fitted values on the boundary observations. As the weights do not
+    change, X is demeaned only once; in each iteration only U is demeaned,
+    warm-started from its residuals of the last iteration.
+
+    Parameters
+    ----------
+    is_interior : np.ndarray
+        A boolean array of shape (N,) indicating observations with a positive
+        outcome.
+    X : np.ndarray
+        The design matrix of shape (N, k).
+    fe : np.ndarray
+        The integer coded fixed effects of shape (N, n_fixef).
+    tol : float
+        Tolerance to detect separated observations. Defaults to 1e-4.
+    maxiter : int
+        Maximum number of iterations. Defaults to 100.
+    fixef_tol : float
+        Tolerance of the demeaning. Defaults to 1e-08.
+    accelerate : bool
+        Whether to over-relax the update of U on the boundary observations
+        that are still predicted to be positive, which has the same fixed
+        point but needs fewer iterations, as in ppmlhdfe. Defaults to True.
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        A boolean array of shape (N,) indicating the separated observations,
+        or None if the algorithm did not converge.
+    """
+    is_boundary = ~is_interior
+    N0 = is_interior.sum()
+    K = N0 / tol**2
+    omega = np.where(is_interior, K, 1.0)
+    sqrt_omega = np.sqrt(omega)
+
+    X_resid, _ = _demean_array(x=X, flist=fe, weights=omega, tol=fixef_tol)
+    WX = sqrt_omega[:, None] * X_resid
+
+    U = is_boundary.astype(np.float64)
+    U_last = np.zeros_like(U)
+    U_resid = np.zeros_like(U)
+
+    for _ in range(maxiter):
+        # U_resid differs from U_last by fixed effects only: warm start
+        U_resid, _ = _demean_array(
+            x=(U_resid + (U - U_last))[:, None], flist=fe, weights=omega, tol=fixef_tol
+        )
+        U_resid = U_resid[:, 0]
+        U_last = U
+
+        # regress U on X and the fixed effects, Uhat = U - resid
+        if WX.shape[1] > 0:
+            beta = np.linalg.lstsq(WX, sqrt_omega * U_resid, rcond=None)[0]
+            resid = U_resid - X_resid @ beta
+        else:
+            resid = U_resid
+        Uhat = U - resid
+
+        # update when within tolerance of zero
+        # need to be more strict below zero to avoid false positives
+        within_zero = (Uhat > -0.1 * tol) & (Uhat < tol)
+        Uhat[is_interior | within_zero] = 0
+        if np.all(Uhat >= 0):
+            # all separated observations have been identified
+            return Uhat > 0
+
+        # rectified linear unit (ReLU)
+        U_new = np.where(is_boundary, np.fmax(Uhat, 0), U)
+        if accelerate:
+            U_new = np.fmax(U + _RELU_OVERRELAXATION * (U_new - U), 0)
+        U = U_new
+
+    return None
+
+
 def _fepois_input_checks(drop_singletons: bool, tol: float, maxiter: int):
     """
     Perform input checks for Fepois constructor arguments.
@@ -0,0 +1,334 @@
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csc_matrix
+
+from pyfixest.estimation.detect_singletons_ import detect_singletons
+from pyfixest.estimation.vcov_utils import bucket_argsort
+from pyfixest.utils.dev_utils import DataFrameType, _polars_to_pandas
+
+
+class FixedEffectsIndex:
+    """
+    A reusable integer encoding of the fixed effects of a data set.
+
+    Factorizing the fixed effects columns and deriving the group structure
+    (group sizes, group weights, singleton observations) is the same for all
+    models that are fit on the same data and share fixed effects. A
+    `FixedEffectsIndex` performs this work once and can be passed to `feols()`
+    and `fepois()` via the `fixef_index` argument, where it replaces the
+    factorization of the fixed effects, is reused for singleton detection,
+    demeaning, CRV inference (when clustering by a fixed effect) and the
+    recovery of the fixed effects via `fixef()`.
+
+    The index is tied to the row order of the data set it was built from and
+    needs to be rebuilt if rows are added, dropped or reordered.
+
+    Parameters
+    ----------
+    data : DataFrameType
+        A pandas or polars DataFrame containing the fixed effects.
+    fixef : str or list[str]
+        The fixed effects, either as a fixest formula string, e.g.
+        "firm + year", or as a list of column names. Interacted fixed effects
+        can be specified via the `^` syntax, e.g. "firm^year".
+
+    Attributes
+    ----------
+    names : list[str]
+        The names of the fixed effects. Interactions `f1^f2` are named `f1_f2`,
+        following the naming convention of `feols()`.
+    codes : np.ndarray
+        An integer array of shape (n_obs, n_fixef) with the group identifiers
+        of each observation. Missing values are coded as -1.
+    levels : list[pd.Index]
+        The levels of each fixed effect. `levels[j][g]` is the level of group
+        `g` of fixed effect `j`.
+    n_groups : np.ndarray
+        The number of groups of each fixed effect.
+    counts : list[np.ndarray]
+        The number of observations in each group, for each fixed effect.
+    order : np.ndarray
+        An array of shape (n_obs, n_fixef). `order[:, j]` sorts the observations
+        by the groups of fixed effect `j`; observations with missing values are
+        sorted last.
+    offsets : list[np.ndarray]
+        The group boundaries in `order`: the observations of group `g` of fixed
+        effect `j` are `order[offsets[j][g]:offsets[j][g + 1], j]`.
+    singletons : np.ndarray
+        A boolean array of shape (n_obs,) indicating observations that are
+        singletons with respect to all fixed effects in the index (see
+        `detect_singletons()`). Observations with missing values are never
+        flagged as singletons.
+    has_missing : np.ndarray
+        A boolean array of shape (n_obs,) indicating observations with a
+        missing value in at least one fixed effect.
+
+    Examples
+    --------
+    ```{python}
+    import pyfixest as pf
+    from pyfixest.estimation import FixedEffectsIndex
+
+    data = pf.get_data()
+    index = FixedEffectsIndex(data, "f1 + f2")
+
+    fit1 = pf.feols("Y ~ X1 | f1 + f2", data, fixef_index=index)
+    fit2 = pf.feols("Y ~ X1 + X2 | f1", data, fixef_index=index)
+    ```
+    """
+
+    def __init__(self, data: DataFrameType, fixef: Union[str, list[str]]) -> None:
+        data = _polars_to_pandas(data)
+        fixef_list = _deparse_fixef(fixef)
+
+        # F-ordered, as expected by the demeaning algorithms
+        codes = np.empty((len(fixef_list), data.shape[0]), dtype=np.int32).T
+        levels = []
+        for j, fe in enumerate(fixef_list):
+            fe_col = _get_fixef_column(data, fe)
+            if fe_col.dtype != "category":
+                fe_col = fe_col.astype("category")
+            codes[:, j] = fe_col.cat.codes.to_numpy()
+            levels.append(fe_col.cat.categories)
+
+        self._init_from_codes(
+            names=[fe.replace("^", "_") for fe in fixef_list],
+            codes=codes,
+            levels=levels,
+        )
+
+    def _init_from_codes(
+        self, names: list[str], codes: np.ndarray, levels: list[pd.Index]
+    ) -> None:
+        self.names = names
+        self.codes = codes
+        self.levels = levels
+        self.n_obs, self.n_fixef = codes.shape
+        self.n_groups = np.array([len(x) for x in levels], dtype=np.int64)
+        self.has_missing = np.any(codes < 0, axis=1)
+
+        self.order = np.empty((self.n_fixef, self.n_obs), dtype=np.uint32).T
+        self.offsets = []
+        self.counts = []
+        for j in range(self.n_fixef):
+            # missing values are sorted into an additional, last bucket
+            codes_j = np.where(codes[:, j] < 0, self.n_groups[j], codes[:, j])
+            args, locs = bucket_argsort(codes_j.astype(np.uint32))
+            self.order[:, j] = args
+            locs = locs[: self.n_groups[j] + 1]
+            self.offsets.append(locs)
+            self.counts.append(np.diff(locs).astype(np.int64))
+
+        self.singletons = np.zeros(self.n_obs, dtype=bool)
+        complete = ~self.has_missing
+        if np.any(complete):
+            self.singletons[complete] = detect_singletons(codes[complete])
+
+        self._group_weights: Optional[np.ndarray] = None
+
+    @classmethod
+    def _from_codes(
+        cls, names: list[str], codes: np.ndarray, levels: list[pd.Index]
+    ) -> "FixedEffectsIndex":
+        "Construct an index from already factorized fixed effects."
+        index = cls.__new__(cls)
+        index._init_from_codes(names=names, codes=codes, levels=levels)
+        return index
+
+    def __repr__(self) -> str:
+        groups = ", ".join(f"{x}: {g}" for x, g in zip(self.names, self.n_groups))
+        return f"FixedEffectsIndex(n_obs={self.n_obs}, groups=({groups}))"
+
+    def take(self, rows: np.ndarray) -> "FixedEffectsIndex":
+        """
+        Restrict the index to a subset of observations.
+
+        The levels (and hence the group identifiers) are kept, so that the
+        fixed effects do not need to be factorized again.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            The positions of the observations to keep.
+
+        Returns
+        -------
+        FixedEffectsIndex
+            An index for the selected observations.
+        """
+        codes = np.asfortranarray(self.codes[rows])
+        return FixedEffectsIndex._from_codes(
+            names=self.names, codes=codes, levels=self.levels
+        )
+
+    def get_codes(
+        self,
+        names: Union[str, list[str]],
+        rows: Optional[np.ndarray] = None,
+        compact: bool = False,
+    ) -> np.ndarray:
+        """
+        Get the integer group identifiers of fixed effects.
+
+        Parameters
+        ----------
+        names : str or list[str]
+            The name(s) of the fixed effect(s).
+        rows : np.ndarray, optional
+            The positions of the observations. All observations by default.
+        compact : bool, optional
+            If True, the group identifiers are relabeled to 0, ..., G - 1 where G
+            is the number of groups present in `rows`. Missing values remain
+            coded as -1. False by default.
+
+        Returns
+        -------
+        np.ndarray
+            A 1D array for a single fixed effect or a 2D array of shape
+            (n_rows, n_names) otherwise.
+        """
+        is_str = isinstance(names, str)
+        names_list = [names] if isinstance(names, str) else list(names)
+        missing = [x for x in names_list if x not in self.names]
+        if missing:
+            raise KeyError(
+                f"The fixed effect(s) {missing} are not part of the FixedEffectsIndex."
+            )
+
+        idx = [self.names.index(x) for x in names_list]
+        if rows is None:
+            codes = self.codes[:, idx]
+        else:
+            codes = self.codes[np.asarray(rows)[:, None], idx]
+
+        if compact:
+            codes = codes.copy()
+            for j, i in enumerate(idx):
+                codes_j = codes[:, j]
+                observed = codes_j >= 0
+                present = np.bincount(codes_j[observed], minlength=self.n_groups[i])
+                relabel = np.cumsum(present > 0) - 1
+                codes_j[observed] = relabel[codes_j[observed]]
+
+        return codes[:, 0] if is_str else codes
+
+    def group_weights(self, names: Optional[list[str]] = None) -> np.ndarray:
+        """
+        Get the sum of (unit) weights of all groups.
+
+        Parameters
+        ----------
+        names : list[str], optional
+            The fixed effects for which to return the group weights. All fixed
+            effects in the index by default.
+
+        Returns
+        -------
+        np.ndarray
+            An array of shape (max(n_groups), n_names) in the format expected by
+            the demeaning algorithms.
+
+        Raises
+        ------
+        ValueError
+            If one of the requested fixed effects has missing values.
+        """
+        idx = (
+            list(range(self.n_fixef))
+            if names is None
+            else [self.names.index(x) for x in names]
+        )
+        if np.any(self.codes[:, idx] < 0):
+            raise ValueError(
+                "Group weights are not defined for fixed effects with missing values."
+            )
+
+        if self._group_weights is None:
+            # the group sizes, zero-padded to the largest number of groups
+            self._group_weights = np.zeros((self.n_fixef, np.max(self.n_groups))).T
+            for j, counts in enumerate(self.counts):
+                self._group_weights[: counts.size, j] = counts
+
+        return self._group_weights[:, idx]
+
+    def dummies(
+        self, names: list[str], rows: Optional[np.ndarray] = None
+    ) -> tuple[csc_matrix, list[tuple[str, str]]]:
+        """
+        Create a sparse matrix of fixed effect dummies.
+
+        The first fixed effect is fully encoded, for all other fixed effects the
+        first level present in `rows` is dropped (as is done by `fixest`).
+
+        Parameters
+        ----------
+        names : list[str]
+            The fixed effects to encode.
+        rows : np.ndarray, optional
+            The positions of the observations. All observations by default.
+
+        Returns
+        -------
+        tuple[csc_matrix, list[tuple[str, str]]]
+            The sparse dummy matrix and a list with the fixed effect name and
+            level (as a string) of each column.
+        """
+        codes = self.get_codes(names, rows=rows)
+        n_rows = codes.shape[0]
+        row_idx = np.arange(n_rows)
+
+        blocks_row, blocks_col, colnames = [], [], []
+        n_cols = 0
+        for j, name in enumerate(names):
+            i = self.names.index(name)
+            present = np.flatnonzero(np.bincount(codes[:, j], minlength=1))
+            if j > 0:
+                present = present[1:]
+            relabel = np.full(self.n_groups[i], -1, dtype=np.int64)
+            relabel[present] = np.arange(present.size)
+            col_j = relabel[codes[:, j]]
+            keep = col_j >= 0
+            blocks_row.append(row_idx[keep])
+            blocks_col.append(col_j[keep] + n_cols)
+            n_cols += present.size
+            colnames += [(name, str(level)) for level in self.levels[i][present]]
+
+        rows_all = np.concatenate(blocks_row)
+        cols_all = np.concatenate(blocks_col)
+        D = csc_matrix(
+            (np.ones(rows_all.size), (rows_all, cols_all)), shape=(n_rows, n_cols)
+        )
+
+        return D, colnames
+
+
+def _deparse_fixef(fixef: Union[str, list[str]]) -> list[str]:
+    "Turn a fixed effects formula or list into a list of fixed effects."
+    if isinstance(fixef, str):
+        fixef = fixef.split("+")
+    if not isinstance(fixef, list) or not all(isinstance(x, str) for x in fixef):
+        raise TypeError("fixef must be a string or a list of strings.")
+    fixef = [x.replace(" ", "") for x in fixef]
+    if not fixef or "" in fixef:
+        raise ValueError("fixef must contain at least one fixed effect.")
+    return fixef
+
+
+def _get_fixef_column(data: pd.DataFrame, fe: str) -> pd.Series:
+    "Fetch a fixed effect column from data, creating interactions via '^'."
+    fe_vars = fe.split("^")
+    missing = [x for x in fe_vars if x not in data.columns]
+    if missing:
+        raise KeyError(f"The fixed effect(s) {missing} are not columns of the data.")
+
+    if len(fe_vars) == 1:
+        return data[fe]
+
+    # same encoding of interacted fixed effects as in model_matrix_fixest()
+    return (
+        data[fe_vars[0]]
+        .astype(pd.StringDtype())
+        .str.cat(data[fe_vars[1:]].astype(pd.StringDtype()), sep="^", na_rep=None)
+    )
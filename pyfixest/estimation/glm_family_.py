@@ -0,0 +1,364 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from scipy.special import digamma, expit, polygamma
+from scipy.stats import norm
+
+from pyfixest.utils.dev_utils import _to_integer
+
+# bound of the fitted means away from zero (and one for binary models), as
+# in R's `poisson()` and `binomial()`
+_MU_EPS = np.finfo(np.float64).eps
+# bounds of the shape parameter of the negative binomial
+_THETA_MIN = 1e-8
+_THETA_MAX = 1e8
+
+
+class GLMFamily(ABC):
+    """
+    The error distribution and link function of a generalized linear model.
+
+    Provides everything the IRLS algorithm in `Fepois.get_fit()` needs: with
+    the link g and the variance function V, every iteration regresses the
+    working variable z = eta + (y - mu) / g'^{-1}(eta) on the covariates and
+    the fixed effects with weights g'^{-1}(eta)^2 / V(mu).
+
+    Attributes
+    ----------
+    name : str
+        The name of the family, as passed to `feglm()`.
+    label : str
+        The name of the estimation method used in summaries.
+    """
+
+    name: str = ""
+    label: str = ""
+
+    def check_outcome(self, Y: pd.DataFrame) -> pd.DataFrame:
+        "Check the support of the dependent variable and return it."
+        return Y
+
+    @abstractmethod
+    def initialize(self, Y: np.ndarray) -> np.ndarray:
+        "Return the starting values of the fitted means."
+
+    @abstractmethod
+    def link(self, mu: np.ndarray) -> np.ndarray:
+        "Compute the linear predictor eta = g(mu)."
+
+    @abstractmethod
+    def inverse_link(self, eta: np.ndarray) -> np.ndarray:
+        "Compute the fitted means mu = g^{-1}(eta)."
+
+    @abstractmethod
+    def mu_eta(self, eta: np.ndarray) -> np.ndarray:
+        "Compute the derivative of the inverse link, d mu / d eta."
+
+    @abstractmethod
+    def variance(self, mu: np.ndarray) -> np.ndarray:
+        "Compute the variance function V(mu)."
+
+    @abstractmethod
+    def deviance(self, Y: np.ndarray, mu: np.ndarray) -> np.ndarray:
+        "Compute the deviance, as an array of shape (1,)."
+
+    def update(self, Y: np.ndarray, mu: np.ndarray) -> float:
+        """
+        Update the ancillary parameters of the family for the fitted means mu.
+
+        Returns the relative change of the parameters, which is zero for
+        families without ancillary parameters.
+        """
+        return 0.0
+
+    def dispersion(self, Y: np.ndarray, mu: np.ndarray, df: int) -> float:
+        "Return the dispersion parameter used for iid inference."
+        return 1.0
+
+    def separation_outcomes(self, Y: pd.DataFrame) -> list[pd.DataFrame]:
+        """
+        Return the outcomes whose zeros define the boundary of the sample.
+
+        Observations on the boundary may be perfectly predicted by the fixed
+        effects and covariates, see `_check_for_separation()`.
+        """
+        return []
+
+
+class _LogLinkFamily(GLMFamily):
+    "Families with log link."
+
+    def link(self, mu: np.ndarray) -> np.ndarray:
+        "Compute the linear predictor eta = log(mu)."
+        return np.log(mu)
+
+    def inverse_link(self, eta: np.ndarray) -> np.ndarray:
+        "Compute the fitted means mu = exp(eta), bounded away from zero."
+        return np.fmax(np.exp(eta), _MU_EPS)
+
+    def mu_eta(self, eta: np.ndarray) -> np.ndarray:
+        "Compute the derivative of the inverse link, exp(eta)."
+        return np.fmax(np.exp(eta), _MU_EPS)
+
+
+class Poisson(_LogLinkFamily):
+    "The Poisson family with log link."
+
+    name = "poisson"
+    label = "Poisson"
+
+    def check_outcome(self, Y: pd.DataFrame) -> pd.DataFrame:
+        "Check that the dependent variable is a weakly positive integer."
+        Y = _to_integer(Y)
+        if np.any(Y < 0):
+            raise ValueError(
+                "The dependent variable must be a weakly positive integer."
+            )
+        return Y
+
+    def initialize(self, Y: np.ndarray) -> np.ndarray:
+        "Return the starting values (Y + mean(Y)) / 2, as in ppmlhdfe."
+        return (Y + np.mean(Y)) / 2
+
+    def variance(self, mu: np.ndarray) -> np.ndarray:
+        "Compute the variance function V(mu) = mu."
+        return mu
+
+    def deviance(self, Y: np.ndarray, mu: np.ndarray) -> np.ndarray:
+        "Compute the Poisson deviance."
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (
+                2 * np.sum(np.where(Y == 0, 0, Y * np.log(Y / mu)) - (Y - mu))
+            ).flatten()
+
+    def separation_outcomes(self, Y: pd.DataFrame) -> list[pd.DataFrame]:
+        "Observations with a zero outcome are on the boundary."
+        return [Y]
+
+
+class NegativeBinomial(Poisson):
+    """
+    The negative binomial (NB2) family with log link.
+
+    The variance function is V(mu) = mu + mu^2 / theta. The shape parameter
+    theta is estimated by maximum likelihood: `update()` maximizes the
+    likelihood over theta for the current fitted means, so that the fixed point
+    of the IRLS iterations is the joint maximum likelihood estimate, as in
+    `MASS::glm.nb()`. The first iteration is a Poisson iteration.
+
+    Attributes
+    ----------
+    theta : Optional[float]
+        The shape parameter. None before the first update.
+    """
+
+    name = "negbin"
+    label = "Negative Binomial"
+
+    def __init__(self, theta: Optional[float] = None):
+        self.theta = theta
+
+    def variance(self, mu: np.ndarray) -> np.ndarray:
+        """
+        Compute the variance function V(mu) = mu + mu^2 / theta.
+
+        Before the first update of theta, the Poisson variance is returned.
+        """
+        if self.theta is None:
+            return mu
+        return mu + mu**2 / self.theta
+
+    def deviance(self, Y: np.ndarray, mu: np.ndarray) -> np.ndarray:
+        "Compute the negative binomial deviance for the current theta."
+        theta = self.theta
+        if theta is None:
+            return super().deviance(Y, mu)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (
+                2
+                * np.sum(
+                    np.where(Y == 0, 0, Y * np.log(Y / mu))
+                    - (Y + theta) * np.log((Y + theta) / (mu + theta))
+                )
+            ).flatten()
+
+    def update(self, Y: np.ndarray, mu: np.ndarray) -> float:
+        """
+        Update theta to its maximum likelihood estimate given mu.
+
+        Runs Newton's method on log(theta), starting from the moment estimate
+        N / sum((Y / mu - 1)^2) as in `MASS::theta.ml()`. Where the
+        log-likelihood is not concave in log(theta), a unit step in the
+        direction of the score is taken instead.
+        """
+        Y = Y.flatten()
+        mu = mu.flatten()
+
+        theta = len(Y) / max(np.sum((Y / mu - 1) ** 2), _THETA_MIN)
+        log_theta = np.clip(np.log(theta), np.log(_THETA_MIN), np.log(_THETA_MAX))
+
+        for _ in range(50):
+            theta = np.exp(log_theta)
+            score = np.sum(
+                digamma(Y + theta)
+                - digamma(theta)
+                + np.log(theta)
+                + 1
+                - np.log(theta + mu)
+                - (Y + theta) / (theta + mu)
+            )
+            hessian = np.sum(
+                polygamma(1, Y + theta)
+                - polygamma(1, theta)
+                + 1 / theta
+                - 2 / (theta + mu)
+                + (Y + theta) / (theta + mu) ** 2
+            )
+            # first and second derivative with respect to log(theta)
+            d1 = theta * score
+            d2 = theta * score + theta**2 * hessian
+            step = -d1 / d2 if d2 < 0 else np.sign(d1)
+            log_theta_new = np.clip(
+                log_theta + step, np.log(_THETA_MIN), np.log(_THETA_MAX)
+            )
+            converged = np.abs(log_theta_new - log_theta) < 1e-10
+            log_theta = log_theta_new
+            if converged:
+                break
+
+        theta_old = self.theta
+        self.theta = float(np.exp(log_theta))
+
+        if theta_old is None:
+            return 1.0
+        return abs(self.theta - theta_old) / theta_old
+
+
+class Gamma(_LogLinkFamily):
+    "The gamma family with log link."
+
+    name = "gamma"
+    label = "Gamma"
+
+    def check_outcome(self, Y: pd.DataFrame) -> pd.DataFrame:
+        "Check that the dependent variable is strictly positive."
+        if np.any(Y <= 0):
+            raise ValueError(
+                "The dependent variable must be strictly positive for the gamma family."
+            )
+        return Y
+
+    def initialize(self, Y: np.ndarray) -> np.ndarray:
+        "Return the starting values mu = Y."
+        return Y.astype(np.float64)
+
+    def variance(self, mu: np.ndarray) -> np.ndarray:
+        "Compute the variance function V(mu) = mu^2."
+        return mu**2
+
+    def deviance(self, Y: np.ndarray, mu: np.ndarray) -> np.ndarray:
+        "Compute the gamma deviance."
+        return (2 * np.sum(-np.log(Y / mu) + (Y - mu) / mu)).flatten()
+
+    def dispersion(self, Y: np.ndarray, mu: np.ndarray, df: int) -> float:
+        "Return the Pearson estimate of the dispersion."
+        return float(np.sum((Y - mu) ** 2 / self.variance(mu)) / df)
+
+
+class Binomial(GLMFamily):
+    """
+    The binomial family for outcomes in [0, 1], with logit or probit link.
+
+    Parameters
+    ----------
+    link : str
+        Either "logit" or "probit".
+    """
+
+    def __init__(self, link: str = "logit"):
+        if link not in ["logit", "probit"]:
+            raise ValueError(f"link must be 'logit' or 'probit', but is {link}.")
+        self.name = link
+        self.label = "Logit" if link == "logit" else "Probit"
+
+    def check_outcome(self, Y: pd.DataFrame) -> pd.DataFrame:
+        "Check that the dependent variable lies in [0, 1]."
+        if np.any(Y < 0) or np.any(Y > 1):
+            raise ValueError(
+                f"The dependent variable must lie in [0, 1] for the {self.name} family."
+            )
+        return Y
+
+    def initialize(self, Y: np.ndarray) -> np.ndarray:
+        "Return the starting values (Y + 0.5) / 2, as in R's `binomial()`."
+        return (Y + 0.5) / 2
+
+    def link(self, mu: np.ndarray) -> np.ndarray:
+        "Compute the linear predictor eta = g(mu)."
+        if self.name == "logit":
+            return np.log(mu / (1 - mu))
+        return norm.ppf(mu)
+
+    def inverse_link(self, eta: np.ndarray) -> np.ndarray:
+        "Compute the fitted means mu = g^{-1}(eta), bounded away from 0 and 1."
+        mu = expit(eta) if self.name == "logit" else norm.cdf(eta)
+        return np.clip(mu, _MU_EPS, 1 - _MU_EPS)
+
+    def mu_eta(self, eta: np.ndarray) -> np.ndarray:
+        "Compute the derivative of the inverse link, d mu / d eta."
+        if self.name == "logit":
+            mu = expit(eta)
+            d = mu * (1 - mu)
+        else:
+            d = norm.pdf(eta)
+        return np.fmax(d, _MU_EPS)
+
+    def variance(self, mu: np.ndarray) -> np.ndarray:
+        "Compute the variance function V(mu) = mu * (1 - mu)."
+        return mu * (1 - mu)
+
+    def deviance(self, Y: np.ndarray, mu: np.ndarray) -> np.ndarray:
+        "Compute the binomial deviance."
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (
+                2
+                * np.sum(
+                    np.where(Y == 0, 0, Y * np.log(Y / mu))
+                    + np.where(Y == 1, 0, (1 - Y) * np.log((1 - Y) / (1 - mu)))
+                )
+            ).flatten()
+
+    def separation_outcomes(self, Y: pd.DataFrame) -> list[pd.DataFrame]:
+        "Observations with outcomes of zero or one are on the boundary."
+        return [Y, 1 - Y]
+
+
+def _get_family(family: str) -> GLMFamily:
+    """
+    Return a new instance of a GLM family.
+
+    Parameters
+    ----------
+    family : str
+        One of "poisson", "logit", "probit", "negbin" or "gamma".
+
+    Returns
+    -------
+    GLMFamily
+        The family.
+    """
+    if family == "poisson":
+        return Poisson()
+    elif family in ["logit", "probit"]:
+        return Binomial(link=family)
+    elif family == "negbin":
+        return NegativeBinomial()
+    elif family == "gamma":
+        return Gamma()
+    else:
+        raise ValueError(
+            "family must be one of 'poisson', 'logit', 'probit', 'negbin' or "
+            f"'gamma', but {family} was specified."
+        )
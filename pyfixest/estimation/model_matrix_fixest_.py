@@ -1,6 +1,6 @@
 import re
 import warnings
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -9,6 +9,9 @@ from formulaic import Formula
 from pyfixest.estimation.detect_singletons_ import detect_singletons
 from pyfixest.estimation.FormulaParser import FixestFormula
 
+if TYPE_CHECKING:
+    from pyfixest.estimation.fixef_index_ import FixedEffectsIndex
+
 
 def model_matrix_fixest(
     FixestFormula: FixestFormula,
@@ -16,6 +19,8 @@ def model_matrix_fixest(
     drop_singletons: bool = False,
     weights: Optional[str] = None,
     drop_intercept=False,
+    fixef_index: Optional["FixedEffectsIndex"] = None,
+    dtype: str = "float64",
 ) -> dict:
     """
     Create model matrices for fixed effects estimation.
@@ -41,6 +46,16 @@ def model_matrix_fixest(
         Whether to drop the intercept from the model matrix. Default is False.
         If True, the intercept is dropped ex post from the model matrix created
         by formulaic.
+    fixef_index : FixedEffectsIndex, optional
+        A precomputed index of the fixed effects of `data`. If provided, the
+        fixed effects are not factorized by formulaic but taken from the index,
+        and the singletons of the index are reused if possible. `data` must
+        have a default index 0, ..., N - 1 matching the rows of `fixef_index`.
+    dtype : str
+        The floating point type of the dependent variable, covariates,
+        endogenous variables and instruments. Either "float64" (the default),
+        in which case integer columns are kept as is, or "float32". Weights
+        are always stored in double precision.
 
     Returns
     -------
@@ -93,13 +108,25 @@ def model_matrix_fixest(
         else fml_first_stage
     )
 
-    fval, data = _fixef_interactions(fval=fval, data=data)
+    if fval == "0":
+        # the index is only used for the fixed effects
+        fixef_index = None
+    if fixef_index is not None:
+        fval = fval.replace("^", "_")
+        fe_names = fval.split("+")
+        missing_fixef = [x for x in fe_names if x not in fixef_index.names]
+        if missing_fixef:
+            raise ValueError(
+                f"The fixed effect(s) {missing_fixef} are not part of the `fixef_index`."
+            )
+    else:
+        fval, data = _fixef_interactions(fval=fval, data=data)
     _is_iv = fml_first_stage is not None
 
     fml_kwargs = {
         "fml_second_stage": fml_second_stage,
         **({"fml_first_stage": fml_first_stage} if _is_iv else {}),
-        **({"fe": wrap_factorize(fval)} if fval != "0" else {}),
+        **({"fe": wrap_factorize(fval)} if fval != "0" and fixef_index is None else {}),
         **({"weights": weights} if weights is not None else {}),
     }
 
@@ -113,16 +140,33 @@ def model_matrix_fixest(
     if _is_iv:
         endogvar = mm["fml_first_stage"]["lhs"]
         Z = mm["fml_first_stage"]["rhs"]
-    if fval != "0":
+    if fval != "0" and fixef_index is None:
         fe = mm["fe"]
     if weights is not None:
         weights_df = mm["weights"]
 
+    if fixef_index is not None:
+        # formulaic drops rows with missing values, the index covers all rows
+        fe = pd.DataFrame(
+            fixef_index.get_codes(fe_names, rows=Y.index.to_numpy()),
+            index=Y.index,
+            columns=fe_names,
+        )
+
+    # unwrap formulaic's ModelMatrix proxies, which cannot be pickled
+    Y, X = pd.DataFrame(Y), pd.DataFrame(X)
+    if _is_iv:
+        endogvar, Z = pd.DataFrame(endogvar), pd.DataFrame(Z)
+    if weights_df is not None:
+        weights_df = pd.DataFrame(weights_df)
+
     for df in [Y, X, Z, endogvar, weights_df]:
         if df is not None:
-            cols_to_convert = df.select_dtypes(exclude=["int64", "float64"]).columns
+            df_dtype = "float64" if df is weights_df else dtype
+            keep = ["float32"] if df_dtype == "float32" else ["int64", "float64"]
+            cols_to_convert = df.select_dtypes(exclude=keep).columns
             if cols_to_convert.size > 0:
-                df[cols_to_convert] = df[cols_to_convert].astype("float64")
+                df[cols_to_convert] = df[cols_to_convert].astype(df_dtype)
     if fe is not None:
         fe = fe.astype("int32")
 
@@ -150,8 +194,25 @@ def model_matrix_fixest(
             Z.drop("Intercept", axis=1, inplace=True)
 
     # handle NaNs in fixed effects & singleton fixed effects
+    if fixef_index is not None:
+        keep_idx = np.all(fe.to_numpy() >= 0, axis=1)
+        if not np.all(keep_idx):
+            Y, X, fe = Y[keep_idx], X[keep_idx], fe[keep_idx]
+            if Z is not None and endogvar is not None:
+                Z, endogvar = Z[keep_idx], endogvar[keep_idx]
+            if weights_df is not None:
+                weights_df = weights_df[keep_idx]
+
     if fe is not None and drop_singletons:
-        dropped_singleton_bool = detect_singletons(fe.to_numpy())
+        if (
+            fixef_index is not None
+            and set(fe_names) == set(fixef_index.names)
+            and fe.shape[0] == fixef_index.n_obs
+        ):
+            # no rows dropped: singletons have already been detected
+            dropped_singleton_bool = fixef_index.singletons
+        else:
+            dropped_singleton_bool = detect_singletons(fe.to_numpy())
 
         keep_idx = ~dropped_singleton_bool
 
@@ -275,12 +336,15 @@ def _fixef_interactions(fval: str, data: pd.DataFrame) -> tuple[str, pd.DataFram
 
     Returns
     -------
+    str
+        The fixed effects, with "^" replaced by "_".
     pd.DataFrame
         The input DataFrame. If the fixed effects contain interactions via "^",
-        the function creates new columns in the DataFrame for the interacted
-        fixed effects.
+        a shallow copy of the DataFrame with new columns for the interacted
+        fixed effects. The input DataFrame is not modified.
     """
     if "^" in fval:
+        data = data.copy(deep=False)
         for val in fval.split("+"):
             if "^" in val:
                 vars = val.split("^")
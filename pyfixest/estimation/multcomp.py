@@ -6,6 +6,7 @@ import pandas as pd
 
 from pyfixest.estimation.feols_ import Feols
 from pyfixest.estimation.fepois_ import Fepois
+from pyfixest.estimation.wildboottest_ import _wildboottest_many
 from pyfixest.report.summarize import _post_processing_input_checks
 
 
@@ -70,13 +71,16 @@ def rwolf(
     reps: int,
     seed: int,
     sampling_method: str = "wild-bootstrap",
+    n_jobs: int = 1,
 ) -> pd.DataFrame:
     """
     Compute Romano-Wolf adjusted p-values for multiple hypothesis testing.
 
     For each model, it is assumed that tests to adjust are of the form
-    "param = 0". This function uses the `wildboottest()` method for running the
-    bootstrap, hence models of type `Feiv` or `Fepois` are not supported.
+    "param = 0". The wild bootstrap draws the bootstrap weights once and evaluates
+    all models on them if the models share their bootstrap clusters, and falls
+    back to the `wildboottest()` method of each model with the same seed
+    otherwise. Models of type `Feiv` or `Fepois` are not supported.
 
     Parameters
     ----------
@@ -94,6 +98,11 @@ def rwolf(
         Sampling method for computing resampled statistics.
         Users can choose either bootstrap('wild-bootstrap')
         or randomization inference('ri')
+    n_jobs : int
+        The number of threads over which the models are distributed in each
+        chunk of bootstrap draws. -1 uses all CPUs. Under numba's workqueue
+        threading layer, which is not threadsafe, the models are bootstrapped
+        serially. Defaults to 1.
 
     Returns
     -------
@@ -120,7 +129,6 @@ def rwolf(
     """
     models = _post_processing_input_checks(models)
     all_model_stats = pd.DataFrame()
-    full_enumeration = False
 
     S = 0
     for model in models:
@@ -129,39 +137,19 @@ def rwolf(
                 f"Parameter '{param}' not found in the model {model._fml}."
             )
 
-        if model._is_clustered:
-            # model._G a list of length 3
-            # for oneway clusering: repeated three times
-            G = min(model._G)
-            if reps > 2**G:
-                warnings.warn(f"""
-                              2^(the number of clusters) < the number of boot iterations for at least one model,
-                              setting full_enumeration to True and reps = {2**G}.
-                              """)
-                full_enumeration = True
-
         model_tidy = model.tidy().xs(param)
         all_model_stats = pd.concat([all_model_stats, model_tidy], axis=1)
         S += 1
 
-    t_stats = np.zeros(S)
-    boot_t_stats = np.zeros((2**G, S)) if full_enumeration else np.zeros((reps, S))
-
-    for i in range(S):
-        model = models[i]
-
-        if sampling_method == "wild-bootstrap":
-            wildboot_res_df, bootstrapped_t_stats = model.wildboottest(
-                param=param,
-                reps=reps,
-                return_bootstrapped_t_stats=True,
-                seed=seed,  # all S iterations require the same bootstrap samples, hence seed needs to be reset
-            )
-
-            t_stats[i] = wildboot_res_df["t value"]
-            boot_t_stats[:, i] = bootstrapped_t_stats
+    if sampling_method == "wild-bootstrap":
+        t_stats, boot_t_stats = _rwolf_wildboottest(
+            models=models, param=param, reps=reps, seed=seed, n_jobs=n_jobs
+        )
 
-        elif sampling_method == "ri":
+    elif sampling_method == "ri":
+        t_stats = np.zeros(S)
+        boot_t_stats = np.zeros((reps, S))
+        for i, model in enumerate(models):
             rng = np.random.default_rng(seed)
             model.ritest(
                 resampvar=param,
@@ -173,8 +161,8 @@ def rwolf(
 
             t_stats[i] = model._ritest_sample_stat
             boot_t_stats[:, i] = model._ritest_statistics
-        else:
-            raise ValueError("Invalid sampling method specified")
+    else:
+        raise ValueError("Invalid sampling method specified")
 
     pval = _get_rwolf_pval(t_stats, boot_t_stats)
 
@@ -202,35 +190,84 @@ def _get_rwolf_pval(t_stats, boot_t_stats):
     t_stats = np.abs(t_stats)
     boot_t_stats = np.abs(boot_t_stats)
 
-    S = boot_t_stats.shape[1]
     B = boot_t_stats.shape[0]
 
-    pinit = corr_padj = pval = np.zeros(S)
+    # step s compares the s-th largest t-statistic to the maximum of the
+    # bootstrapped t-statistics of all hypotheses not yet rejected, i.e. to a
+    # reverse cumulative maximum over the hypotheses in stepdown order
     stepdown_index = np.argsort(t_stats)[::-1]
     ro = np.argsort(stepdown_index)
 
-    for s in range(S):
-        if s == 0:
-            max_stat = np.max(boot_t_stats, axis=1)
-            pinit[s] = min(
-                1,
-                (np.sum(max_stat >= np.abs(t_stats[stepdown_index[s]])) + 1) / (B + 1),
-            )
-        else:
-            boot_t_stat_udp = np.delete(boot_t_stats, stepdown_index[:s], axis=1)
-            max_stat = np.max(boot_t_stat_udp, axis=1)
-            pinit[s] = min(
-                1,
-                (np.sum(max_stat >= np.abs(t_stats[stepdown_index[s]])) + 1) / (B + 1),
-            )
-
-    for j in range(S):
-        if j == 0:
-            corr_padj[j] = pinit[j]
-        else:
-            corr_padj[j] = max(pinit[j], corr_padj[j - 1])
+    boot_t_stats_sorted = boot_t_stats[:, stepdown_index]
+    max_stat = np.maximum.accumulate(boot_t_stats_sorted[:, ::-1], axis=1)[:, ::-1]
+    pinit = np.minimum(
+        1, (np.sum(max_stat >= t_stats[stepdown_index], axis=0) + 1) / (B + 1)
+    )
+    corr_padj = np.maximum.accumulate(pinit)
 
     # Collect the results
     pval = corr_padj[ro]
 
     return pval
+
+
+def _rwolf_wildboottest(
+    models: list[Union[Feols, Fepois]], param: str, reps: int, seed: int, n_jobs: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the t-statistics and bootstrapped t-statistics for `rwolf()`.
+
+    If all models support the native wild bootstrap and share the bootstrap
+    clusters, the bootstrap weights are drawn once and all models are
+    evaluated on each chunk of draws. Otherwise, the `wildboottest()` method of
+    each model is called with the same seed.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The S t-statistics and the (B x S) bootstrapped t-statistics.
+    """
+    problems: list[dict] = []
+    for model in models:
+        if not model._supports_wildboottest or model._is_iv or model._method != "feols":
+            break
+        problem, _ = model._wildboottest_problem(
+            cluster_list=model._wildboottest_cluster_list(None),
+            param=param,
+            impose_null=True,
+            adj=True,
+            cluster_adj=True,
+        )
+        if problems and not np.array_equal(
+            problem["bootcluster"], problems[0]["bootcluster"]
+        ):
+            break
+        problems.append(problem)
+
+    if len(problems) == len(models):
+        t_stats, boot_t_stats, full_enumeration = _wildboottest_many(
+            problems=problems, reps=reps, seed=seed, n_jobs=n_jobs
+        )
+        if full_enumeration:
+            # the weights are drawn at the bootstrap clusters, i.e. the
+            # intersection of the cluster variables for multiway clustering
+            warnings.warn(
+                "2^(the number of bootstrap clusters) < the number of boot "
+                "iterations, setting full_enumeration to True and "
+                f"reps = {boot_t_stats.shape[0]}."
+            )
+        return t_stats, boot_t_stats
+
+    t_stats = np.zeros(len(models))
+    boot_t_stats_list = []
+    for i, model in enumerate(models):
+        wildboot_res_df, bootstrapped_t_stats = model.wildboottest(
+            param=param,
+            reps=reps,
+            return_bootstrapped_t_stats=True,
+            seed=seed,  # all S iterations require the same bootstrap samples, hence seed needs to be reset
+        )
+        t_stats[i] = wildboot_res_df["t value"]
+        boot_t_stats_list.append(bootstrapped_t_stats)
+
+    return t_stats, np.column_stack(boot_t_stats_list)
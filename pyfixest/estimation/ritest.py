@@ -1,3 +1,4 @@
+import functools
 from importlib import import_module
 from typing import Optional, Union
 
@@ -35,6 +36,7 @@ def _get_ritest_stats_slow(
     rng: np.random.Generator,
     vcov: Union[str, dict[str, str]],
     clustervar_arr: Optional[np.ndarray] = None,
+    family: Optional[str] = None,
 ) -> np.ndarray:
     """
     Compute tests statistics using randomization inference (slow).
@@ -55,13 +57,15 @@ def _get_ritest_stats_slow(
     reps : int
         The number of repetitions.
     model : str
-        The model to estimate. Must be one of 'feols' or 'fepois'.
+        The model to estimate. Must be one of 'feols', 'fepois' or 'feglm'.
     rng : np.random.Generator
         The random number generator.
     vcov : str or dict[str, str]
         The type of covarianc estimator. See `feols` or `fepois` for details.
     clustervar_arr : np.ndarray, optional
         Array containing the cluster variable. Defaults to None.
+    family : str, optional
+        The family of the model if `model` is 'feglm'. Defaults to None.
 
     Returns
     -------
@@ -75,6 +79,8 @@ def _get_ritest_stats_slow(
 
     fixest_module = import_module("pyfixest.estimation")
     fit_ = getattr(fixest_module, model)
+    if family is not None:
+        fit_ = functools.partial(fit_, family=family)
 
     resampvar_arr = data_resampled[resampvar].to_numpy()
 
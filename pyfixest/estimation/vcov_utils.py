@@ -1,8 +1,10 @@
-from typing import Union
+from typing import Optional, Union
 
 import numba as nb
 import numpy as np
 import pandas as pd
+from scipy.linalg import solve_triangular
+from scipy.spatial import cKDTree
 
 from pyfixest.errors import NanInClusterVarError
 from pyfixest.utils.dev_utils import _polars_to_pandas
@@ -21,6 +23,14 @@ def _compute_bread(
 def _get_cluster_df(data: pd.DataFrame, clustervar: list[str]):
     if not data.empty:
         data_pandas = _polars_to_pandas(data)
+        missing = [x for x in clustervar if x not in data_pandas.columns]
+        if missing:
+            raise ValueError(
+                f"The variable(s) {missing} are not found in the data. For polars "
+                "or pyarrow input, only the columns used by the model are stored "
+                "in the model object. Please pass the data via the `data` argument "
+                "of `vcov()`."
+            )
         cluster_df = data_pandas[clustervar].copy()
     else:
         raise AttributeError(
@@ -51,26 +61,85 @@ def _check_cluster_df(cluster_df: pd.DataFrame, data: pd.DataFrame):
 def _count_G_for_ssc_correction(
     cluster_df: pd.DataFrame, ssc_dict: dict[str, Union[str, bool]]
 ):
+    # cluster variables are integer coded as 0, ..., G - 1 by
+    # `_prepare_multiway_clustering()`
     G = []
     for col in cluster_df.columns:
-        G.append(cluster_df[col].nunique())
+        G.append(int(cluster_df[col].max()) + 1)
 
     if ssc_dict["cluster_df"] == "min":
-        G = [min(G)] * 3
+        G = [min(G)] * len(G)
 
     return G
 
 
-def _prepare_twoway_clustering(clustervar: list, cluster_df: pd.DataFrame):
-    cluster_one = clustervar[0]
-    cluster_two = clustervar[1]
-    cluster_df_one_str = cluster_df[cluster_one].astype(str)
-    cluster_df_two_str = cluster_df[cluster_two].astype(str)
-    cluster_df.loc[:, "cluster_intersection"] = cluster_df_one_str.str.cat(
-        cluster_df_two_str, sep="-"
+def _prepare_multiway_clustering(
+    cluster_df: pd.DataFrame,
+    codes: Optional[dict[tuple, tuple[np.ndarray, int]]] = None,
+) -> tuple[pd.DataFrame, list[int]]:
+    """
+    Prepare the cluster variables for (multiway) clustering.
+
+    With clustering by more than one variable, the variance matrix is
+    computed by inclusion-exclusion (Cameron, Gelbach and Miller, 2011): the
+    variance matrices clustered by the intersection of the variables in each
+    non-empty subset of the cluster variables are added for subsets with an
+    odd number of variables and subtracted otherwise.
+
+    The intersections are built from the integer codes of the cluster
+    variables, combining two codes `a` and `b` as `a * G_b + b` and
+    re-factorizing the result, which keeps all codes below the number of
+    observations.
+
+    Parameters
+    ----------
+    cluster_df : pd.DataFrame
+        The cluster variables, one column per variable.
+    codes : Optional[dict[tuple, tuple[np.ndarray, int]]], optional
+        A cache of integer codes and their number of levels, keyed by tuples of
+        cluster variable names. Codes found in the cache are reused, and new
+        codes are added to it. Only valid for cluster variables from the same
+        data set. Defaults to None, i.e. no caching.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, list[int]]
+        The cluster variables and their intersections, coded as integers
+        0, ..., G - 1, with one column per subset of the cluster variables,
+        and the sign with which the variance matrix of each column enters.
+    """
+    if codes is None:
+        codes = {}
+
+    names: list[tuple[str, ...]] = []
+    for col in cluster_df.columns:
+        if (col,) not in codes:
+            codes[(col,)] = _factorize(cluster_df[col].to_numpy())
+        names.append((col,))
+
+    for subset in names:
+        # extend each subset by all later cluster variables
+        last = list(cluster_df.columns).index(subset[-1])
+        for col in cluster_df.columns[last + 1 :]:
+            if (*subset, col) not in codes:
+                a, G_a = codes[subset]
+                b, G_b = codes[(col,)]
+                codes[(*subset, col)] = _factorize(a * G_b + b)
+            names.append((*subset, col))
+
+    names.sort(key=len)
+    res = pd.DataFrame(
+        {"^".join(x): codes[x][0] for x in names}, index=cluster_df.index
     )
+    vcov_sign = [1 if len(x) % 2 else -1 for x in names]
+
+    return res, vcov_sign
 
-    return cluster_df
+
+def _factorize(x: np.ndarray) -> tuple[np.ndarray, int]:
+    "Integer code an array as 0, ..., G - 1 and return the codes and G."
+    codes, uniques = pd.factorize(x)
+    return codes.astype(np.int64, copy=False), len(uniques)
 
 
 # CODE from Styfen Schaer (@styfenschaer)
@@ -122,33 +191,496 @@ def bucket_argsort(arr: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
 
 
 # CODE from Styfen Schaer (@styfenschaer)
-@nb.njit(parallel=False)
 def _crv1_meat_loop(
     _Z: np.ndarray,
     weighted_uhat: np.ndarray,
     clustid: np.ndarray,
     cluster_col: np.ndarray,
 ) -> np.ndarray:
+    """
+    Compute the meat of the CRV1 sandwich, the sum of the outer products of
+    the cluster score sums.
+
+    The (G, k) matrix of cluster score sums is computed in a single pass over
+    the observations, after which the meat is formed by one matrix product.
+
+    Parameters
+    ----------
+    _Z : np.ndarray
+        The (weighted) instruments of shape (N, k).
+    weighted_uhat : np.ndarray
+        The (weighted) residuals of shape (N, 1).
+    clustid : np.ndarray
+        The cluster ids to sum over.
+    cluster_col : np.ndarray
+        The integer coded cluster variable of shape (N,), with values in
+        0, ..., G - 1.
+
+    Returns
+    -------
+    np.ndarray
+        The meat matrix of shape (k, k).
+    """
+    score_sums = _crv1_score_sums(
+        _Z=_Z,
+        weighted_uhat=weighted_uhat[:, 0],
+        cluster_col=cluster_col,
+    )[clustid]
+
+    return score_sums.T @ score_sums
+
+
+@nb.njit(parallel=True)
+def _crv1_score_sums(
+    _Z: np.ndarray,
+    weighted_uhat: np.ndarray,
+    cluster_col: np.ndarray,
+) -> np.ndarray:
+    """
+    Sum the scores `_Z * weighted_uhat` by cluster.
+
+    The clusters are processed in parallel. Each cluster only touches its own
+    rows via the group offsets of `bucket_argsort()` and writes to its own row
+    of the output, so no per-thread buffers of shape (G, k) are needed.
+    Accumulation is in double precision, also for single precision `_Z`.
+    """
     k = _Z.shape[1]
-    dtype = _Z.dtype
-    meat = np.zeros((k, k), dtype=dtype)
+    g_indices, g_locs = bucket_argsort(cluster_col)
+    n_groups = g_locs.size - 1
 
+    score_sums = np.zeros((n_groups, k), dtype=np.float64)
+
+    for g in nb.prange(n_groups):
+        for idx in range(g_locs[g], g_locs[g + 1]):
+            i = g_indices[idx]
+            ui = weighted_uhat[i]
+            for j in range(k):
+                score_sums[g, j] += _Z[i, j] * ui
+
+    return score_sums
+
+
+@nb.njit(parallel=True)
+def _crv3_jackknife_loop(
+    X: np.ndarray,
+    u_hat: np.ndarray,
+    cluster_col: np.ndarray,
+    tXX: np.ndarray,
+    tXy: np.ndarray,
+    beta_hat: np.ndarray,
+    tol: float = 1e-10,
+) -> np.ndarray:
+    """
+    Compute the leave-one-cluster-out deviations of the OLS coefficients.
+
+    Removing cluster g changes the coefficients by
+    `-(X'X - Xg'Xg)^{-1} Xg'ug`, where `ug` are the full sample residuals of
+    the cluster. For clusters with fewer observations than coefficients, the
+    inverse is updated from the pseudo-inverse of X'X via the Woodbury
+    identity, which only needs the inverse of an (n_g, n_g) matrix. Otherwise,
+    or if the update is ill-conditioned, the leave-one-out coefficients are
+    computed from the pseudo-inverse of the (k, k) matrix, which also covers
+    coefficients that are not identified without cluster g. Each cluster only
+    touches its own rows via the group offsets of `bucket_argsort()`, so the
+    total cost is linear in the number of observations, and the clusters are
+    processed in parallel.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        The (demeaned, weighted) design matrix of shape (N, k).
+    u_hat : np.ndarray
+        The (weighted) residuals of shape (N,).
+    cluster_col : np.ndarray
+        The integer coded cluster variable of shape (N,), with values in
+        0, ..., G - 1.
+    tXX : np.ndarray
+        The cross-product X'X of shape (k, k).
+    tXy : np.ndarray
+        The cross-product X'y of shape (k,).
+    beta_hat : np.ndarray
+        The full sample coefficients of shape (k,).
+    tol : float, optional
+        Clusters for which the smallest eigenvalue of `I - Xg (X'X)^{-1} Xg'`
+        is below `tol` are not updated via the Woodbury identity.
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (G, k). Row g is the coefficient vector estimated
+        without cluster g, minus the coefficient vector of the full sample.
+    """
+    k = X.shape[1]
     g_indices, g_locs = bucket_argsort(cluster_col)
+    n_groups = g_locs.size - 1
 
-    score_g = np.empty((k, 1), dtype=dtype)
-    meat_i = np.empty((k, k), dtype=dtype)
+    tXX_inv = np.linalg.pinv(tXX)
+    beta_diff = np.zeros((n_groups, k), dtype=np.float64)
 
-    for i in range(clustid.size):
-        g = clustid[i]
+    for g in nb.prange(n_groups):
         start = g_locs[g]
         end = g_locs[g + 1]
+        n_g = end - start
+        if n_g == 0:
+            continue
+
         g_index = g_indices[start:end]
+        Xg = np.empty((n_g, k), dtype=np.float64)
+        ug = np.empty(n_g, dtype=np.float64)
+        for i in range(n_g):
+            ug[i] = u_hat[g_index[i]]
+            for j in range(k):
+                Xg[i, j] = X[g_index[i], j]
+        score_g = Xg.T @ ug
+
+        woodbury = False
+        if n_g < k:
+            # (A - Xg'Xg)^{-1} = A^{-1} + A^{-1} Xg' (I - Xg A^{-1} Xg')^{-1} Xg A^{-1}
+            XgAinv = Xg @ tXX_inv
+            M = np.eye(n_g) - XgAinv @ Xg.T
+            eigval, eigvec = np.linalg.eigh(0.5 * (M + M.T))
+            if eigval[0] > tol:
+                Ainv_score = tXX_inv @ score_g
+                Minv_v = eigvec @ ((eigvec.T @ (Xg @ Ainv_score)) / eigval)
+                beta_diff[g, :] = -(Ainv_score + XgAinv.T @ Minv_v)
+                woodbury = True
+
+        if not woodbury:
+            tXgXg = Xg.T @ Xg
+            # Xg'yg = Xg'Xg beta_hat + Xg'ug
+            tXy_g = tXy - tXgXg @ beta_hat - score_g
+            beta_diff[g, :] = np.linalg.pinv(tXX - tXgXg) @ tXy_g - beta_hat
+
+    return beta_diff
+
+
+def _hac_default_lag(n_periods: int) -> int:
+    "Return the default number of lags of the Bartlett kernel, floor(T^(1/4))."
+    return int(np.floor(n_periods**0.25))
+
+
+def _hac_time_col(time: pd.Series) -> np.ndarray:
+    """
+    Code the time variable of NW and DK inference as t - min(t).
+
+    The lags are differences of the time variable, so periods without any
+    observations are not skipped. The time variable must hence be integer
+    valued.
+    """
+    if pd.api.types.is_float_dtype(time) and (time % 1 == 0).all():
+        time = time.astype(np.int64)
+    if not pd.api.types.is_integer_dtype(time) or pd.api.types.is_bool_dtype(time):
+        raise ValueError(
+            "The time variable of NW and DK inference must be integer valued, "
+            f"but {time.name} is of type {time.dtype}. Please code the periods "
+            "as integers, e.g. years or months since a reference date."
+        )
+    time_col = time.to_numpy(dtype=np.int64)
+    return time_col - time_col.min()
+
+
+def _bartlett_weights(lag: int) -> np.ndarray:
+    "Return the Bartlett kernel weights 1 - l / (lag + 1) for l = 0, ..., lag."
+    return 1 - np.arange(lag + 1) / (lag + 1)
+
+
+def _nw_meat(
+    _Z: np.ndarray,
+    weighted_uhat: np.ndarray,
+    unit_col: np.ndarray,
+    time_col: np.ndarray,
+    lag: int,
+) -> np.ndarray:
+    """
+    Compute the meat of the (panel) Newey-West HAC variance matrix.
 
-        Zg = _Z[g_index]
-        ug = weighted_uhat[g_index]
+    The scores of the same unit that are at most `lag` periods apart are
+    correlated, with Bartlett kernel weights. The pairs of such observations
+    are found from the observations sorted by unit and time, so the cost is
+    linear in the number of observations and lags.
 
-        np.dot(Zg.T, ug, out=score_g)
-        np.outer(score_g, score_g, out=meat_i)
-        meat += meat_i
+    Parameters
+    ----------
+    _Z : np.ndarray
+        The (weighted) instruments of shape (N, k).
+    weighted_uhat : np.ndarray
+        The (weighted) residuals of shape (N,).
+    unit_col : np.ndarray
+        The integer coded unit variable of shape (N,). All zeros for a single
+        time series.
+    time_col : np.ndarray
+        The integer time variable of shape (N,), e.g. from `_hac_time_col()`.
+        Observations are `t_j - t_i` periods apart.
+    lag : int
+        The maximum lag.
+
+    Returns
+    -------
+    np.ndarray
+        The meat matrix of shape (k, k).
+    """
+    order = np.lexsort((time_col, unit_col))
+    idx_a, idx_b, pair_lag = _panel_lag_pairs(
+        order=order, unit_col=unit_col, time_col=time_col, lag=lag
+    )
+    pair_weights = _bartlett_weights(lag)[pair_lag]
+
+    all_obs = np.arange(_Z.shape[0])
+    meat = _cross_scores(
+        _Z, weighted_uhat, all_obs, all_obs, np.ones(all_obs.size, dtype=np.float64)
+    )
+    meat_lags = _cross_scores(_Z, weighted_uhat, idx_a, idx_b, pair_weights)
+
+    return meat + meat_lags + meat_lags.T
+
+
+def _dk_meat(
+    _Z: np.ndarray,
+    weighted_uhat: np.ndarray,
+    time_col: np.ndarray,
+    lag: int,
+) -> np.ndarray:
+    """
+    Compute the meat of the Driscoll-Kraay variance matrix.
+
+    The scores are summed by period, and the Newey-West HAC meat is computed
+    from the resulting (T, k) time series of cross-sectional score sums, where
+    periods `l` apart are found from the values of the time variable.
+
+    Parameters
+    ----------
+    _Z : np.ndarray
+        The (weighted) instruments of shape (N, k).
+    weighted_uhat : np.ndarray
+        The (weighted) residuals of shape (N,).
+    time_col : np.ndarray
+        The integer time variable of shape (N,), e.g. from `_hac_time_col()`.
+        Observations are `t_j - t_i` periods apart.
+    lag : int
+        The maximum lag.
+
+    Returns
+    -------
+    np.ndarray
+        The meat matrix of shape (k, k).
+    """
+    periods, period_col = np.unique(time_col, return_inverse=True)
+    score_sums = _crv1_score_sums(
+        _Z=_Z, weighted_uhat=weighted_uhat, cluster_col=period_col.astype(np.int64)
+    )
+    weights = _bartlett_weights(lag)
+
+    meat = score_sums.T @ score_sums
+    for l in range(1, lag + 1):  # noqa: E741
+        # the observed periods l periods after another observed period
+        later = np.searchsorted(periods, periods + l)
+        earlier = np.flatnonzero(later < periods.size)
+        earlier = earlier[periods[later[earlier]] == periods[earlier] + l]
+        if earlier.size == 0:
+            continue
+        meat_l = weights[l] * score_sums[later[earlier]].T @ score_sums[earlier]
+        meat += meat_l + meat_l.T
 
     return meat
+
+
+def _conley_meat(
+    _Z: np.ndarray,
+    weighted_uhat: np.ndarray,
+    lat: np.ndarray,
+    lon: np.ndarray,
+    cutoff: float,
+) -> np.ndarray:
+    """
+    Compute the meat of the Conley spatial HAC variance matrix.
+
+    The scores of all observations within `cutoff` kilometers (great circle
+    distance) of each other are correlated, with a uniform kernel. The pairs
+    of such observations are found with a KD-tree on the unit sphere, so the
+    cost is near-linear in the number of observations for a given number of
+    neighbours.
+
+    Parameters
+    ----------
+    _Z : np.ndarray
+        The (weighted) instruments of shape (N, k).
+    weighted_uhat : np.ndarray
+        The (weighted) residuals of shape (N,).
+    lat : np.ndarray
+        The latitude in degrees, of shape (N,).
+    lon : np.ndarray
+        The longitude in degrees, of shape (N,).
+    cutoff : float
+        The distance cutoff in kilometers.
+
+    Returns
+    -------
+    np.ndarray
+        The meat matrix of shape (k, k).
+    """
+    earth_radius = 6371.0088
+
+    lat_rad = np.deg2rad(lat)
+    lon_rad = np.deg2rad(lon)
+    points = np.column_stack(
+        [
+            np.cos(lat_rad) * np.cos(lon_rad),
+            np.cos(lat_rad) * np.sin(lon_rad),
+            np.sin(lat_rad),
+        ]
+    )
+    # great circle distance d corresponds to the chord 2 * sin(d / (2 * R))
+    chord = 2 * np.sin(min(cutoff / earth_radius, np.pi) / 2)
+    pairs = cKDTree(points).query_pairs(r=chord, output_type="ndarray")
+
+    all_obs = np.arange(_Z.shape[0])
+    meat = _cross_scores(
+        _Z, weighted_uhat, all_obs, all_obs, np.ones(all_obs.size, dtype=np.float64)
+    )
+    meat_pairs = _cross_scores(
+        _Z,
+        weighted_uhat,
+        pairs[:, 0],
+        pairs[:, 1],
+        np.ones(pairs.shape[0], dtype=np.float64),
+    )
+
+    return meat + meat_pairs + meat_pairs.T
+
+
+def _cross_scores(
+    _Z: np.ndarray,
+    weighted_uhat: np.ndarray,
+    idx_a: np.ndarray,
+    idx_b: np.ndarray,
+    pair_weights: np.ndarray,
+    chunk_size: int = 65_536,
+) -> np.ndarray:
+    """
+    Compute sum_p w_p * s_{a_p} s_{b_p}' for the scores s_i = Z_i * u_i.
+
+    The scores are formed for `chunk_size` pairs at once, so that the scores
+    of shape (N, k) are never materialized.
+    """
+    k = _Z.shape[1]
+    res = np.zeros((k, k), dtype=np.float64)
+    for start in range(0, idx_a.size, chunk_size):
+        a = idx_a[start : start + chunk_size]
+        b = idx_b[start : start + chunk_size]
+        w = pair_weights[start : start + chunk_size]
+        scores_a = _Z[a].astype(np.float64) * (weighted_uhat[a] * w)[:, None]
+        scores_b = _Z[b].astype(np.float64) * weighted_uhat[b][:, None]
+        res += scores_a.T @ scores_b
+
+    return res
+
+
+@nb.njit
+def _panel_lag_pairs(
+    order: np.ndarray,
+    unit_col: np.ndarray,
+    time_col: np.ndarray,
+    lag: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find all pairs of observations of the same unit that are 1 to `lag`
+    periods apart.
+
+    `order` sorts the observations by unit and time. Returns the indices of
+    the earlier and later observation of each pair and their distance in
+    periods.
+    """
+    N = order.size
+
+    n_pairs = 0
+    for p in range(N):
+        i = order[p]
+        q = p + 1
+        while q < N:
+            j = order[q]
+            if unit_col[j] != unit_col[i] or time_col[j] - time_col[i] > lag:
+                break
+            if time_col[j] > time_col[i]:
+                n_pairs += 1
+            q += 1
+
+    idx_a = np.empty(n_pairs, dtype=np.int64)
+    idx_b = np.empty(n_pairs, dtype=np.int64)
+    pair_lag = np.empty(n_pairs, dtype=np.int64)
+
+    n = 0
+    for p in range(N):
+        i = order[p]
+        q = p + 1
+        while q < N:
+            j = order[q]
+            if unit_col[j] != unit_col[i] or time_col[j] - time_col[i] > lag:
+                break
+            if time_col[j] > time_col[i]:
+                idx_a[n] = i
+                idx_b[n] = j
+                pair_lag[n] = time_col[j] - time_col[i]
+                n += 1
+            q += 1
+
+    return idx_a, idx_b, pair_lag
+
+
+def _leverage(X: np.ndarray, tXX: np.ndarray, chunk_size: int = 65_536) -> np.ndarray:
+    """
+    Compute the leverage x_i' (X'X)^{-1} x_i of all observations.
+
+    With the Cholesky factorization X'X = LL', the leverage is the squared
+    norm of L^{-1} x_i. It is computed for `chunk_size` rows at once, so that
+    no array of the size of `X` is allocated.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        The (demeaned, weighted) design matrix of shape (N, k).
+    tXX : np.ndarray
+        The cross-product X'X of shape (k, k).
+    chunk_size : int, optional
+        The number of rows processed at once. Defaults to 65_536.
+
+    Returns
+    -------
+    np.ndarray
+        The leverage of shape (N,).
+    """
+    L = np.linalg.cholesky(tXX)
+
+    leverage = np.empty(X.shape[0], dtype=np.float64)
+    for start in range(0, X.shape[0], chunk_size):
+        X_chunk = X[start : start + chunk_size].astype(np.float64, copy=False)
+        L_inv_X = solve_triangular(L, X_chunk.T, lower=True)
+        leverage[start : start + chunk_size] = np.sum(L_inv_X**2, axis=0)
+
+    return leverage
+
+
+def _fixef_leverage(fe: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Compute the leverage of a one-way fixed effects projection.
+
+    For the regression of sqrt(w) * y on sqrt(w) * D, with D the dummies of
+    the fixed effect, the leverage of observation i is w_i divided by the sum
+    of the weights of its group. Adding the leverage of the demeaned
+    covariates gives the exact leverage of the full model (Frisch-Waugh-Lovell).
+
+    Parameters
+    ----------
+    fe : np.ndarray
+        The integer coded fixed effect of shape (N,).
+    weights : np.ndarray
+        The regression weights of shape (N,).
+
+    Returns
+    -------
+    np.ndarray
+        The leverage of shape (N,).
+    """
+    fe = fe.astype(np.int64)
+    group_weights = np.bincount(fe, weights=weights)
+
+    return weights / group_weights[fe]
@@ -0,0 +1,309 @@
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import numpy as np
+
+from pyfixest.estimation.vcov_utils import _crv1_score_sums
+from pyfixest.utils.dev_utils import _numba_threads_are_safe
+
+
+def _wildboottest_problem(
+    X: np.ndarray,
+    Y: np.ndarray,
+    R: np.ndarray,
+    r: float,
+    bootcluster: np.ndarray,
+    cluster_cols: list[np.ndarray],
+    cluster_ssc: list[float],
+    impose_null: bool = True,
+    demean_errors: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+) -> dict:
+    """
+    Set up a wild (cluster) bootstrap of the t-statistic of R'beta = r.
+
+    The bootstrap follows the algorithm of Roodman et al (2019, "Fast and wild"):
+    with the scores s_g = X_g'u_g of the bootstrap clusters, the bootstrap
+    coefficients are beta* = beta + A S'v, with A = (X'X)^{-1}, and the
+    cluster scores of the bootstrap residuals in the direction a = A R are
+    linear in v as well. All bootstrap statistics hence follow from matrix
+    products of (G, k) and (H, k) sufficient statistics with the (G, B)
+    matrix of bootstrap weights, see `_wildboottest_tboot()`. The cost is
+    linear in the number of observations and of order k * G * B for the draws.
+
+    With fixed effects, `X` and `Y` are the demeaned model matrices. If the
+    fixed effects are not nested in the bootstrap clusters, the bootstrap
+    errors u * v are no longer orthogonal to the fixed effects and are
+    demeaned via `demean_errors`.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        The (demeaned, weighted) design matrix of shape (N, k).
+    Y : np.ndarray
+        The (demeaned, weighted) dependent variable of shape (N,).
+    R : np.ndarray
+        The restriction vector of shape (k,).
+    r : float
+        The value of R'beta under the null hypothesis.
+    bootcluster : np.ndarray
+        The integer coded bootstrap clusters of shape (N,), with values in
+        0, ..., G - 1. Each observation is its own cluster for a
+        heteroskedastic bootstrap.
+    cluster_cols : list[np.ndarray]
+        The integer coded clusters of the CRV1 variance matrix, one array of
+        shape (N,) per term of the multiway inclusion-exclusion formula. The
+        bootstrap clusters must be nested in all of them.
+    cluster_ssc : list[float]
+        The small sample corrections of each term, including its sign.
+    impose_null : bool, optional
+        Whether to impose the null hypothesis on the bootstrap DGP (WCR) or
+        not (WCU). Defaults to True.
+    demean_errors : Optional[Callable[[np.ndarray], np.ndarray]], optional
+        A function that projects an (N, B) array on the orthogonal complement
+        of the fixed effects. None if there are no fixed effects or if they are
+        nested in the bootstrap clusters. Defaults to None.
+
+    Returns
+    -------
+    dict
+        The t-statistic of the original sample and the sufficient statistics
+        of the bootstrap.
+    """
+    X = X.astype(np.float64, copy=False)
+    Y = Y.astype(np.float64, copy=False).flatten()
+
+    A = np.linalg.pinv(X.T @ X)
+    a = A @ R
+    beta_hat = A @ (X.T @ Y)
+    u_hat = Y - X @ beta_hat
+    Xa = X @ a
+
+    # h_of_g maps the bootstrap clusters to the clusters of each variance term
+    G = int(bootcluster.max()) + 1
+    h_of_g = []
+    for cluster_col in cluster_cols:
+        h = np.empty(G, dtype=np.int64)
+        h[bootcluster] = cluster_col
+        h_of_g.append(h)
+
+    # t-statistic of the original sample
+    var = 0.0
+    for cluster_col, ssc in zip(cluster_cols, cluster_ssc):
+        q = _crv1_score_sums(Xa[:, None], u_hat, cluster_col)
+        var += ssc * np.sum(q**2)
+    t_stat = (R @ beta_hat - r) / np.sqrt(var)
+
+    if impose_null:
+        beta_tilde = beta_hat - a * (R @ beta_hat - r) / (R @ a)
+        u_tilde = Y - X @ beta_tilde
+    else:
+        u_tilde = u_hat
+
+    # sufficient statistics
+    S = _crv1_score_sums(X, u_tilde, bootcluster)
+
+    return {
+        "t_stat": t_stat,
+        "G": G,
+        "N": X.shape[0],
+        "bootcluster": bootcluster,
+        "cluster_cols": cluster_cols,
+        "cluster_ssc": cluster_ssc,
+        "h_of_g": h_of_g,
+        "c": S @ a,
+        "SA": S @ A,
+        "M": [_crv1_score_sums(X, Xa, cluster_col) for cluster_col in cluster_cols],
+        "Xa": Xa,
+        "u_tilde": u_tilde,
+        "demean_errors": demean_errors,
+    }
+
+
+def _wildboottest_tboot(problem: dict, v: np.ndarray) -> np.ndarray:
+    "Compute the bootstrapped t-statistics of a problem for the (G, B) weights v."
+    numer = problem["c"] @ v
+    SAv = problem["SA"].T @ v
+
+    demean_errors = problem["demean_errors"]
+    if demean_errors is not None:
+        errors = demean_errors(problem["u_tilde"][:, None] * v[problem["bootcluster"]])
+
+    var_boot = np.zeros(v.shape[1])
+    for x, (cluster_col, ssc) in enumerate(
+        zip(problem["cluster_cols"], problem["cluster_ssc"])
+    ):
+        if demean_errors is None:
+            # sum_{g in h} c_g v_g
+            q = _crv1_score_sums(v, problem["c"], problem["h_of_g"][x])
+        else:
+            q = _crv1_score_sums(errors, problem["Xa"], cluster_col)
+        q -= problem["M"][x] @ SAv
+        var_boot += ssc * np.sum(q**2, axis=0)
+
+    return numer / np.sqrt(var_boot)
+
+
+def _wildboottest_many(
+    problems: list[dict],
+    reps: int,
+    weights_type: str = "rademacher",
+    seed: Optional[int] = None,
+    n_jobs: int = 1,
+    chunk_size: int = 2**24,
+) -> tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Run the wild bootstrap for several problems with the same bootstrap weights.
+
+    The weights are drawn once per chunk of draws and shared by all problems,
+    which must hence have the same bootstrap clusters, as required for the
+    Romano-Wolf correction.
+
+    Parameters
+    ----------
+    problems : list[dict]
+        The S problems, as returned by `_wildboottest_problem()`.
+    reps : int
+        The number of bootstrap iterations.
+    weights_type : str, optional
+        The type of bootstrap weights. Defaults to 'rademacher'.
+    seed : Optional[int], optional
+        The random seed. Defaults to None.
+    n_jobs : int, optional
+        The number of threads over which the problems are distributed. -1 uses
+        all CPUs. Under numba's workqueue threading layer, which is not
+        threadsafe, the problems are bootstrapped serially. Defaults to 1.
+    chunk_size : int, optional
+        The maximum number of elements of the (G, B) or (N, B) arrays
+        processed at once per problem. Defaults to 2**24.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, bool]
+        The S t-statistics, the (B, S) bootstrapped t-statistics, and whether
+        all 2^G Rademacher weight vectors were enumerated instead of drawn.
+    """
+    G = problems[0]["G"]
+    for problem in problems[1:]:
+        if problem["G"] != G or not np.array_equal(
+            problem["bootcluster"], problems[0]["bootcluster"]
+        ):
+            raise ValueError(
+                "All models need to share the bootstrap clusters to be "
+                "bootstrapped with the same weights."
+            )
+
+    full_enumeration = weights_type == "rademacher" and G < 63 and reps > 2**G
+    n_draws = 2**G if full_enumeration else reps
+    rng = np.random.default_rng(seed)
+
+    n_rows = max(
+        problem["N"] if problem["demean_errors"] is not None else G
+        for problem in problems
+    )
+    draws_per_chunk = max(1, chunk_size // n_rows)
+
+    S = len(problems)
+    max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+    executor = None
+    if max_workers is not None and max_workers > 1 and S > 1:
+        if _numba_threads_are_safe():
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        else:
+            warnings.warn(
+                "numba uses its workqueue threading layer, which does not support "
+                "concurrent calls from several threads. The models are "
+                "bootstrapped serially."
+            )
+
+    t_boot = np.empty((n_draws, S), dtype=np.float64)
+    try:
+        for start in range(0, n_draws, draws_per_chunk):
+            end = min(start + draws_per_chunk, n_draws)
+            if full_enumeration:
+                v = _enumerate_rademacher_weights(G, start, end)
+            else:
+                v = _draw_bootstrap_weights(weights_type, G, end - start, rng)
+
+            if executor is None:
+                for s, problem in enumerate(problems):
+                    t_boot[start:end, s] = _wildboottest_tboot(problem, v)
+            else:
+                futures = [
+                    executor.submit(_wildboottest_tboot, problem, v)
+                    for problem in problems
+                ]
+                for s, future in enumerate(futures):
+                    t_boot[start:end, s] = future.result()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    t_stats = np.array([problem["t_stat"] for problem in problems])
+
+    return t_stats, t_boot, full_enumeration
+
+
+def _draw_bootstrap_weights(
+    weights_type: str, G: int, n_draws: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Draw bootstrap weights with mean zero and unit variance.
+
+    Parameters
+    ----------
+    weights_type : str
+        Either 'rademacher', 'mammen', 'webb' or 'normal'.
+    G : int
+        The number of bootstrap clusters.
+    n_draws : int
+        The number of draws.
+    rng : np.random.Generator
+        The random number generator.
+
+    Returns
+    -------
+    np.ndarray
+        The weights of shape (G, n_draws).
+    """
+    if weights_type == "rademacher":
+        return rng.choice(np.array([-1.0, 1.0]), size=(G, n_draws))
+    elif weights_type == "mammen":
+        sqrt5 = np.sqrt(5)
+        return rng.choice(
+            np.array([-(sqrt5 - 1) / 2, (sqrt5 + 1) / 2]),
+            p=[(sqrt5 + 1) / (2 * sqrt5), (sqrt5 - 1) / (2 * sqrt5)],
+            size=(G, n_draws),
+        )
+    elif weights_type == "webb":
+        return rng.choice(
+            np.array(
+                [
+                    -np.sqrt(3 / 2),
+                    -1.0,
+                    -np.sqrt(1 / 2),
+                    np.sqrt(1 / 2),
+                    1.0,
+                    np.sqrt(3 / 2),
+                ]
+            ),
+            size=(G, n_draws),
+        )
+    elif weights_type == "normal":
+        return rng.normal(size=(G, n_draws))
+    else:
+        raise ValueError(
+            "weights_type must be one of 'rademacher', 'mammen', 'webb' or "
+            f"'normal', but {weights_type} was specified."
+        )
+
+
+def _enumerate_rademacher_weights(G: int, start: int, end: int) -> np.ndarray:
+    """
+    Return the Rademacher weight vectors start, ..., end - 1 of all 2^G vectors.
+
+    Vector b has weight -1 for cluster g if bit g of b is set, and 1 otherwise.
+    """
+    bits = (np.arange(start, end, dtype=np.int64)[None, :] >> np.arange(G)[:, None]) & 1
+    return 1.0 - 2.0 * bits
@@ -6,6 +6,7 @@ import pandas as pd
 from great_tables import GT
 from tabulate import tabulate
 
+from pyfixest.estimation.feglm_ import Feglm
 from pyfixest.estimation.feiv_ import Feiv
 from pyfixest.estimation.feols_ import Feols
 from pyfixest.estimation.fepois_ import Fepois
@@ -223,6 +224,10 @@ def etable(
 
         if model._vcov_type == "CRV":
             se_type_list.append("by: " + "+".join(model._clustervar))
+        elif model._vcov_type == "HAC":
+            se_type_list.append(
+                f"{model._vcov_type_detail}: " + "+".join(model._hacvar)
+            )
         else:
             se_type_list.append(model._vcov_type)
 
@@ -508,6 +513,8 @@ def summary(
             estimation_method = "IV" if fxst._is_iv else "OLS"
         elif fxst._method == "fepois":
             estimation_method = "Poisson"
+        elif isinstance(fxst, Feglm):
+            estimation_method = fxst._family.label
         elif fxst._method == "twfe":
             estimation_method = "TWFE"
         elif fxst._method == "did2s":
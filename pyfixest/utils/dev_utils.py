@@ -1,11 +1,17 @@
 import re
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
+import numba as nb
 import numpy as np
 import pandas as pd
 import polars as pl
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 DataFrameType = Union[pd.DataFrame, pl.DataFrame]
+# estimation data: also lazy polars frames and pyarrow Tables
+DataInputType = Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame, "pa.Table"]
 
 
 def _polars_to_pandas(data: DataFrameType) -> pd.DataFrame:  # type: ignore
@@ -23,6 +29,110 @@ def _polars_to_pandas(data: DataFrameType) -> pd.DataFrame:  # type: ignore
     return data
 
 
+def _is_arrow_table(data: Any) -> bool:
+    "Check if data is a pyarrow Table without importing pyarrow."
+    return type(data).__name__ == "Table" and type(data).__module__.startswith(
+        "pyarrow"
+    )
+
+
+def _get_column_names(data: DataInputType) -> list[str]:
+    """
+    Get the column names of a pandas, polars (lazy) or pyarrow data frame.
+
+    Parameters
+    ----------
+    data : DataInputType
+        The data frame.
+
+    Returns
+    -------
+    list[str]
+        The column names. For a LazyFrame, only its schema is resolved.
+    """
+    if isinstance(data, pl.LazyFrame):
+        return data.collect_schema().names()
+    if isinstance(data, pd.DataFrame):
+        return data.columns.tolist()
+    if isinstance(data, pl.DataFrame):
+        return data.columns
+    # pyarrow Table
+    return data.column_names
+
+
+def _get_model_columns(
+    columns: list[str],
+    fml: str,
+    weights: Optional[str] = None,
+    vcov: Optional[Union[str, dict[str, str]]] = None,
+    splitvar: Optional[str] = None,
+) -> list[str]:
+    """
+    Select the columns of a data set that are referenced by a model.
+
+    A column is kept if its name appears in the formula or in the cluster or
+    HAC variables of `vcov`, or if it is the weights or sample split variable. The
+    selection is conservative: a column whose name is part of another
+    variable's name is kept as well.
+
+    Parameters
+    ----------
+    columns : list[str]
+        The column names of the data set.
+    fml : str
+        The model formula, possibly with multiple estimation syntax.
+    weights : Optional[str]
+        The name of the weights column.
+    vcov : Optional[Union[str, dict[str, str]]]
+        The vcov argument.
+    splitvar : Optional[str]
+        The name of the sample split variable.
+
+    Returns
+    -------
+    list[str]
+        The referenced columns, in the order of `columns`.
+    """
+    referenced = fml
+    if isinstance(vcov, dict):
+        # the first value holds the variables, others are HAC options
+        referenced += " " + list(vcov.values())[0]
+    extra = {x for x in [weights, splitvar] if x is not None}
+
+    return [x for x in columns if x in extra or str(x) in referenced]
+
+
+def _to_pandas(
+    data: DataInputType, columns: Optional[list[str]] = None
+) -> pd.DataFrame:
+    """
+    Convert a polars (lazy) data frame or pyarrow Table to pandas.
+
+    Only the selected columns are converted. For a LazyFrame, the selection is
+    pushed into the query, so that unused columns are never materialized.
+
+    Parameters
+    ----------
+    data : DataInputType
+        The data frame. pandas data frames are returned as is.
+    columns : Optional[list[str]]
+        The columns to convert. All columns if None.
+
+    Returns
+    -------
+    pd.DataFrame
+        The data as a pandas data frame with a default index.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data if columns is None else data[columns]
+    if isinstance(data, pl.LazyFrame):
+        data = (data.select(columns) if columns is not None else data).collect()
+    elif columns is not None:
+        data = data.select(columns)
+
+    return data.to_pandas()
+
+
 def _create_rng(seed: Optional[int] = None) -> np.random.Generator:
     """
     Create a random number generator.
@@ -42,6 +152,35 @@ def _create_rng(seed: Optional[int] = None) -> np.random.Generator:
     return np.random.default_rng(seed)
 
 
+def _numba_threads_are_safe() -> bool:
+    """
+    Check if numba's parallel functions may be called from several threads.
+
+    The workqueue threading layer, which numba falls back to if neither TBB nor
+    OpenMP is available, aborts the process when `parallel=True` functions are
+    called concurrently from several Python threads.
+
+    Returns
+    -------
+    bool
+        False if numba uses the workqueue threading layer, True otherwise.
+    """
+    try:
+        threading_layer = nb.threading_layer()
+    except ValueError:
+        # the threading layer is only selected once a parallel function runs
+        _parallel_noop(np.zeros(1))
+        threading_layer = nb.threading_layer()
+    return threading_layer != "workqueue"
+
+
+@nb.njit(parallel=True)
+def _parallel_noop(x: np.ndarray) -> None:
+    "Run a trivial parallel loop, which launches numba's thread pool."
+    for i in nb.prange(x.size):
+        x[i] = 0.0
+
+
 def _select_order_coefs(
     coefs: list,
     keep: Optional[Union[list, str]] = None,
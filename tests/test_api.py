@@ -1,6 +1,14 @@
+import os
+import subprocess
+import sys
+import warnings
+
 import numpy as np
+import pandas as pd
+import pytest
 
 import pyfixest as pf
+from pyfixest.estimation import FixestMulti_
 from pyfixest.utils.utils import get_data
 
 
@@ -89,3 +97,75 @@ def test_lean():
     assert not hasattr(fit, "_data")
     assert not hasattr(fit, "_X")
     assert not hasattr(fit, "_Y")
+
+
+@pytest.mark.parametrize(
+    "executor",
+    ["threads", pytest.param("processes", marks=pytest.mark.slow)],
+)
+def test_n_jobs(executor):
+    data = pf.get_data()
+    data["Y_pois"] = np.abs(data["Y"]).round()
+
+    fml = "Y + Y2 ~ X1 | sw0(f1, f2)"
+    fit = pf.feols(fml, data=data, fsplit="f3")
+    fit_parallel = pf.feols(fml, data=data, fsplit="f3", n_jobs=2, executor=executor)
+    # same models in the same order
+    assert list(fit.all_fitted_models) == list(fit_parallel.all_fitted_models)
+    pd.testing.assert_frame_equal(fit.tidy(), fit_parallel.tidy())
+
+    fml = "Y_pois ~ X1 | sw(f1, f2)"
+    fit = pf.fepois(fml, data=data, split="f3")
+    fit_parallel = pf.fepois(fml, data=data, split="f3", n_jobs=-1, executor=executor)
+    pd.testing.assert_frame_equal(fit.tidy(), fit_parallel.tidy())
+
+
+@pytest.mark.parametrize(
+    "fml, vcov",
+    [
+        ("Y ~ X1 + X2 | f1 + f2", {"CRV1": "f1"}),
+        ("Y ~ X1 + X2 + i(f3)", "hetero"),
+        ("Y ~ X1 | f1", {"CRV3": "f1"}),
+        ("Y ~ 1 | f1 | X1 ~ Z1", {"CRV1": "f1"}),
+    ],
+)
+def test_dtype_float32(fml, vcov):
+    data = pf.get_data()
+
+    fit = pf.feols(fml, data=data, vcov=vcov, weights="weights")
+    fit32 = pf.feols(fml, data=data, vcov=vcov, weights="weights", dtype="float32")
+
+    assert fit32._X.dtype == np.float32
+    assert fit32._tZX.dtype == np.float64
+    np.testing.assert_allclose(fit.coef(), fit32.coef(), rtol=1e-5)
+    np.testing.assert_allclose(fit.se(), fit32.se(), rtol=1e-5)
+
+
+def test_n_jobs_workqueue(monkeypatch):
+    # numba's workqueue threading layer is not threadsafe: estimate serially
+    monkeypatch.setattr(FixestMulti_, "_numba_threads_are_safe", lambda: False)
+    data = pf.get_data()
+
+    fml = "Y ~ X1 | sw(f1, f2, f3)"
+    fit = pf.feols(fml, data=data)
+    with pytest.warns(UserWarning, match="workqueue threading layer"):
+        fit_parallel = pf.feols(fml, data=data, n_jobs=3)
+    pd.testing.assert_frame_equal(fit.tidy(), fit_parallel.tidy())
+
+    # a single group of models runs serially anyway
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        pf.feols("Y ~ X1", data=data, n_jobs=3)
+
+
+@pytest.mark.slow
+def test_n_jobs_workqueue_no_abort():
+    code = (
+        "import pyfixest as pf;"
+        "pf.feols('Y ~ X1 + X2 | sw(f1, f2, f3)', pf.get_data(), n_jobs=3)"
+    )
+    env = {**os.environ, "NUMBA_THREADING_LAYER": "workqueue"}
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -1,7 +1,19 @@
+import numba as nb
 import numpy as np
 import pyhdfe
+import pytest
 
-from pyfixest.estimation.demean_ import demean
+import pyfixest as pf
+from pyfixest.estimation.demean_ import (
+    _demean_array,
+    _demean_irons_tuck,
+    _demean_irons_tuck_by_obs,
+    _demean_map,
+    _demean_map_by_obs,
+    _sort_by_group,
+    _use_demean_by_obs,
+    demean,
+)
 
 
 def test_demean():
@@ -27,3 +39,140 @@ def test_demean():
     res_pyhdfe = algorithm.residualize(x, weights)
     res_pyfixest, success = demean(x, flist, weights.flatten(), tol=1e-10)
     assert np.allclose(res_pyhdfe, res_pyfixest)
+
+
+def test_demean_irons_tuck():
+    rng = np.random.default_rng(3)
+
+    N = 2_000
+    x = rng.normal(0, 1, 5 * N).reshape((N, 5))
+    # weakly connected fixed effects: f2 is close to nested in f1
+    f1 = rng.choice(list(range(200)), N).reshape((N, 1))
+    f2 = f1 // 5 + rng.choice([0, 1], N, p=[0.95, 0.05]).reshape((N, 1))
+    f3 = rng.choice(list(range(20)), N).reshape((N, 1))
+    flist = np.concatenate((f1, f2, f3), axis=1)
+    weights = rng.uniform(0, 1, N)
+
+    # exact solution via weighted least squares on dummies
+    D = np.concatenate(
+        [(flist[:, [j]] == np.unique(flist[:, j])).astype(float) for j in range(3)],
+        axis=1,
+    )
+    w = np.sqrt(weights)[:, None]
+    alpha = np.linalg.lstsq(D * w, x * w, rcond=None)[0]
+    res_exact = x - D @ alpha
+
+    res_map, n_iter_map, success_map = _demean_map(x, flist, weights, 1e-10)
+    res_it, n_iter_it, success_it = _demean_irons_tuck(x, flist, weights, 1e-10)
+
+    assert success_map and success_it
+    assert np.allclose(res_exact, res_it, atol=1e-06)
+    assert np.allclose(res_map, res_it, atol=1e-06)
+    assert np.all(n_iter_it < n_iter_map)
+
+    res, n_iter = _demean_array(x, flist, weights, 1e-10, demeaner="irons_tuck")
+    np.testing.assert_array_equal(n_iter, n_iter_it)
+
+    with pytest.raises(ValueError):
+        _demean_array(x, flist, weights, demeaner="cg")
+
+
+@pytest.mark.parametrize(
+    "fml", ["Y ~ X1 | f1", "Y ~ X1 + X2 | f1 + f2", "Y ~ X1 | f1 + f2 + f3"]
+)
+def test_feols_demeaner(fml):
+    data = pf.get_data()
+    fit_map = pf.feols(fml, data=data)
+    fit_it = pf.feols(fml, data=data, demeaner="irons_tuck")
+
+    np.testing.assert_allclose(fit_map.coef(), fit_it.coef(), rtol=1e-06)
+    np.testing.assert_allclose(fit_map.se(), fit_it.se(), rtol=1e-06)
+    assert list(fit_it._demean_iterations.index) == ["Y", *fit_it._coefnames]
+
+    data = pf.get_data(model="Fepois")
+    fit_map = pf.fepois(fml, data=data)
+    fit_it = pf.fepois(fml, data=data, demeaner="irons_tuck")
+    np.testing.assert_allclose(fit_map.coef(), fit_it.coef(), rtol=1e-06)
+
+
+@pytest.mark.parametrize("demeaner", ["map", "irons_tuck"])
+def test_demean_sort_by_group(demeaner):
+    rng = np.random.default_rng(41)
+
+    N = 5_000
+    x = rng.normal(0, 1, 3 * N).reshape((N, 3))
+    # the fixed effect with the most levels is not the first column
+    flist = np.asfortranarray(
+        np.column_stack(
+            [
+                rng.choice(20, N),
+                rng.choice(1_000, N),
+                rng.choice(5, N),
+            ]
+        )
+    )
+    weights = rng.uniform(0, 1, N)
+
+    res, _ = _demean_array(x, flist, weights, 1e-10, demeaner=demeaner)
+    res_sorted, _ = _demean_array(
+        x, flist, weights, 1e-10, demeaner=demeaner, sort_by_group=True
+    )
+    np.testing.assert_allclose(res, res_sorted, atol=1e-08)
+
+    fml = "Y ~ X1 + X2 | f1 + f2 + f3"
+    data = pf.get_data()
+    fit = pf.feols(fml, data=data, demeaner=demeaner)
+    fit_sorted = pf.feols(fml, data=data, demeaner=demeaner, fixef_sort=True)
+    np.testing.assert_allclose(fit.coef(), fit_sorted.coef(), rtol=1e-06)
+    np.testing.assert_allclose(fit.se(), fit_sorted.se(), rtol=1e-06)
+
+    data = pf.get_data(model="Fepois")
+    fit = pf.fepois(fml, data=data, demeaner=demeaner)
+    fit_sorted = pf.fepois(fml, data=data, demeaner=demeaner, fixef_sort=True)
+    np.testing.assert_allclose(fit.coef(), fit_sorted.coef(), rtol=1e-06)
+
+
+@pytest.mark.parametrize(
+    "demean_func, demean_func_by_obs",
+    [
+        (_demean_map, _demean_map_by_obs),
+        (_demean_irons_tuck, _demean_irons_tuck_by_obs),
+    ],
+)
+def test_demean_parallel_by_obs(demean_func, demean_func_by_obs):
+    rng = np.random.default_rng(512)
+
+    N = 5_000
+    x = rng.normal(0, 1, 2 * N).reshape((N, 2))
+    flist = np.asfortranarray(np.column_stack([rng.choice(500, N), rng.choice(20, N)]))
+    weights = rng.uniform(0, 1, N)
+
+    res, n_iter, success = demean_func(x, flist, weights, 1e-10)
+    res_obs, n_iter_obs, success_obs = demean_func_by_obs(x, flist, weights, 1e-10)
+    assert success and success_obs
+    np.testing.assert_allclose(res, res_obs, atol=1e-08)
+    np.testing.assert_array_equal(n_iter, n_iter_obs)
+
+    # observations sorted by group
+    x_sorted, flist_sorted, weights_sorted, group_weights, order, offsets = (
+        _sort_by_group(x, flist, weights)
+    )
+    res_obs, _, _ = demean_func_by_obs(
+        x_sorted, flist_sorted, weights_sorted, 1e-10, 100_000, group_weights, offsets
+    )
+    np.testing.assert_allclose(res[order], res_obs, atol=1e-08)
+
+
+def test_use_demean_by_obs(monkeypatch):
+    monkeypatch.setattr(nb, "get_num_threads", lambda: 8)
+    N = 2_000_000
+    few_groups = np.zeros((N, 2), dtype=np.uint32)
+    many_groups = np.column_stack([np.arange(N) // 2, np.zeros(N)]).astype(np.uint32)
+
+    assert _use_demean_by_obs(2, few_groups, False)
+    # more columns than threads, few observations or many groups per observation
+    assert not _use_demean_by_obs(8, few_groups, False)
+    assert not _use_demean_by_obs(2, few_groups[:10_000], False)
+    assert not _use_demean_by_obs(2, many_groups, False)
+    # the first fixed effect of sorted observations is swept by segments
+    assert _use_demean_by_obs(2, many_groups, True)
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyfixest as pf
+from pyfixest.estimation import DemeanCache
+from pyfixest.estimation.demean_ import _demean_array
+
+
+@pytest.fixture
+def data():
+    return pf.get_data()
+
+
+@pytest.mark.parametrize("fml", ["Y ~ X1 + X2 | f1", "Y ~ X1 | f1 + f2^f3"])
+@pytest.mark.parametrize("weights", [None, "weights"])
+def test_demean_cache_vs_no_cache(data, fml, weights):
+    cache = DemeanCache()
+    fit = pf.feols(fml, data, weights=weights)
+    for _ in range(2):
+        fit_cache = pf.feols(fml, data, weights=weights, demean_cache=cache)
+        pd.testing.assert_frame_equal(fit.tidy(), fit_cache.tidy())
+        pd.testing.assert_series_equal(
+            fit._demean_iterations, fit_cache._demean_iterations
+        )
+    n_vars = len(fit._demean_iterations)
+    assert (cache.misses, cache.hits) == (n_vars, n_vars)
+
+
+def test_demean_cache_across_calls(data):
+    cache = DemeanCache()
+    pf.feols("Y ~ X1 | f1 + f2", data, demean_cache=cache)
+    assert (len(cache), cache.hits) == (2, 0)
+
+    # Y and X1 are reused
+    pf.feols("Y ~ X1 + X2 | f1 + f2", data, demean_cache=cache)
+    assert (cache.hits, cache.misses) == (2, 3)
+    # different fixed effects, sample, tolerance or weights
+    pf.feols("Y ~ X1 | f1", data, demean_cache=cache)
+    pf.feols("Y ~ X1 | f1 + f2", data.iloc[10:], demean_cache=cache)
+    pf.feols("Y ~ X1 | f1 + f2", data, demean_cache=cache, fixef_tol=1e-6)
+    pf.feols("Y ~ X1 | f1 + f2", data, demean_cache=cache, weights="weights")
+    assert cache.misses == 3 + 4 * 2
+
+    # modified data is not taken from the cache
+    data["X1"] = data["X1"] + 1
+    pf.feols("Y ~ X1 | f1 + f2", data, demean_cache=cache)
+    assert cache.misses == 3 + 4 * 2 + 1
+
+    # shared by multiple estimations, sample splits and threads
+    fit = pf.feols("Y ~ X1 | csw0(f1, f2)", data, split="f3", n_jobs=2)
+    fit_cache = pf.feols(
+        "Y ~ X1 | csw0(f1, f2)", data, split="f3", n_jobs=2, demean_cache=cache
+    )
+    pd.testing.assert_frame_equal(fit.tidy(), fit_cache.tidy())
+
+    # only the first IWLS iteration (working variable and X1) is looked up
+    misses = cache.misses
+    fit = pf.fepois("Y ~ X1 | f1", pf.get_data(model="Fepois"), demean_cache=cache)
+    assert cache.misses == misses + 2
+    hits = cache.hits
+    fit_cache = pf.fepois(
+        "Y ~ X1 | f1", pf.get_data(model="Fepois"), demean_cache=cache
+    )
+    assert cache.hits > hits
+    pd.testing.assert_frame_equal(fit.tidy(), fit_cache.tidy())
+
+
+@pytest.mark.slow
+def test_demean_cache_processes(data):
+    # worker processes cannot fill the cache of the caller
+    cache = DemeanCache()
+    fml = "Y + Y2 ~ X1 | sw(f1, f2)"
+    fit = pf.feols(fml, data)
+    with pytest.warns(UserWarning, match="cannot be shared with worker processes"):
+        fit_processes = pf.feols(
+            fml, data, n_jobs=2, executor="processes", demean_cache=cache
+        )
+    assert len(cache) == 0
+    pd.testing.assert_frame_equal(fit.tidy(), fit_processes.tidy())
+
+    # fitted models do not hold on to the cache
+    fit_cache = pf.feols(fml, data, demean_cache=cache)
+    assert len(cache) == 8
+    assert not any(hasattr(x, "_demean_cache") for x in fit_cache.to_list())
+
+
+def test_demean_cache_eviction():
+    rng = np.random.default_rng(12)
+    x = rng.normal(size=(1000, 4))
+    flist = rng.integers(0, 10, (1000, 1)).astype(np.uint32)
+    weights = np.ones(1000)
+
+    cache = DemeanCache(max_bytes=3 * 8000)
+    res, n_iter = cache.demean(x, flist, weights)
+    expected, expected_n_iter = _demean_array(x, flist, weights)
+    np.testing.assert_array_equal(res, expected)
+    np.testing.assert_array_equal(n_iter, expected_n_iter)
+    # the least recently used column is evicted
+    assert len(cache) == 3
+    assert cache.nbytes == 3 * 8000
+
+    cache.demean(x[:, 1:], flist, weights)
+    assert (cache.hits, cache.misses) == (3, 4)
+    cache.demean(x[:, :1], flist, weights)
+    assert cache.misses == 5
+
+    cache.clear()
+    assert (len(cache), cache.nbytes) == (0, 0)
+
+    with pytest.raises(ValueError):
+        DemeanCache(max_bytes=-1)
+    with pytest.raises(TypeError):
+        pf.feols("Y ~ X1 | f1", pf.get_data(), demean_cache={})
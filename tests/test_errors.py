@@ -65,19 +65,22 @@ def test_cluster_but_no_data():
 
 def test_error_hc23_fe():
     """
-    Test if HC2 & HC3 inference with fixed effects regressions raises an error.
+    Test if HC2 & HC3 inference with multiway fixed effects raises an error.
 
     Notes
     -----
-    Currently not supported.
+    Only supported with one fixed effect.
     """
     data = get_data().dropna()
 
     with pytest.raises(VcovTypeNotSupportedError):
-        feols(fml="Y ~ X1 | f2", data=data, vcov="HC2")
+        feols(fml="Y ~ X1 | f2 + f3", data=data, vcov="HC2")
 
     with pytest.raises(VcovTypeNotSupportedError):
-        feols(fml="Y ~ X1 | f2", data=data, vcov="HC3")
+        feols(fml="Y ~ X1 | f2 + f3", data=data, vcov="HC3")
+
+    with pytest.raises(VcovTypeNotSupportedError):
+        fepois(fml="Y ~ X1 | f2", data=get_data(model="Fepois"), vcov="HC2")
 
 
 def test_depvar_numeric():
@@ -205,12 +208,6 @@ def test_wls_errors():
     with pytest.raises(ValueError):
         feols("Y ~ X1", data=data, weights=[1, 2])
 
-    data.loc[0, "weights"] = np.nan
-    with pytest.raises(NotImplementedError):
-        feols("Y ~ X1", data=data, weights="weights").wildboottest(
-            cluster="f1", param="X1", reps=999, seed=12
-        )
-
     # test for ValueError when weights are not positive
     data.loc[10, "weights"] = -1
     with pytest.raises(ValueError):
@@ -224,7 +221,9 @@ def test_wls_errors():
 
     data = get_data()
     with pytest.raises(NotImplementedError):
-        feols("Y ~ X1", data=data, weights="weights", vcov="iid").wildboottest(reps=999)
+        feols("Y ~ X1", data=data, weights="weights", vcov="iid").wildboottest(
+            param="X1", reps=999, bootstrap_type="31"
+        )
 
 
 def test_multcomp_errors():
@@ -261,6 +260,9 @@ def test_wildboottest_errors():
     fit = feols("Y ~ X1", data=data)
     with pytest.raises(ValueError):
         fit.wildboottest(param="X2", reps=999, seed=213)
+    # the native bootstrap requires a parameter
+    with pytest.raises(ValueError):
+        fit.wildboottest(reps=999, seed=213)
 
 
 def test_summary_errors():
@@ -684,3 +686,46 @@ def test_separation_check_validations():
         match="The function argument `separation_check` must be a list of strings containing 'fe' and/or 'ir'.",
     ):
         pf.fepois("Y ~ X1", data=data, separation_check=["fe", "invalid"])
+
+
+def test_n_jobs_errors():
+    data = pf.get_data()
+
+    with pytest.raises(TypeError, match="`n_jobs` must be of type int"):
+        pf.feols("Y ~ X1", data=data, n_jobs=2.0)
+    with pytest.raises(ValueError, match="`n_jobs` must be a positive integer"):
+        pf.feols("Y ~ X1", data=data, n_jobs=0)
+    with pytest.raises(ValueError, match="`executor` must be either"):
+        pf.feols("Y ~ X1", data=data, n_jobs=2, executor="dask")
+
+
+def test_dtype_errors():
+    data = pf.get_data()
+
+    with pytest.raises(ValueError, match="`dtype` must be either"):
+        pf.feols("Y ~ X1", data=data, dtype="float16")
+
+
+def test_hac_errors():
+    data = pf.get_data()
+    data["time"] = np.arange(data.shape[0]) % 10
+
+    with pytest.raises(AssertionError, match="unsupported options"):
+        pf.feols("Y ~ X1", data=data, vcov={"NW": "f1 + time", "cutoff": 10})
+    with pytest.raises(ValueError, match="DK inference requires a single time"):
+        pf.feols("Y ~ X1", data=data, vcov={"DK": "f1 + time"})
+    with pytest.raises(ValueError, match="non-negative integer"):
+        pf.feols("Y ~ X1", data=data, vcov={"NW": "f1 + time", "lag": -1})
+    with pytest.raises(ValueError, match="non-negative integer"):
+        pf.feols("Y ~ X1", data=data, vcov={"NW": "f1 + time", "lag": 1.5})
+    # numpy integers are valid lags
+    data = data.dropna()
+    fit = pf.feols("Y ~ X1", data=data, vcov={"NW": "f1 + time", "lag": np.int64(1)})
+    fit_int = pf.feols("Y ~ X1", data=data, vcov={"NW": "f1 + time", "lag": 1})
+    np.testing.assert_allclose(fit.se(), fit_int.se())
+    with pytest.raises(ValueError, match="must be integer valued"):
+        pf.feols(
+            "Y ~ X1", data=data.assign(time=data["time"] + 0.5), vcov={"DK": "time"}
+        )
+    with pytest.raises(ValueError, match="positive distance `cutoff`"):
+        pf.feols("Y ~ X1", data=data, vcov={"conley": "X2 + Z1"})
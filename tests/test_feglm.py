@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.optimize import minimize
+from scipy.special import gammaln
+
+import pyfixest as pf
+
+
+@pytest.fixture
+def data():
+    data = pf.get_data().dropna()
+    rng = np.random.default_rng(8)
+    eta = 0.3 * data["X1"] - 0.2 * data["X2"] + 0.05 * data["f1"]
+    data["Y_binary"] = (eta + rng.logistic(size=len(data)) > 0.5).astype(int)
+    mu = np.exp(eta)
+    data["Y_count"] = rng.negative_binomial(1.5, 1.5 / (1.5 + mu))
+    data["Y_gamma"] = mu * rng.gamma(2.0, 0.5, len(data))
+    return data
+
+
+def test_poisson_vs_fepois():
+    data = pf.get_data(model="Fepois")
+    fit1 = pf.fepois("Y ~ X1 + X2 | f1 + f2", data, vcov={"CRV1": "f1"})
+    fit2 = pf.feglm(
+        "Y ~ X1 + X2 | f1 + f2", data, family="poisson", vcov={"CRV1": "f1"}
+    )
+
+    np.testing.assert_allclose(fit1.coef(), fit2.coef())
+    np.testing.assert_allclose(fit1.se(), fit2.se())
+    np.testing.assert_allclose(fit1.deviance, fit2.deviance)
+
+
+@pytest.mark.parametrize("family", ["logit", "probit", "negbin", "gamma"])
+@pytest.mark.parametrize("vcov", ["iid", "hetero"])
+def test_fixef_vs_dummies(data, family, vcov):
+    depvar = {
+        "logit": "Y_binary",
+        "probit": "Y_binary",
+        "negbin": "Y_count",
+        "gamma": "Y_gamma",
+    }[family]
+
+    fit1 = pf.feglm(
+        f"{depvar} ~ X1 + X2 | f1",
+        data,
+        family=family,
+        vcov=vcov,
+        iwls_tol=1e-12,
+        ssc=pf.ssc(adj=False),
+        separation_check=[],
+    )
+    fit2 = pf.feglm(
+        f"{depvar} ~ X1 + X2 + C(f1)",
+        data,
+        family=family,
+        vcov=vcov,
+        iwls_tol=1e-12,
+        ssc=pf.ssc(adj=False),
+    )
+
+    np.testing.assert_allclose(fit1.coef(), fit2.coef()[["X1", "X2"]], rtol=1e-6)
+    np.testing.assert_allclose(fit1.se(), fit2.se()[["X1", "X2"]], rtol=1e-4)
+    if family == "negbin":
+        np.testing.assert_allclose(fit1.theta, fit2.theta, rtol=1e-6)
+
+
+def test_vs_maximum_likelihood(data):
+    X = np.column_stack([np.ones(len(data)), data["X1"], data["X2"]])
+
+    # logit
+    y = data["Y_binary"].to_numpy()
+    fit = pf.feglm("Y_binary ~ X1 + X2", data, family="logit")
+    res = minimize(
+        lambda beta: -np.sum(y * (X @ beta) - np.logaddexp(0, X @ beta)),
+        np.zeros(3),
+        method="BFGS",
+        options={"gtol": 1e-10},
+    )
+    np.testing.assert_allclose(fit.coef(), res.x, rtol=1e-5)
+
+    # negative binomial, theta is estimated jointly
+    y = data["Y_count"].to_numpy()
+
+    def nll(params):
+        mu = np.exp(X @ params[:3])
+        theta = np.exp(params[3])
+        return -np.sum(
+            gammaln(y + theta)
+            - gammaln(theta)
+            + theta * np.log(theta / (theta + mu))
+            + y * np.log(mu / (theta + mu))
+        )
+
+    fit = pf.feglm("Y_count ~ X1 + X2", data, family="negbin")
+    res = minimize(nll, np.zeros(4), method="BFGS", options={"gtol": 1e-10})
+    np.testing.assert_allclose(fit.coef(), res.x[:3], rtol=1e-5)
+    np.testing.assert_allclose(fit.theta, np.exp(res.x[3]), rtol=1e-5)
+
+
+def test_separation_binary():
+    rng = np.random.default_rng(1)
+    data = pd.DataFrame(
+        {
+            "Y": [0, 1, 0, 1, 1, 1, 0, 0, 1, 0, 1, 0],
+            "f": ["a", "a", "a", "a", "b", "b", "c", "c", "d", "d", "d", "d"],
+            "X": rng.normal(size=12),
+        }
+    )
+
+    with pytest.warns(
+        UserWarning, match="2 observations removed because of separation."
+    ):
+        fit = pf.feglm("Y ~ X | f", data, family="logit")
+
+    assert fit._N == 8
+
+
+def test_feglm_errors(data):
+    with pytest.raises(ValueError, match="family must be one of"):
+        pf.feglm("Y_binary ~ X1 | f1", data, family="binomial")
+    with pytest.raises(ValueError, match="must lie in"):
+        pf.feglm("Y_count ~ X1 | f1", data, family="logit")
+    with pytest.raises(ValueError, match="strictly positive"):
+        pf.feglm("Y_count ~ X1 | f1", data, family="gamma")
+    with pytest.raises(NotImplementedError):
+        pf.feglm("Y_binary ~ X1 | f1", data, family="logit").wildboottest(
+            param="X1", reps=99
+        )
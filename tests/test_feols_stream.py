@@ -0,0 +1,125 @@
+import numpy as np
+import polars as pl
+import pytest
+
+import pyfixest as pf
+from pyfixest.errors import VcovTypeNotSupportedError
+
+
+@pytest.fixture
+def data():
+    return pf.get_data()
+
+
+def _chunks(data, size=137):
+    return [data.iloc[i : i + size] for i in range(0, data.shape[0], size)]
+
+
+@pytest.mark.parametrize(
+    "fml",
+    [
+        "Y ~ X1 + X2",
+        "Y ~ X1 | f1",
+        "Y ~ X1 + X2 | f1 + f2",
+        "Y ~ X1 | f1 + f2^f3",
+        "Y ~ X1 + i(f3) | f1",
+    ],
+)
+@pytest.mark.parametrize("vcov", ["iid", "hetero", {"CRV1": "group_id"}, None])
+@pytest.mark.parametrize("weights", [None, "weights"])
+def test_feols_stream_vs_feols(data, fml, vcov, weights):
+    fit = pf.feols(fml, data, vcov=vcov, weights=weights)
+    fit_stream = pf.feols_stream(fml, _chunks(data), vcov=vcov, weights=weights)
+
+    assert fit_stream._coefnames == fit._coefnames
+    assert fit_stream._N == fit._N
+    np.testing.assert_allclose(fit_stream.coef(), fit.coef(), rtol=1e-10)
+    # feols() demeans iteratively, up to `fixef_tol`
+    np.testing.assert_allclose(fit_stream.se(), fit.se(), rtol=1e-6)
+    np.testing.assert_allclose(fit_stream.pvalue(), fit.pvalue(), rtol=1e-6, atol=1e-12)
+    np.testing.assert_allclose(fit_stream._r2, fit._r2, rtol=1e-8)
+    np.testing.assert_allclose(fit_stream._r2_within, fit._r2_within, rtol=1e-8)
+    np.testing.assert_allclose(fit_stream._rmse, fit._rmse, rtol=1e-8)
+
+
+def test_feols_stream_sources(data, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    paths = []
+    for i, chunk in enumerate(_chunks(data, 400)):
+        paths.append(tmp_path / f"part_{i}.parquet")
+        pq.write_table(pa.Table.from_pandas(chunk, preserve_index=False), paths[-1])
+
+    fml = "Y ~ X1 + X2 | f1 + f2"
+    vcov = {"CRV1": "f3"}
+    fit = pf.feols(fml, data, vcov=vcov)
+
+    sources = [
+        tmp_path,
+        paths,
+        pa.Table.from_pandas(data),
+        data,
+        pl.from_pandas(data),
+        [pl.from_pandas(x) for x in _chunks(data)],
+        lambda: iter(_chunks(data)),
+    ]
+    for source in sources:
+        fit_stream = pf.feols_stream(fml, source, vcov=vcov, batch_size=300)
+        np.testing.assert_allclose(fit_stream.coef(), fit.coef(), rtol=1e-10)
+        np.testing.assert_allclose(fit_stream.se(), fit.se(), rtol=1e-6)
+
+    # one-shot iterators only support iid inference
+    fit = pf.feols(fml, data, vcov="iid")
+    fit_stream = pf.feols_stream(fml, iter(_chunks(data)), vcov="iid")
+    np.testing.assert_allclose(fit_stream.se(), fit.se(), rtol=1e-10)
+    with pytest.raises(ValueError, match="second"):
+        fit_stream.vcov("hetero")
+
+
+def test_feols_stream_post_estimation(data):
+    data["fweights"] = np.random.default_rng(123).integers(1, 4, data.shape[0])
+    fit = pf.feols(
+        "Y ~ X1 | f1", data, weights="fweights", weights_type="fweights", vcov="iid"
+    )
+    fit_stream = pf.feols_stream(
+        "Y ~ X1 | f1",
+        _chunks(data),
+        weights="fweights",
+        weights_type="fweights",
+        vcov="iid",
+    )
+    assert fit_stream._N == fit._N
+    np.testing.assert_allclose(fit_stream.se(), fit.se(), rtol=1e-8)
+
+    for vcov in ["hetero", {"CRV1": "group_id"}]:
+        fit_stream.vcov(vcov)
+        fit.vcov(vcov)
+        np.testing.assert_allclose(fit_stream.se(), fit.se(), rtol=1e-6)
+
+    fit_stream.tidy()
+    fit_stream.summary()
+    pf.etable([fit, fit_stream])
+
+    with pytest.raises(NotImplementedError):
+        fit_stream.predict()
+    with pytest.raises(NotImplementedError):
+        fit_stream.fixef()
+
+
+def test_feols_stream_errors(data):
+    chunks = _chunks(data)
+    with pytest.raises(NotImplementedError):
+        pf.feols_stream("Y + Y2 ~ X1 | f1", chunks)
+    with pytest.raises(NotImplementedError):
+        pf.feols_stream("Y ~ 1 | f1 | X1 ~ Z1", chunks)
+    with pytest.raises(VcovTypeNotSupportedError):
+        pf.feols_stream("Y ~ X1", chunks, vcov="HC3")
+    with pytest.raises(VcovTypeNotSupportedError):
+        pf.feols_stream("Y ~ X1", chunks, vcov={"CRV3": "f1"})
+    with pytest.raises(NotImplementedError):
+        pf.feols_stream("Y ~ X1 | f1", chunks, vcov={"CRV1": "f1+f2"})
+    with pytest.raises(ValueError, match="batch_size"):
+        pf.feols_stream("Y ~ X1", data, batch_size=0)
+    with pytest.raises(ValueError, match="covariates of the chunks differ"):
+        pf.feols_stream("Y ~ C(f1)", _chunks(data, 10))
@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyfixest as pf
+from pyfixest.estimation import FixedEffectsIndex
+from pyfixest.estimation.demean_ import _calc_group_weights
+from pyfixest.estimation.detect_singletons_ import detect_singletons
+
+
+@pytest.fixture
+def data():
+    return pf.get_data()
+
+
+def test_fixef_index_structure(data):
+    index = FixedEffectsIndex(data, "f1 + f2^f3")
+
+    assert index.names == ["f1", "f2_f3"]
+    assert index.codes.shape == (data.shape[0], 2)
+    assert index.codes.flags.f_contiguous
+
+    f1 = data["f1"].astype("category")
+    np.testing.assert_array_equal(index.codes[:, 0], f1.cat.codes)
+    np.testing.assert_array_equal(index.levels[0], f1.cat.categories)
+    assert index.n_groups[0] == f1.nunique()
+    np.testing.assert_array_equal(
+        index.has_missing, data[["f1", "f2", "f3"]].isna().any(axis=1)
+    )
+
+    # sorted group offsets and counts
+    for j in range(index.n_fixef):
+        codes = index.codes[:, j]
+        for g in range(index.n_groups[j]):
+            rows = index.order[index.offsets[j][g] : index.offsets[j][g + 1], j]
+            assert np.all(codes[rows] == g)
+            assert index.counts[j][g] == np.sum(codes == g)
+
+    # singletons are detected on complete rows
+    complete = ~index.has_missing
+    np.testing.assert_array_equal(
+        index.singletons[complete], detect_singletons(index.codes[complete])
+    )
+    assert not np.any(index.singletons[index.has_missing])
+
+    # subsets keep the levels
+    rows = np.flatnonzero(data["f3"] == 1)
+    sub = index.take(rows)
+    np.testing.assert_array_equal(sub.codes, index.codes[rows])
+    assert sub.n_groups.tolist() == index.n_groups.tolist()
+    compact = index.get_codes("f1", rows=rows, compact=True)
+    assert compact.max() + 1 == data["f1"].iloc[rows].nunique()
+
+    # group weights
+    index = FixedEffectsIndex(data.dropna(subset=["f1", "f2"]), ["f1", "f2"])
+    np.testing.assert_array_equal(
+        index.group_weights(),
+        _calc_group_weights(np.ones(index.n_obs), index.codes, index.n_groups.max()),
+    )
+
+
+@pytest.mark.parametrize(
+    "fml",
+    [
+        "Y ~ X1 | f1",
+        "Y ~ X1 + X2 | f2 + f1",
+        "Y ~ X1 | f1 + f2 + f3",
+        "Y ~ X1 | f1 + f2^f3",
+    ],
+)
+@pytest.mark.parametrize("vcov", ["hetero", {"CRV1": "f1"}, {"CRV1": "f1+f2"}])
+@pytest.mark.parametrize("fixef_rm", ["none", "singleton"])
+@pytest.mark.parametrize("dropna", [False, True])
+def test_feols_fixef_index(data, fml, vcov, fixef_rm, dropna):
+    if dropna:
+        # all rows complete: singletons and group weights from the index
+        data = data.dropna().reset_index(drop=True)
+    index = FixedEffectsIndex(data, "f1 + f2 + f3 + f2^f3")
+
+    fit = pf.feols(fml, data, vcov=vcov, fixef_rm=fixef_rm)
+    fit_index = pf.feols(fml, data, vcov=vcov, fixef_rm=fixef_rm, fixef_index=index)
+
+    np.testing.assert_allclose(fit.coef(), fit_index.coef(), rtol=1e-10)
+    np.testing.assert_allclose(fit.se(), fit_index.se(), rtol=1e-8)
+    assert fit._N == fit_index._N
+
+    if "^" not in fml:
+        fixef = fit.fixef()
+        fixef_index = fit_index.fixef()
+        assert fixef.keys() == fixef_index.keys()
+        for key in fixef:
+            assert fixef[key].keys() == fixef_index[key].keys()
+            np.testing.assert_allclose(
+                list(fixef[key].values()), list(fixef_index[key].values()), atol=1e-6
+            )
+        np.testing.assert_allclose(fit.predict(), fit_index.predict(), atol=1e-6)
+
+
+def test_fixef_index_multi_and_split(data):
+    index = FixedEffectsIndex(data, "f1 + f2")
+
+    fml = "Y + Y2 ~ X1 | csw0(f1, f2)"
+    fit = pf.feols(fml, data, fsplit="f3")
+    fit_index = pf.feols(fml, data, fsplit="f3", fixef_index=index)
+    pd.testing.assert_frame_equal(fit.tidy(), fit_index.tidy())
+
+    fit = pf.feols("Y ~ X1 | f1 + f2", data, vcov={"CRV3": "f1"})
+    fit_index = pf.feols(
+        "Y ~ X1 | f1 + f2", data, vcov={"CRV3": "f1"}, fixef_index=index
+    )
+    np.testing.assert_allclose(fit.se(), fit_index.se(), rtol=1e-8)
+
+    fit = pf.feols("Y ~ 1 | f1 + f2 | X1 ~ Z1", data)
+    fit_index = pf.feols("Y ~ 1 | f1 + f2 | X1 ~ Z1", data, fixef_index=index)
+    np.testing.assert_allclose(fit.coef(), fit_index.coef(), rtol=1e-10)
+    np.testing.assert_allclose(fit.se(), fit_index.se(), rtol=1e-8)
+
+    data["Y"] = np.abs(data["Y"]).round()
+    fit = pf.fepois("Y ~ X1 | f1 + f2", data)
+    fit_index = pf.fepois("Y ~ X1 | f1 + f2", data, fixef_index=index)
+    np.testing.assert_allclose(fit.coef(), fit_index.coef(), rtol=1e-10)
+    np.testing.assert_allclose(fit.se(), fit_index.se(), rtol=1e-8)
+
+
+def test_fixef_index_missing_in_other_fixef(data):
+    # f2 has a missing value, but the model only uses the complete f1
+    data = data.dropna().reset_index(drop=True)
+    data.loc[0, "f2"] = np.nan
+    index = FixedEffectsIndex(data, "f1 + f2")
+
+    np.testing.assert_array_equal(
+        index.group_weights(["f1"])[:, 0],
+        np.bincount(index.codes[:, 0], minlength=index.n_groups.max()),
+    )
+
+    fit = pf.feols("Y ~ X1 | f1", data)
+    fit_index = pf.feols("Y ~ X1 | f1", data, fixef_index=index)
+    assert fit_index._get_group_weights() is not None
+    np.testing.assert_allclose(fit.coef(), fit_index.coef(), rtol=1e-10)
+    np.testing.assert_allclose(fit.se(), fit_index.se(), rtol=1e-8)
+
+    with pytest.raises(ValueError, match="missing values"):
+        index.group_weights(["f2"])
+
+
+def test_fixef_index_errors(data):
+    index = FixedEffectsIndex(data, "f1")
+
+    with pytest.raises(ValueError, match="not part of the `fixef_index`"):
+        pf.feols("Y ~ X1 | f1 + f2", data, fixef_index=index)
+    with pytest.raises(ValueError, match="rows"):
+        pf.feols("Y ~ X1 | f1", data.iloc[1:], fixef_index=index)
+    with pytest.raises(TypeError):
+        pf.feols("Y ~ X1 | f1", data, fixef_index="f1")
+    with pytest.raises(KeyError):
+        FixedEffectsIndex(data, "f1 + g")
+    with pytest.raises(ValueError, match="missing values"):
+        index.group_weights()
@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -5,8 +7,14 @@ import rpy2.robjects as ro
 from rpy2.robjects import pandas2ri
 from rpy2.robjects.packages import importr
 
+from pyfixest.estimation import wildboottest_
 from pyfixest.estimation.estimation import feols
-from pyfixest.estimation.multcomp import _get_rwolf_pval, bonferroni, rwolf
+from pyfixest.estimation.multcomp import (
+    _get_rwolf_pval,
+    _rwolf_wildboottest,
+    bonferroni,
+    rwolf,
+)
 from pyfixest.utils.set_rpy2_path import update_r_paths
 from pyfixest.utils.utils import get_data
 
@@ -195,3 +203,60 @@ def test_sampling_scheme(seed, reps):
     assert (
         np.abs(percent_diff) < 1.0
     ), f"Percentage difference is too large: {percent_diff}%"
+
+
+@pytest.mark.parametrize("vcov", ["hetero", {"CRV1": "f1"}, {"CRV1": "f1+f2"}])
+def test_rwolf_batched_vs_serial(vcov):
+    "Batched wild bootstrap of rwolf() equals one wildboottest() per model."
+    data = get_data(N=1_000, seed=12).dropna()
+    rng = np.random.default_rng(12)
+    data["Y3"] = data["Y"] + rng.normal(size=len(data))
+
+    fit = feols("Y + Y2 + Y3 ~ X1 | f3", data=data, vcov=vcov)
+    models = fit.to_list()
+
+    t_stats, t_boot = _rwolf_wildboottest(
+        models, param="X1", reps=999, seed=5, n_jobs=2
+    )
+
+    for i, model in enumerate(models):
+        res, t_boot_i = model.wildboottest(
+            param="X1", reps=999, seed=5, return_bootstrapped_t_stats=True
+        )
+        np.testing.assert_allclose(t_stats[i], res["t value"])
+        np.testing.assert_allclose(t_boot[:, i], t_boot_i)
+
+    np.testing.assert_allclose(
+        rwolf(models, "X1", reps=999, seed=5).loc["RW Pr(>|t|)"].values,
+        _get_rwolf_pval(t_stats, t_boot),
+    )
+
+
+def test_rwolf_n_jobs_workqueue(monkeypatch):
+    # numba's workqueue threading layer is not threadsafe: bootstrap serially
+    monkeypatch.setattr(wildboottest_, "_numba_threads_are_safe", lambda: False)
+    data = get_data(N=1_000, seed=12).dropna()
+    models = feols("Y + Y2 ~ X1 | f3", data=data, vcov={"CRV1": "f1"}).to_list()
+
+    rwolf_serial = rwolf(models, "X1", reps=999, seed=5)
+    with pytest.warns(UserWarning, match="workqueue threading layer"):
+        rwolf_threads = rwolf(models, "X1", reps=999, seed=5, n_jobs=2)
+    pd.testing.assert_frame_equal(rwolf_serial, rwolf_threads)
+
+
+def test_rwolf_full_enumeration_warning():
+    data = get_data(N=1_000, seed=12).dropna()
+    rng = np.random.default_rng(12)
+    data["c1"] = rng.integers(0, 5, len(data))
+    data["c2"] = rng.integers(0, 5, len(data))
+
+    # the weights are drawn at the 5 clusters of c1: 2^5 < reps
+    models = feols("Y + Y2 ~ X1", data=data, vcov={"CRV1": "c1"}).to_list()
+    with pytest.warns(UserWarning, match="reps = 32"):
+        rwolf(models, "X1", reps=999, seed=5)
+
+    # the weights are drawn at the 25 intersections of c1 and c2: no enumeration
+    models = feols("Y + Y2 ~ X1", data=data, vcov={"CRV1": "c1+c2"}).to_list()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        rwolf(models, "X1", reps=999, seed=5)
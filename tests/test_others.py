@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 import polars as pl
+import pytest
 
 from pyfixest.estimation.estimation import feols, fepois
 from pyfixest.report.utils import rename_categoricals, rename_event_study_coefs
@@ -31,6 +32,73 @@ def test_polars_input():
     fit = fepois("Y ~ X1", data=data_pl)
 
 
+def test_lazy_polars_and_arrow_input():
+    pa = pytest.importorskip("pyarrow")
+
+    data = get_data()
+    data["unused"] = np.arange(data.shape[0])
+    fml = "Y + Y2 ~ X1 + i(f3) | csw0(f1, f2)"
+    kwargs = {"vcov": {"CRV1": "group_id"}, "weights": "weights", "fsplit": "f3"}
+    fit = feols(fml, data=data, **kwargs)
+
+    for data_input in [
+        pl.from_pandas(data),
+        pl.from_pandas(data).lazy(),
+        pa.Table.from_pandas(data),
+    ]:
+        fit_input = feols(fml, data=data_input, **kwargs)
+        pd.testing.assert_frame_equal(fit.tidy(), fit_input.tidy())
+        # only the columns used by the models are converted to pandas
+        assert set(fit_input._data.columns) == {
+            "Y",
+            "Y2",
+            "X1",
+            "f1",
+            "f2",
+            "f3",
+            "group_id",
+            "weights",
+        }
+
+    data_pl = pl.from_pandas(get_data(model="Fepois")).lazy()
+    fit = fepois("Y ~ X1 | f1", data=data_pl.filter(pl.col("f2") > 5))
+    assert fit._data.shape[1] == 3
+
+    # cluster variables outside the model require passing the data
+    data = data.dropna().reset_index(drop=True)
+    fit_input = feols("Y ~ X1 | f1", data=pl.from_pandas(data))
+    with pytest.raises(ValueError, match="pass the data via the `data` argument"):
+        fit_input.vcov({"CRV1": "f2"})
+    fit_input.vcov({"CRV1": "f2"}, data=pl.from_pandas(data))
+    fit = feols("Y ~ X1 | f1", data=data, vcov={"CRV1": "f2"})
+    np.testing.assert_allclose(fit.se(), fit_input.se())
+
+
+def test_shared_data():
+    data = get_data().dropna().reset_index(drop=True)
+    data["split"] = np.arange(data.shape[0]) % 2
+    data_orig = data.copy()
+    fml = "Y ~ X1 | csw0(f1, f2^f3)"
+
+    fit = feols(fml, data=data, split="split", vcov={"CRV1": "group_id"})
+    # the input data is not modified, e.g. by interacted fixed effects
+    pd.testing.assert_frame_equal(data, data_orig)
+    # models on the same sample without missing values share one data frame
+    fits = fit.to_list()
+    for i in range(0, len(fits), 3):
+        assert all(x._data is fits[i]._data for x in fits[i : i + 3])
+    assert "f2_f3" in fits[2]._data.columns
+
+    # without stored data, only the columns used by the models are kept
+    fit = feols(fml, data=data, store_data=False, vcov={"CRV1": "group_id"})
+    assert set(fit._data.columns) == {"Y", "X1", "f1", "f2", "f3", "group_id", "f2_f3"}
+
+    data = get_data(model="Fepois")
+    data_orig = data.copy()
+    fepois("Y ~ X1 | csw0(f1, f2^f3)", data=data, copy_data=False)
+    pd.testing.assert_frame_equal(data, data_orig)
+
+
 def test_integer_XY():
     # Create a random number generator
     rng = np.random.default_rng()
@@ -9,9 +9,12 @@ from rpy2.robjects import pandas2ri
 
 # rpy2 imports
 from rpy2.robjects.packages import importr
+from scipy.optimize import minimize
 
 import pyfixest as pf
+from pyfixest.errors import NonConvergenceError
 from pyfixest.estimation.estimation import fepois
+from pyfixest.estimation.fepois_ import _separation_fe_mask, _separation_relu
 from pyfixest.utils.set_rpy2_path import update_r_paths
 
 update_r_paths()
@@ -134,3 +137,87 @@ def test_against_fixest(fml):
     np.testing.assert_allclose(
         fit_r.rx2("deviance"), fit.deviance, atol=1e-08, rtol=1e-07
     )
+
+
+@pytest.mark.parametrize("fixef_tol", [1e-06, 1e-10])
+def test_fixef_vs_dummies(fixef_tol):
+    "Warm-started demeaning with a tolerance schedule matches dummy estimation."
+    data = pf.get_data(model="Fepois").dropna()
+
+    fit_fe = fepois("Y ~ X1 + X2 | f1 + f2", data=data, fixef_tol=fixef_tol)
+    fit_dummies = fepois("Y ~ X1 + X2 + C(f1) + C(f2)", data=data)
+
+    np.testing.assert_allclose(
+        fit_fe.coef().values,
+        fit_dummies.coef()[["X1", "X2"]].values,
+        rtol=1e-06,
+    )
+    np.testing.assert_allclose(fit_fe.deviance, fit_dummies.deviance, rtol=1e-08)
+
+
+def test_irls_trace():
+    "The IRLS iterations are recorded, and non-convergence raises an error."
+    data = pf.get_data(model="Fepois")
+
+    fit = fepois("Y ~ X1 + X2 | f1 + f2", data=data)
+    trace = fit.irls_trace
+
+    assert fit.convergence
+    assert list(trace.columns) == [
+        "deviance",
+        "crit",
+        "step_halvings",
+        "demean_tol",
+        "demean_iterations",
+        "time",
+    ]
+    assert trace["crit"].iloc[-1] < 1e-08
+    assert trace["demean_tol"].iloc[-1] == 1e-08
+    np.testing.assert_allclose(trace["deviance"].iloc[-1], fit.deviance)
+
+    with pytest.raises(NonConvergenceError, match="did not converge in 2 iterations"):
+        fepois("Y ~ X1 + X2 | f1 + f2", data=data, iwls_maxiter=2)
+
+
+def test_step_halving():
+    "A full Newton step overshoots for an outlier in X, the step is halved."
+    rng = np.random.default_rng(2)
+    x = rng.standard_cauchy(50)
+    data = pd.DataFrame({"x": x, "Y": rng.poisson(np.exp(np.clip(0.5 * x, -5, 5)))})
+
+    fit = fepois("Y ~ x", data=data)
+    assert fit.irls_trace["step_halvings"].sum() > 0
+
+    X = np.column_stack([np.ones(50), x])
+    Y = data["Y"].to_numpy()
+    res = minimize(
+        lambda beta: np.sum(np.exp(X @ beta) - Y * (X @ beta)),
+        np.zeros(2),
+        method="BFGS",
+        options={"gtol": 1e-10},
+    )
+    np.testing.assert_allclose(fit.coef().values, res.x, rtol=1e-06)
+
+
+def test_separation_fe_mask():
+    "Levels with only zero outcomes in any fixed effect are separated."
+    is_positive = np.array([False, False, True, False, True, False])
+    ids = np.array([[0, 0], [0, 1], [1, 1], [1, 2], [2, 2], [3, 0]])
+
+    np.testing.assert_array_equal(
+        _separation_fe_mask(is_positive, np.asfortranarray(ids)),
+        np.array([True, True, False, False, False, True]),
+    )
+
+
+@pytest.mark.parametrize("accelerate", [True, False])
+def test_separation_relu(accelerate):
+    "Example 2 of ppmlhdfe's separation primer, with a single fixed effect."
+    X = np.array([[2, 5], [-1, 10], [0, 0], [0, 0], [5, -10], [6, -12]], dtype=float)
+    Y = np.array([0, 0, 0, 1, 2, 3])
+    fe = np.zeros((6, 1), dtype=np.uint32, order="F")
+
+    np.testing.assert_array_equal(
+        _separation_relu(Y > 0, X, fe, accelerate=accelerate),
+        np.array([True, True, False, False, False, False]),
+    )
@@ -1,7 +1,9 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 from pyfixest.estimation.estimation import feols, fepois
+from pyfixest.estimation.vcov_utils import _crv1_meat_loop
 from pyfixest.utils.utils import get_data, ssc
 
 
@@ -218,3 +220,236 @@ def run_crv3_poisson():
         vcov={"CRV3": "f1"},
         ssc=ssc(adj=False, cluster_adj=False),
     )
+
+
+@pytest.mark.parametrize(
+    "fml",
+    [
+        # fixed effects nested in clusters
+        "Y ~ X1 + X2 | f1",
+        "Y ~ X1 | f1^f2",
+        # not nested
+        "Y ~ X1 + X2 | f2",
+        "Y ~ X1 | f1 + f3",
+    ],
+)
+@pytest.mark.parametrize("weights", [None, "weights"])
+def test_CRV3_fixef_vs_refit(fml, weights):
+    data = get_data().dropna()
+    fit = feols(fml=fml, data=data, vcov={"CRV3": "f1"}, weights=weights)
+
+    # leave-one-cluster-out re-estimation
+    cluster_col, _ = pd.factorize(fit._data["f1"])
+    vcov_refit = fit._ssc[0] * fit._vcov_crv3_slow(
+        clustid=np.unique(cluster_col), cluster_col=cluster_col
+    )
+    np.testing.assert_allclose(fit._vcov, vcov_refit, rtol=1e-6, atol=1e-12)
+
+
+@pytest.mark.parametrize("n_clusters", [5, 80, 400])
+def test_crv3_jackknife_loop(n_clusters):
+    # few large clusters use the direct update, many small clusters the
+    # Woodbury update; C(f3) is not identified without some clusters
+    data = get_data().dropna()
+    data["cluster"] = np.arange(data.shape[0]) % n_clusters
+    fit = feols("Y ~ X1 * X2 + C(f3)", data=data, vcov={"CRV3": "cluster"})
+
+    X, Y = fit._X, fit._Y
+    cluster_col = data["cluster"].to_numpy()
+    tXX, tXy = X.T @ X, X.T @ Y
+    beta_jack = np.array(
+        [
+            np.linalg.pinv(tXX - X[cluster_col == g].T @ X[cluster_col == g])
+            @ (tXy - X[cluster_col == g].T @ Y[cluster_col == g])
+            for g in range(n_clusters)
+        ]
+    ).reshape(n_clusters, -1)
+    beta_centered = beta_jack - fit._beta_hat
+    vcov = fit._ssc[0] * beta_centered.T @ beta_centered
+
+    np.testing.assert_allclose(fit._vcov, vcov, rtol=1e-8, atol=1e-14)
+
+
+@pytest.mark.parametrize("vcov_type", ["CRV1", "CRV3"])
+def test_multiway_clustering(vcov_type):
+    # inclusion-exclusion over one-way clustered vcovs by the intersections
+    data = get_data().dropna()
+    data["f4"] = data["f1"] + 2 * data["f2"] > 30
+    _ssc = ssc(adj=False, cluster_adj=False, cluster_df="conventional")
+    fit = feols("Y ~ X1 + X2", data=data, vcov={vcov_type: "f1 + f2 + f4"}, ssc=_ssc)
+
+    clusters = [["f1"], ["f2"], ["f4"], ["f1", "f2"], ["f1", "f4"], ["f2", "f4"]]
+    clusters += [["f1", "f2", "f4"]]
+    vcov = np.zeros_like(fit._vcov)
+    G = []
+    for cluster in clusters:
+        name = "_".join(cluster)
+        data[name] = data[cluster].astype(str).agg("-".join, axis=1)
+        fit_oneway = feols("Y ~ X1 + X2", data=data, vcov={vcov_type: name}, ssc=_ssc)
+        vcov += (-1) ** (len(cluster) + 1) * fit_oneway._vcov
+        G += fit_oneway._G
+
+    np.testing.assert_allclose(fit._vcov, vcov, rtol=1e-10)
+    assert fit._G == G
+    np.testing.assert_array_equal(fit._ssc, [1, 1, 1, -1, -1, -1, 1])
+
+    fit = feols("Y ~ X1 + X2", data=data, vcov={vcov_type: "f1 + f2 + f4"})
+    assert fit._G == [2] * 7
+
+
+@pytest.mark.parametrize("fml", ["Y ~ X1 * X2 + C(f3)", "Y ~ 1 | f2 | X1 ~ Z1"])
+def test_crv1_meat_loop(fml):
+    # the meat equals the sum of the outer products of the cluster scores
+    data = get_data().dropna()
+    fit = feols(fml, data=data, vcov={"CRV1": "f1"})
+
+    cluster_col, _ = pd.factorize(fit._data["f1"])
+    scores = fit._Z * fit._u_hat.reshape(-1, 1)
+    meat = np.zeros((fit._Z.shape[1], fit._Z.shape[1]))
+    for g in np.unique(cluster_col):
+        score_g = scores[cluster_col == g].sum(axis=0)
+        meat += np.outer(score_g, score_g)
+
+    np.testing.assert_allclose(
+        _crv1_meat_loop(
+            _Z=fit._Z,
+            weighted_uhat=fit._u_hat.reshape(-1, 1),
+            clustid=np.unique(cluster_col),
+            cluster_col=cluster_col,
+        ),
+        meat,
+        rtol=1e-10,
+    )
+
+
+@pytest.mark.parametrize("vcov", ["hetero", "HC2", "HC3"])
+@pytest.mark.parametrize("fml", ["Y ~ X1 * X2 + C(f3)", "Y ~ 1 | f2 | X1 ~ Z1"])
+def test_vcov_hetero_vs_scores(vcov, fml):
+    # the meat is computed without forming the scores
+    data = get_data().dropna()
+    if vcov != "hetero" and "~ Z1" in fml:
+        pytest.skip("HC2 and HC3 are not supported with fixed effects.")
+    fit = feols(fml, data=data, vcov=vcov)
+
+    leverage = np.sum(fit._X * (fit._X @ np.linalg.inv(fit._tZX)), axis=1)
+    power = {"hetero": 0, "HC2": 0.5, "HC3": 1}[vcov]
+    scores = fit._scores / (1 - leverage[:, None]) ** power
+    meat = scores.T @ scores
+    if fit._is_iv:
+        meat = fit._tXZ @ fit._tZZinv @ meat @ fit._tZZinv @ fit._tZX
+
+    np.testing.assert_allclose(
+        fit._vcov, fit._ssc * fit._bread @ meat @ fit._bread, rtol=1e-10, atol=1e-14
+    )
+
+
+def _hac_meat_pairwise(scores, kernel):
+    # O(N^2) reference: sum_ij kernel[i, j] * s_i s_j'
+    return scores.T @ kernel @ scores
+
+
+@pytest.mark.parametrize("fml", ["Y ~ X1 + X2", "Y ~ X1 | f1", "Y ~ 1 | X1 ~ Z1"])
+@pytest.mark.parametrize("lag", [0, 2])
+def test_hac_vs_pairwise(fml, lag):
+    data = get_data().dropna()
+    rng = np.random.default_rng(123)
+    data["unit"] = np.arange(data.shape[0]) // 10
+    data["time"] = 2000 + np.arange(data.shape[0]) % 10
+    data["lat"] = rng.uniform(45, 50, data.shape[0])
+    data["lon"] = rng.uniform(5, 10, data.shape[0])
+    data = data.sample(frac=1, random_state=1)
+
+    vcovs = {
+        "NW": {"NW": "unit + time", "lag": lag},
+        "DK": {"DK": "time", "lag": lag},
+        "conley": {"conley": "lat + lon", "cutoff": 50},
+    }
+    for vcov_type, vcov in vcovs.items():
+        fit = feols(fml, data=data, vcov=vcov)
+        unit = fit._data["unit"].to_numpy()
+        time = fit._data["time"].to_numpy()
+        lag_dist = np.abs(time[:, None] - time[None, :])
+        bartlett = np.where(lag_dist <= lag, 1 - lag_dist / (lag + 1), 0)
+        if vcov_type == "NW":
+            kernel = bartlett * (unit[:, None] == unit[None, :])
+        elif vcov_type == "DK":
+            kernel = bartlett
+        else:
+            lat = np.deg2rad(fit._data["lat"].to_numpy())
+            lon = np.deg2rad(fit._data["lon"].to_numpy())
+            hav = (
+                np.sin((lat[:, None] - lat[None, :]) / 2) ** 2
+                + np.cos(lat[:, None])
+                * np.cos(lat[None, :])
+                * np.sin((lon[:, None] - lon[None, :]) / 2) ** 2
+            )
+            dist = 2 * 6371.0088 * np.arcsin(np.sqrt(hav))
+            kernel = (dist <= 50).astype(float)
+
+        meat = _hac_meat_pairwise(fit._scores, kernel)
+        if fit._is_iv:
+            meat = fit._tXZ @ fit._tZZinv @ meat @ fit._tZZinv @ fit._tZX
+
+        np.testing.assert_allclose(
+            fit._vcov, fit._ssc * fit._bread @ meat @ fit._bread, rtol=1e-8
+        )
+
+
+@pytest.mark.parametrize("vcov_type", ["NW", "DK"])
+def test_hac_time_gaps(vcov_type):
+    data = get_data().dropna()
+    data["unit"] = np.arange(data.shape[0]) // 10
+    data["time"] = np.arange(data.shape[0]) % 10
+    # no observations in period 5: periods 4 and 6 are two periods apart
+    data = data[data["time"] != 5]
+    data_renumbered = data.assign(time=data["time"] - (data["time"] > 5))
+
+    hacvar = "unit + time" if vcov_type == "NW" else "time"
+    vcov = {vcov_type: hacvar, "lag": 1}
+    fit = feols("Y ~ X1 + X2", data=data, vcov=vcov)
+    fit_renumbered = feols("Y ~ X1 + X2", data=data_renumbered, vcov=vcov)
+    assert not np.allclose(fit.se(), fit_renumbered.se())
+
+    unit = fit._data["unit"].to_numpy()
+    time = fit._data["time"].to_numpy()
+    kernel = (np.abs(time[:, None] - time[None, :]) == 0) + 0.5 * (
+        np.abs(time[:, None] - time[None, :]) == 1
+    )
+    if vcov_type == "NW":
+        kernel = kernel * (unit[:, None] == unit[None, :])
+    meat = _hac_meat_pairwise(fit._scores, kernel)
+    np.testing.assert_allclose(
+        fit._vcov, fit._ssc * fit._bread @ meat @ fit._bread, rtol=1e-8
+    )
+
+
+def test_vcov_many():
+    data = get_data().dropna()
+    fit = feols("Y ~ X1 + X2 | f1", data=data, vcov="hetero")
+    se = fit._se.copy()
+
+    vcovs = ["iid", "HC1", {"CRV1": "f1"}, {"CRV1": "f1 + f2"}, {"CRV3": "f2"}]
+    res = fit.vcov_many(vcovs)
+
+    assert list(res) == ["iid", "HC1", "CRV1: f1", "CRV1: f1+f2", "CRV3: f2"]
+    for vcov, label in zip(vcovs, res):
+        fit_single = feols("Y ~ X1 + X2 | f1", data=data, vcov=vcov)
+        np.testing.assert_allclose(res[label], fit_single._vcov, rtol=1e-10)
+
+    # the inference of the model is unchanged
+    assert fit._vcov_type_detail == "hetero"
+    np.testing.assert_array_equal(fit._se, se)
+
+
+@pytest.mark.parametrize("vcov", ["HC2", "HC3"])
+@pytest.mark.parametrize("weights", [None, "weights"])
+def test_hc23_fixef_vs_dummies(vcov, weights):
+    # the leverage includes the fixed effects projection
+    data = get_data().dropna()
+    _ssc = ssc(adj=False, cluster_adj=False)
+    fit = feols("Y ~ X1 + X2 | f2", data=data, vcov=vcov, weights=weights, ssc=_ssc)
+    fit_dummies = feols(
+        "Y ~ X1 + X2 + C(f2)", data=data, vcov=vcov, weights=weights, ssc=_ssc
+    )
+
+    np.testing.assert_allclose(fit._se, fit_dummies._se[1:3], rtol=1e-8)
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 import pyfixest as pf
@@ -33,3 +34,49 @@ def test_crv1_equivalence(data, fml):
     )["t value"]
 
     np.testing.assert_allclose(tstat, boot_tstat)
+
+
+@pytest.mark.parametrize("fml", ["Y~X1", "Y~X1|f1", "Y~X1|f1+f2"])
+@pytest.mark.parametrize("weights", [None, "weights"])
+@pytest.mark.parametrize("cluster", ["f1", "f1+f2"])
+def test_crv1_equivalence_weights_multiway(data, fml, weights, cluster):
+    data = data.dropna()
+    fit = pf.feols(
+        fml,
+        data=data,
+        weights=weights,
+        vcov={"CRV1": cluster},
+        ssc=ssc(cluster_df="conventional"),
+    )
+    tstat = fit.tstat().xs("X1")
+    boot = fit.wildboottest(param="X1", reps=999, seed=2)
+
+    np.testing.assert_allclose(tstat, boot["t value"])
+    assert boot["inference"] == f"CRV({cluster.replace(' ', '')})"
+    assert 0 <= boot["Pr(>|t|)"] <= 1
+
+
+def test_wildboottest_vs_refits():
+    "Compare the native WCR11 against refits on bootstrapped dependent variables."
+    data = pf.get_data(N=300, seed=3).dropna()
+    # f2 is not nested in the clusters, so the bootstrap errors are demeaned
+    g, clusters = pd.factorize(data["f3"])
+    G = len(clusters)
+    fit = pf.feols("Y ~ X1 + X2 | f2", data=data, vcov={"CRV1": "f3"})
+
+    with pytest.warns(UserWarning):
+        _, t_boot = fit.wildboottest(
+            param="X1", reps=999, return_bootstrapped_t_stats=True
+        )
+    assert len(t_boot) == 2**G
+
+    # restricted fit under H0: X1 = 0
+    fit_r = pf.feols("Y ~ X2 | f2", data=data)
+    y_hat = data["Y"].to_numpy() - fit_r.resid()
+    u_tilde = fit_r.resid()
+
+    for b in [0, 5, 17, 30]:
+        v = 1.0 - 2.0 * ((b >> np.arange(G)) & 1)
+        data["Y_boot"] = y_hat + u_tilde * v[g]
+        fit_b = pf.feols("Y_boot ~ X1 + X2 | f2", data=data, vcov={"CRV1": "f3"})
+        np.testing.assert_allclose(t_boot[b], fit_b.tstat().xs("X1"))